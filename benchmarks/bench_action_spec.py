@@ -0,0 +1,68 @@
+"""
+Builds menu-sized sets of actions from specs with build_actions and with the equivalent fluent Action chains.
+
+Run from the repository root: ``PYTHONPATH=src python benchmarks/bench_action_spec.py``
+"""
+import os
+import tempfile
+import time
+
+from PySide6.QtGui import QIcon, QImage
+from PySide6.QtWidgets import QApplication, QWidget
+
+from eui.facade.gui.action import Action
+from eui.facade.gui.action_spec import ActionSpec, build_actions
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+application = QApplication([])
+
+icon_directory = tempfile.TemporaryDirectory()
+icon_paths: list[str] = []
+for icon_index in range(20):
+    icon_path: str = os.path.join(icon_directory.name, f'icon{icon_index}.png')
+    image = QImage(32, 32, QImage.Format.Format_ARGB32)
+    image.fill(0xff000000 + icon_index * 0x0a0a0a)
+    image.save(icon_path)
+    icon_paths.append(icon_path)
+
+count: int = 10_000
+benchmark_specs: list[ActionSpec] = [
+    ActionSpec(
+        text=f'Command {index}',
+        icon=icon_paths[index % len(icon_paths)],
+        shortcut=f'Ctrl+Shift+F{index % 12 + 1}' if index % 10 == 0 else '',
+        tooltip=f'Runs command {index}',
+        status_tip=f'Runs command {index}' if index % 2 == 0 else '',
+        checkable=index % 5 == 0,
+        data=index
+    )
+    for index in range(count)
+]
+
+
+def fluent(parent: QWidget) -> list[Action]:
+    """
+    The same work as :func:`build_actions`, through the fluent setters: shared icons, and only the non-default properties set.
+    """
+    icons: dict[str, QIcon] = {}
+    actions: list[Action] = []
+    for spec in benchmark_specs:
+        icon: QIcon | None = icons.get(spec.icon)
+        if icon is None:
+            icon = icons[spec.icon] = QIcon(spec.icon)
+        action = Action(parent).set_text(spec.text).set_icon(icon).set_tooltip(spec.tooltip).set_data(spec.data)
+        if spec.shortcut:
+            action.set_shortcut(spec.shortcut)
+        if spec.status_tip:
+            action.set_status_bar_tip(spec.status_tip)
+        if spec.checkable:
+            action.set_checkable()
+        actions.append(action)
+    return actions
+
+
+for label, build in (('fluent chain', fluent), ('build_actions', lambda parent: build_actions(benchmark_specs, parent))):
+    owner = QWidget()
+    start: float = time.perf_counter()
+    built: list[Action] = build(owner)
+    print(f'{label:14} {(time.perf_counter() - start) * 1000:8.1f} ms for {len(built)} actions')
@@ -0,0 +1,84 @@
+"""
+Shows, repaints, sorts and filters a large ColumnarTableModel, then compares its memory per cell with a QStandardItemModel.
+
+Run from the repository root: ``PYTHONPATH=src python benchmarks/bench_columnar_table_model.py``
+"""
+import os
+import resource
+import sys
+import time
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtWidgets import QApplication, QHeaderView, QTableView
+import numpy as np
+
+from eui.facade.models.columnar_table_model import ColumnarTableModel
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+application = QApplication([])
+
+
+def resident_mb() -> float:
+    with open('/proc/self/statm') as statm:
+        return int(statm.read().split()[1]) * resource.getpagesize() / (1 << 20)
+
+
+def timed_argsort(values: np.ndarray) -> float:
+    start_sort: float = time.perf_counter()
+    np.argsort(values, kind='stable')
+    return (time.perf_counter() - start_sort) * 1000
+
+
+row_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000_000
+column_count: int = 20
+generator: np.random.Generator = np.random.default_rng(7)
+before_mb: float = resident_mb()
+benchmark_columns: dict[str, np.ndarray] = {
+    f'{"value" if number % 2 else "count"} {number}':
+        generator.random(row_count, np.float32) * 1000 if number % 2 else generator.integers(0, 10_000, row_count, np.int32)
+    for number in range(column_count)
+}
+columns_mb: float = resident_mb() - before_mb
+print(f'{row_count} rows x {column_count} columns: {columns_mb:.0f} MB of column data')
+
+model = ColumnarTableModel()
+start: float = time.perf_counter()
+model.set_columns(benchmark_columns)
+view = QTableView()
+view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+view.setModel(model)
+view.resize(1600, 900)
+view.show()
+application.processEvents()
+print(f'model set and first paint: {(time.perf_counter() - start) * 1000:.0f} ms, '
+      f'{resident_mb() - before_mb - columns_mb:.0f} MB on top of the columns')
+
+model.refresh()
+for label in ('cold cache', 'warm cache'):
+    start = time.perf_counter()
+    view.viewport().repaint()
+    print(f'repaint, {label}: {(time.perf_counter() - start) * 1000:.1f} ms')
+
+start = time.perf_counter()
+model.sort(1, Qt.SortOrder.DescendingOrder)
+print(f'sort by a float column: {(time.perf_counter() - start) * 1000:.0f} ms '
+      f'(stable argsort of NumPy alone: {timed_argsort(benchmark_columns["value 1"]):.0f} ms)')
+start = time.perf_counter()
+model.set_filter(lambda columns: (columns['count 0'] < 5000) & (columns['value 3'] > 500))
+print(f'filter ({model.rowCount()} rows kept) and sort again: {(time.perf_counter() - start) * 1000:.0f} ms, '
+      f'model overhead {model.memory_bytes / (1 << 20):.0f} MB')
+
+standard_row_count: int = 20_000
+before_mb = resident_mb()
+start = time.perf_counter()
+standard_model = QStandardItemModel(standard_row_count, column_count)
+for row in range(standard_row_count):
+    for column in range(column_count):
+        standard_model.setItem(row, column, QStandardItem(str(benchmark_columns[model.column_names[column]][row])))
+elapsed: float = time.perf_counter() - start
+per_cell_bytes: float = (resident_mb() - before_mb) * (1 << 20) / (standard_row_count * column_count)
+print(f'QStandardItemModel: {per_cell_bytes:.0f} bytes and {elapsed / (standard_row_count * column_count) * 1e6:.1f} us per cell, '
+      f'i.e. {per_cell_bytes * row_count * column_count / (1 << 30):.0f} GB and '
+      f'{elapsed * row_count / standard_row_count:.0f} s for the same table')
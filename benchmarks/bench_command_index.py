@@ -0,0 +1,39 @@
+"""
+Indexes 10k actions in a CommandIndex, then times fuzzy searches from single letters to typos.
+
+Run from the repository root: ``PYTHONPATH=src python benchmarks/bench_command_index.py``
+"""
+import os
+import random
+import time
+
+from PySide6.QtWidgets import QApplication
+
+from eui.facade.gui.action import Action
+from eui.facade.gui.command_index import CommandIndex, CommandMatch
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+application = QApplication([])
+
+verbs: list[str] = ['Open', 'Close', 'Save', 'Export', 'Import', 'Toggle', 'Show', 'Hide', 'Rename', 'Delete', 'Duplicate', 'Find']
+nouns: list[str] = ['File', 'Folder', 'Window', 'Panel', 'Layer', 'Selection', 'Bookmark', 'Terminal', 'Breakpoint', 'Project']
+qualifiers: list[str] = ['All', 'Recent', 'Next', 'Previous', 'Current', 'Other', 'Selected', 'Hidden', 'Remote', 'Local']
+random.seed(0)
+
+command_index = CommandIndex()
+start: float = time.perf_counter()
+for action_index in range(10_000):
+    benchmark_action = Action()
+    benchmark_action.set_text(f'{random.choice(verbs)} {random.choice(qualifiers)} {random.choice(nouns)} {action_index}')
+    benchmark_action.set_tooltip(f'{random.choice(verbs)} the {random.choice(nouns).lower()}')
+    command_index.add(f'command.{action_index}', benchmark_action)
+print(f'indexed {len(command_index)} actions in {(time.perf_counter() - start) * 1000:.1f} ms')
+
+for benchmark_query in ['o', 'op', 'ope', 'open', 'open file', 'file open', 'opn fiel', 'toggle panel', 'rec bookm', 'xyz', 'save 42']:
+    repeats: int = 200
+    start = time.perf_counter()
+    for _ in range(repeats):
+        results: list[CommandMatch] = command_index.search(benchmark_query, k=20)
+    elapsed_ms: float = (time.perf_counter() - start) * 1000 / repeats
+    best: str = results[0].action.get.text() if results else '-'
+    print(f'{benchmark_query!r:14} {elapsed_ms:6.3f} ms  {len(results):2} results, best: {best}')
@@ -0,0 +1,34 @@
+"""
+Decimates a 10M-point series with decimate_min_max, decimate_lttb and a DecimationPyramid while zooming and panning.
+
+Run from the repository root: ``PYTHONPATH=src python benchmarks/bench_decimation.py``
+"""
+import time
+
+import numpy as np
+
+from eui.facade.graphics.decimation import DecimationPyramid, decimate_lttb, decimate_min_max
+
+point_count: int = 10_000_000
+xs = np.arange(point_count, dtype=np.float64)
+ys = np.cumsum(np.random.default_rng(0).standard_normal(point_count))
+
+start = time.perf_counter()
+decimate_min_max(xs, ys, 0, point_count, 2000)
+print(f'min/max, full range:              {(time.perf_counter() - start) * 1000:8.2f} ms')
+
+start = time.perf_counter()
+decimate_lttb(xs, ys, 2000)
+print(f'LTTB, full range:                 {(time.perf_counter() - start) * 1000:8.2f} ms')
+
+pyramid = DecimationPyramid(xs, ys)
+start = time.perf_counter()
+pyramid.decimate(0, point_count, 2000)
+print(f'pyramid, full range (first call): {(time.perf_counter() - start) * 1000:8.2f} ms')
+
+for zoom in (1, 10, 100, 1000):
+    view = point_count / zoom
+    start = time.perf_counter()
+    for step in range(10):
+        pyramid.decimate(step * view / 20, step * view / 20 + view, 2000)
+    print(f'pyramid, 1/{zoom:<4} range, panning:   {(time.perf_counter() - start) * 100:8.2f} ms')
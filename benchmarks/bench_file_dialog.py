@@ -0,0 +1,68 @@
+"""
+Opens a directory of 100k files in FileDialog, measuring the first rows, the full listing and the longest GUI thread stall.
+
+Run from the repository root: ``PYTHONPATH=src python benchmarks/bench_file_dialog.py``
+"""
+import os
+import tempfile
+import time
+
+from PySide6.QtCore import QTimer
+from PySide6.QtWidgets import QApplication
+
+from eui.facade.widgets.file_dialog import FileDialog, FileEntry, _scan_entry
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+application = QApplication([])
+
+entry_count: int = 100_000
+benchmark_directory = tempfile.TemporaryDirectory()
+for file_index in range(entry_count):
+    open(os.path.join(benchmark_directory.name, f'file_{file_index * 7919 % entry_count:06}.dat'), 'wb').close()
+print(f'{entry_count} files created')
+
+start: float = time.perf_counter()
+blocking: list[FileEntry] = [_scan_entry(entry) for entry in os.scandir(benchmark_directory.name)]
+blocking.sort(key=lambda entry: (not entry.is_dir, entry.name.casefold()))
+print(f'blocking listing and sort: {(time.perf_counter() - start) * 1000:7.1f} ms on the GUI thread')
+
+dialog = FileDialog()
+dialog.get.show()
+stalls: list[float] = []
+last_tick: list[float] = [time.perf_counter()]
+first_rows: list[float] = []
+
+
+def tick():
+    now: float = time.perf_counter()
+    stalls.append(now - last_tick[0])
+    last_tick[0] = now
+
+
+def rows_inserted():
+    if not first_rows:
+        first_rows.append(time.perf_counter())
+
+
+heartbeat = QTimer()
+heartbeat.timeout.connect(tick)
+heartbeat.start(1)
+dialog.model.rowsInserted.connect(rows_inserted)
+dialog.on_directory_loaded(lambda *_: application.quit())
+
+start = time.perf_counter()
+last_tick[0] = start
+dialog.set_directory(benchmark_directory.name)
+application.exec()
+loaded_ms: float = (time.perf_counter() - start) * 1000
+print(f'asynchronous: first rows after {(first_rows[0] - start) * 1000:.1f} ms, {dialog.model.rowCount()} rows after '
+      f'{loaded_ms:.1f} ms, longest GUI thread stall {max(stalls) * 1000:.1f} ms')
+
+stalls.clear()
+first_rows.clear()
+start = time.perf_counter()
+last_tick[0] = start
+dialog.set_directory(benchmark_directory.name)
+application.exec()
+print(f'reopened from the cache: first rows after {(first_rows[0] - start) * 1000:.1f} ms, all rows after '
+      f'{(time.perf_counter() - start) * 1000:.1f} ms, longest GUI thread stall {max(stalls) * 1000:.1f} ms')
@@ -0,0 +1,80 @@
+"""
+Opens a large log file in FilePreview (1 GiB by default, the size in MiB can be given as first argument): first paint, background
+indexing and jumps, then a sparse 3 GiB file.
+
+Run from the repository root: ``PYTHONPATH=src python benchmarks/bench_file_preview.py``
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from PySide6.QtCore import QEventLoop
+from PySide6.QtWidgets import QApplication
+
+from eui.facade.widgets.file_preview import FilePreview
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+application = QApplication([])
+
+target_size: int = int(sys.argv[1]) << 20 if len(sys.argv) > 1 else 1 << 30
+log_directory = tempfile.TemporaryDirectory()
+log_path: str = os.path.join(log_directory.name, 'large.log')
+generator = random.Random(7)
+block: bytes = b''.join(
+    f'2024-05-{line % 28 + 1:02} 12:{line % 60:02}:{line % 59:02} INFO worker-{line % 16} '.encode() + b'x' * generator.randrange(0, 160) +
+    b'\n'
+    for line in range(20_000)
+)
+with open(log_path, 'wb') as log_file:
+    for _ in range(target_size // len(block)):
+        log_file.write(block)
+print(f'{os.path.getsize(log_path) / (1 << 20):.0f} MB log file created')
+
+preview = FilePreview()
+preview.get.resize(1000, 700)
+preview.get.show()
+application.processEvents()
+indexed_loop = QEventLoop()
+preview.on_indexed(lambda _: indexed_loop.quit())
+
+start: float = time.perf_counter()
+preview.open(log_path)
+preview.get.viewport().repaint()
+first_paint_ms: float = (time.perf_counter() - start) * 1000
+indexed_loop.exec()
+index_ms: float = (time.perf_counter() - start) * 1000
+print(f'first lines painted after {first_paint_ms:.1f} ms, {preview.line_count} lines indexed in the background in '
+      f'{index_ms:.0f} ms, index of {preview.index.memory_bytes / (1 << 20):.1f} MB')
+
+paint_times: list[float] = []
+for _ in range(200):
+    preview.scroll_to_line(generator.randrange(preview.line_count))
+    start = time.perf_counter()
+    preview.get.viewport().repaint()
+    paint_times.append((time.perf_counter() - start) * 1000)
+paint_times.sort()
+print(f'paint after a jump anywhere in the file: median {paint_times[100]:.2f} ms, worst {paint_times[-1]:.2f} ms')
+
+start = time.perf_counter()
+with open(log_path, 'rb') as log_file:
+    log_file.read().splitlines()
+print(f'reading and splitting the whole file instead: {(time.perf_counter() - start) * 1000:.0f} ms')
+
+# past 2 GiB, byte counts no longer fit the 32-bit ints of Qt: a sparse file reaches it without writing gigabytes
+sparse_path: str = os.path.join(log_directory.name, 'sparse.log')
+with open(sparse_path, 'wb') as sparse_file:
+    sparse_file.write(block)
+    sparse_file.seek((3 << 30) - len(block))
+    sparse_file.write(block)
+indexed_loop = QEventLoop()
+start = time.perf_counter()
+preview.open(sparse_path)
+indexed_loop.exec()
+assert preview.line_count == 2 * block.count(b'\n'), preview.line_count
+preview.scroll_to_line(preview.line_count - 1)
+preview.get.viewport().repaint()
+print(f'sparse 3 GiB file: {preview.line_count} lines indexed in {(time.perf_counter() - start) * 1000:.0f} ms, '
+      f'last line {preview.line(preview.line_count - 1)[:40]!r}')
+preview.close()
@@ -0,0 +1,77 @@
+"""
+Times LayoutState.save on the GUI thread against a synchronous write, and the first show of a window of 40 docks with the layout
+restored before or after it.
+
+Run from the repository root: ``PYTHONPATH=src python benchmarks/bench_layout_state.py``
+"""
+import os
+import tempfile
+import time
+from concurrent.futures import Future
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QDockWidget, QLabel, QMainWindow
+
+from eui.mainwins.layout_state import LayoutState, _write_atomically
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+application = QApplication([])
+
+
+def make_window(dock_count: int = 40) -> QMainWindow:
+    window = QMainWindow()
+    window.setCentralWidget(QLabel('central'))
+    areas = (Qt.DockWidgetArea.LeftDockWidgetArea, Qt.DockWidgetArea.RightDockWidgetArea, Qt.DockWidgetArea.BottomDockWidgetArea)
+    for index in range(dock_count):
+        dock = QDockWidget(f'Dock {index}', window)
+        dock.setObjectName(f'dock{index}')
+        dock.setWidget(QLabel(f'content {index}'))
+        window.addDockWidget(areas[index % len(areas)], dock)
+    return window
+
+
+layout_directory = tempfile.TemporaryDirectory()
+layout_path: str = os.path.join(layout_directory.name, 'layout.bin')
+
+first_window: QMainWindow = make_window()
+first_window.resize(1600, 1000)
+docks: list[QDockWidget] = first_window.findChildren(QDockWidget)
+for left, right in zip(docks[0::6], docks[3::6]):
+    first_window.tabifyDockWidget(left, right)
+first_window.show()
+application.processEvents()
+
+saved = LayoutState(first_window, layout_path, version=3)
+start: float = time.perf_counter()
+pending: Future = saved.save()
+capture_ms: float = (time.perf_counter() - start) * 1000
+pending.result()
+start = time.perf_counter()
+_write_atomically(f'{layout_path}.sync', open(layout_path, 'rb').read())
+sync_write_ms: float = (time.perf_counter() - start) * 1000
+print(f'save: {capture_ms:.2f} ms on the GUI thread (a synchronous write would add {sync_write_ms:.2f} ms), '
+      f'{os.path.getsize(layout_path)} bytes')
+
+
+def time_first_show(restore_before_show: bool) -> float:
+    window: QMainWindow = make_window()
+    layout = LayoutState(window, layout_path, version=3)
+    start_show: float = time.perf_counter()
+    if restore_before_show:
+        layout.restore()
+    window.show()
+    application.processEvents()
+    if not restore_before_show:
+        layout.restore()
+        application.processEvents()
+    elapsed_ms: float = (time.perf_counter() - start_show) * 1000
+    if restore_before_show:
+        print(f'restore alone: {layout.last_restore_ms:.2f} ms')
+    window.close()
+    return elapsed_ms
+
+
+print(f'show, then restore:  {time_first_show(restore_before_show=False):7.2f} ms')
+print(f'restore before show: {time_first_show(restore_before_show=True):7.2f} ms')
+print(f'stale version restored: {LayoutState(make_window(), layout_path, version=4).restore()}')
+saved.shutdown()
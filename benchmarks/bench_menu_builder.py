@@ -0,0 +1,62 @@
+"""
+Builds a large menu bar from specs with MenuBuilder, lazily and eagerly.
+
+Run from the repository root: ``PYTHONPATH=src python benchmarks/bench_menu_builder.py``
+"""
+import os
+import time
+from typing import Any
+
+from PySide6.QtWidgets import QApplication, QMainWindow, QMenu, QMenuBar
+
+from eui.facade.widgets.menu_builder import MenuBuilder, MenuSpec
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+application = QApplication([])
+
+
+def make_spec(menu_count: int = 10, submenu_count: int = 20, action_count: int = 10) -> MenuSpec:
+    menus: list[MenuSpec] = []
+    for menu_index in range(menu_count):
+        submenus: list[MenuSpec] = []
+        for submenu_index in range(submenu_count):
+            items: list[dict[str, Any]] = [
+                {
+                    'id': f'menu{menu_index}.sub{submenu_index}.action{action_index}',
+                    'text': f'Action {action_index}',
+                    'tooltip': f'Does thing {action_index}',
+                    'checkable': action_index % 3 == 0
+                }
+                for action_index in range(action_count)
+            ]
+            submenus.append({'title': f'Submenu {submenu_index}', 'items': items})
+        menus.append({'title': f'Menu {menu_index}', 'items': submenus})
+    return {'menus': menus}
+
+
+benchmark_spec: MenuSpec = make_spec()
+print(f'{sum(1 for _ in MenuBuilder(benchmark_spec).action_ids)} actions in {len(benchmark_spec["menus"])} menus')
+
+
+def time_build(eager: bool) -> tuple[float, MenuBuilder, QMainWindow]:
+    window = QMainWindow()
+    start: float = time.perf_counter()
+    builder = MenuBuilder(benchmark_spec)
+    menu_bar: QMenuBar = builder.build_menu_bar(window.menuBar())
+    if eager:
+        for top_level in menu_bar.actions():
+            builder.populate_all(top_level.menu())
+    return (time.perf_counter() - start) * 1000, builder, window
+
+
+eager_ms, _, _ = time_build(eager=True)
+lazy_ms, lazy_builder, lazy_window = time_build(eager=False)
+print(f'eager build: {eager_ms:8.2f} ms')
+print(f'lazy build:  {lazy_ms:8.2f} ms ({lazy_builder.instantiated_count} actions created)')
+
+first_menu: QMenu = lazy_window.menuBar().actions()[0].menu()
+start_open: float = time.perf_counter()
+first_menu.aboutToShow.emit()
+first_menu.actions()[0].menu().aboutToShow.emit()
+print(f'first open of a menu and a submenu: {(time.perf_counter() - start_open) * 1000:.2f} ms '
+      f'({lazy_builder.instantiated_count} actions created)')
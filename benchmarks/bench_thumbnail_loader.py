@@ -0,0 +1,71 @@
+"""
+Compares full decoding with decoding at the thumbnail size, then times ThumbnailLoader on 120 JPEG images, cold then
+from its disk cache.
+
+Run from the repository root: ``PYTHONPATH=src python benchmarks/bench_thumbnail_loader.py``
+"""
+import os
+import tempfile
+import time
+
+from PySide6.QtCore import QCoreApplication, QEventLoop, Qt
+from PySide6.QtGui import QColor, QImage, QPainter
+
+from eui.facade.gui.thumbnail_loader import PREFETCH_PRIORITY, ThumbnailKey, ThumbnailLoader, _decode
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+application = QCoreApplication([])
+
+image_directory = tempfile.TemporaryDirectory()
+image_count: int = 120
+image_paths: list[str] = []
+for image_index in range(image_count):
+    source = QImage(3000, 2000, QImage.Format.Format_RGB32)
+    source.fill(QColor.fromHsv(image_index * 3 % 360, 200, 220))
+    painter = QPainter(source)
+    painter.drawEllipse(200, 200, 2600, 1600)
+    painter.end()
+    image_path: str = os.path.join(image_directory.name, f'photo{image_index:03}.jpg')
+    source.save(image_path, 'JPG', 90)
+    image_paths.append(image_path)
+print(f'{image_count} JPEG images of 3000 x 2000 created')
+
+start: float = time.perf_counter()
+for image_path in image_paths[:10]:
+    QImage(image_path).scaled(96, 96, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+print(f'full decode then scale: {(time.perf_counter() - start) * 100:.1f} ms per image')
+start = time.perf_counter()
+for image_path in image_paths[:10]:
+    _decode(ThumbnailKey(image_path, 0.0, 0, 96))
+print(f'decode at the scaled size: {(time.perf_counter() - start) * 100:.1f} ms per image')
+
+
+def load_all(cache_directory: str, label: str):
+    loader = ThumbnailLoader(cache_directory=cache_directory)
+    keys: list[ThumbnailKey] = [loader.key(path, os.path.getmtime(path), os.path.getsize(path)) for path in image_paths]
+    visible: list[ThumbnailKey] = keys[60:80]  # the items scrolled to
+    ready: list[float] = []
+    loop = QEventLoop()
+
+    def thumbnail_ready(key: ThumbnailKey, _: QImage):
+        ready.append(time.perf_counter())
+        if key in visible:
+            visible_ready.append(ready[-1])
+        if len(ready) == image_count:
+            loop.quit()
+
+    visible_ready: list[float] = []
+    loader.on_ready(thumbnail_ready)
+    begin: float = time.perf_counter()
+    for key in keys:
+        loader.request(key, PREFETCH_PRIORITY)
+    loader.set_visible(visible, [key for key in keys if key not in visible])
+    loop.exec()
+    print(f'{label}: visible thumbnails after {(max(visible_ready) - begin) * 1000:6.1f} ms, all {image_count} after '
+          f'{(ready[-1] - begin) * 1000:6.1f} ms ({loader.decoded_count} decoded, {loader.disk_hits} from the disk cache)')
+    loader.shutdown()
+
+
+thumbnail_directory = tempfile.TemporaryDirectory()
+load_all(thumbnail_directory.name, 'cold')
+load_all(thumbnail_directory.name, 'warm')
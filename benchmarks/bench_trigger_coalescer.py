@@ -0,0 +1,63 @@
+"""
+Holds an auto-repeated shortcut for one second with a 50 ms handler, with and without TriggerCoalescer policies, counting the
+handler runs.
+
+Run from the repository root: ``PYTHONPATH=src python benchmarks/bench_trigger_coalescer.py``
+"""
+import os
+import threading
+import time
+
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+from PySide6.QtGui import QAction
+from PySide6.QtWidgets import QApplication
+
+from eui.facade.gui.trigger_coalescer import TriggerCoalescer
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+application = QApplication([])
+
+
+class _KeyRepeat(QObject):
+    pressed = Signal()
+
+
+def simulate(label: str, **policy):
+    """
+    Holds a shortcut for one second, auto-repeat posting 30 triggers per second to the event queue, with a 50 ms handler.
+    """
+    action = QAction()
+    runs: list[float] = []
+
+    def handler():
+        runs.append(time.monotonic())
+        time.sleep(0.05)
+
+    if policy:
+        coalescer = TriggerCoalescer(action, handler, **policy)
+        action.triggered.connect(coalescer.trigger)
+    else:
+        action.triggered.connect(handler)
+
+    key_repeat = _KeyRepeat()
+    key_repeat.pressed.connect(action.trigger, Qt.ConnectionType.QueuedConnection)
+
+    def hold():
+        for _ in range(30):
+            key_repeat.pressed.emit()
+            time.sleep(1 / 30)
+
+    start: float = time.monotonic()
+    holding = threading.Thread(target=hold)
+    holding.start()
+    QTimer.singleShot(2500, application.quit)
+    application.exec()
+    holding.join()
+    print(f'{label:32} {len(runs):3} runs, work ends {(runs[-1] + 0.05 - start) * 1000:7.1f} ms after the key press '
+          f'(released after 1000 ms)')
+
+
+simulate('plain')
+simulate('skip while running', skip_while_running=True)
+simulate('10/s, latest wins', max_rate=10, latest_wins=True)
+simulate('skip while running, latest wins', skip_while_running=True, latest_wins=True)
@@ -3,6 +3,7 @@ from typing import Any, Optional, Type, TypeVar, Generic
 from PySide6.QtWidgets import QMainWindow
 
 from eui.entry_point.qt_main import QtMain, ApplicationType, AsyncQtMain
+from eui.mainwins.layout_state import LayoutState
 from empire_commons.exceptions import ProgrammingException
 import ereport
 
@@ -14,7 +15,10 @@ LOGGER = ereport.get_or_make_reporter('EUI', 'E_UI_LOGGING_LEVEL')
 class QtMainMainwin(Generic[T], QtMain):
     __slots__ = (
         'mainwin',
-        'mainwin_class'
+        'mainwin_class',
+        'layout_state',
+        'layout_state_path',
+        'layout_version'
     )
 
     def __init__(
@@ -24,7 +28,9 @@ class QtMainMainwin(Generic[T], QtMain):
         program_headline: str,
         mainwin_impl: Type[T],
         *,
-        receives_args: bool = False
+        receives_args: bool = False,
+        layout_state_path: str = None,
+        layout_version: int = 0
     ):
         super().__init__(
             program_name,
@@ -36,12 +42,16 @@ class QtMainMainwin(Generic[T], QtMain):
 
         self.mainwin_class: Type[T] = mainwin_impl
         self.mainwin: Optional[T] = None
+        self.layout_state: Optional[LayoutState] = None
+        self.layout_state_path: Optional[str] = layout_state_path  #: where the window layout is persisted, not persisted if None
+        self.layout_version: int = layout_version
 
     def postinit(self, parsed_args: dict[str, Any], *args, **kwargs) -> bool:
         if not super().postinit(parsed_args, *args, **kwargs):
             return False
 
         self.mainwin = self.mainwin_class()
+        self._restore_layout()
         try:
             self.mainwin.show()
         except AttributeError:
@@ -53,11 +63,31 @@ class QtMainMainwin(Generic[T], QtMain):
 
         return True
 
+    def _restore_layout(self):
+        """
+        Restores the persisted layout before the window is first shown, so that it is laid out once, and keeps it persisted.
+        """
+        if self.layout_state_path is None:
+            return
+        if not isinstance(self.mainwin, QMainWindow):
+            # not laid out by docks and toolbars: a poorly written implementation class is reported when shown
+            LOGGER.warn(f'The window layout is not persisted: {type(self.mainwin).__name__} is not a QMainWindow')
+            return
+
+        self.layout_state = LayoutState(self.mainwin, self.layout_state_path, self.layout_version)
+        if self.layout_state.restore():
+            LOGGER.debug(f'Restored the window layout in {self.layout_state.last_restore_ms:.1f} ms')
+        self.layout_state.track()
+        self.app.aboutToQuit.connect(self.layout_state.shutdown)
+
 
 class AsyncQtMainMainwin(Generic[T], AsyncQtMain):
     __slots__ = (
         'mainwin',
-        'mainwin_class'
+        'mainwin_class',
+        'layout_state',
+        'layout_state_path',
+        'layout_version'
     )
 
     def __init__(
@@ -67,7 +97,9 @@ class AsyncQtMainMainwin(Generic[T], AsyncQtMain):
         program_headline: str,
         mainwin_impl: Type[T],
         *,
-        receives_args: bool = False
+        receives_args: bool = False,
+        layout_state_path: str = None,
+        layout_version: int = 0
     ):
         super().__init__(
             program_name,
@@ -79,11 +111,32 @@ class AsyncQtMainMainwin(Generic[T], AsyncQtMain):
 
         self.mainwin_class: Type[T] = mainwin_impl
         self.mainwin: Optional[T] = None
+        self.layout_state: Optional[LayoutState] = None
+        self.layout_state_path: Optional[str] = layout_state_path  #: where the window layout is persisted, not persisted if None
+        self.layout_version: int = layout_version
 
     async def postinit(self, parsed_args: dict[str, Any], *args, **kwargs) -> bool:
         if not await super().postinit(parsed_args, *args, **kwargs):
             return False
 
         self.mainwin = self.mainwin_class()
+        self._restore_layout()
         self.mainwin.show()
         return True
+
+    def _restore_layout(self):
+        """
+        Restores the persisted layout before the window is first shown, so that it is laid out once, and keeps it persisted.
+        """
+        if self.layout_state_path is None:
+            return
+        if not isinstance(self.mainwin, QMainWindow):
+            # not laid out by docks and toolbars: a poorly written implementation class is reported when shown
+            LOGGER.warn(f'The window layout is not persisted: {type(self.mainwin).__name__} is not a QMainWindow')
+            return
+
+        self.layout_state = LayoutState(self.mainwin, self.layout_state_path, self.layout_version)
+        if self.layout_state.restore():
+            LOGGER.debug(f'Restored the window layout in {self.layout_state.last_restore_ms:.1f} ms')
+        self.layout_state.track()
+        self.app.aboutToQuit.connect(self.layout_state.shutdown)
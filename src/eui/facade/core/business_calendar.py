@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator
+
+from PySide6.QtCore import QDate
+
+from eui.facade.core.qdate import Date
+from eui.facade.enums.date_enums import QTDayOfWeek
+
+
+class BusinessCalendar:
+    """
+    Business-day calendar over a fixed span of dates.
+
+    Holidays are kept in a bitset indexed by the day offset from the first date of the span, and a cumulative count of business days
+    is precomputed for the whole span. This gives:
+
+    - ``is_business_day``: O(1)
+    - ``business_days_between``: O(1)
+    - ``add_business_days``: O(log n), a bisection over the cumulative counts
+
+    Spans of several decades only cost a few hundred kilobytes.
+    """
+    __slots__ = (
+        '_first_julian_day',
+        '_last_julian_day',
+        '_weekend_mask',
+        '_holidays',
+        '_cumulative'
+    )
+
+    def __init__(
+        self,
+        first: Date,
+        last: Date,
+        holidays: Iterable[Date] = (),
+        weekend: Iterable[QTDayOfWeek] = (QTDayOfWeek.SATURDAY, QTDayOfWeek.SUNDAY)
+    ):
+        self._first_julian_day: int = first.julian_day
+        self._last_julian_day: int = last.julian_day
+        if self._last_julian_day < self._first_julian_day:
+            raise ValueError(f'Last date {last!r} is before first date {first!r}')
+
+        span: int = self._last_julian_day - self._first_julian_day + 1
+
+        self._weekend_mask: int = 0
+        for day_of_week in weekend:
+            self._weekend_mask |= 1 << int(day_of_week)
+
+        self._holidays: bytearray = bytearray((span + 7) >> 3)
+        for holiday in holidays:
+            offset: int = holiday.julian_day - self._first_julian_day
+            if 0 <= offset < span:
+                self._holidays[offset >> 3] |= 1 << (offset & 7)
+
+        # _cumulative[i] is the number of business days in [first, first + i)
+        self._cumulative: array = array('l', bytes(array('l').itemsize * (span + 1)))
+        count: int = 0
+        for offset in range(span):
+            if self._is_business_offset(offset):
+                count += 1
+            self._cumulative[offset + 1] = count
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        first: Date,
+        last: Date,
+        weekend: Iterable[QTDayOfWeek] = (QTDayOfWeek.SATURDAY, QTDayOfWeek.SUNDAY),
+        date_format: str = 'yyyy-MM-dd'
+    ) -> BusinessCalendar:
+        """
+        Loads holidays from a local text file holding one date per line, formatted with *date_format*
+        (see :meth:`Date.from_string`). Blank lines and everything after a ``#`` are ignored.
+        """
+        return cls(first, last, _read_holidays(path, date_format), weekend)
+
+    @property
+    def first(self) -> Date:
+        return Date.from_julian_day(self._first_julian_day)
+
+    @property
+    def last(self) -> Date:
+        return Date.from_julian_day(self._last_julian_day)
+
+    def is_business_day(self, date: Date) -> bool:
+        """
+        Returns true if *date* is neither a weekend day nor a holiday.
+        """
+        return self._is_business_offset(self._offset(date.julian_day))
+
+    def is_holiday(self, date: Date) -> bool:
+        offset: int = self._offset(date.julian_day)
+        return bool(self._holidays[offset >> 3] & (1 << (offset & 7)))
+
+    def business_days_between(self, start: Date, end: Date) -> int:
+        """
+        Returns the number of business days in [start, end), which is negative if *end* is earlier than *start*.
+        """
+        return self._cumulative[self._offset(end.julian_day)] - self._cumulative[self._offset(start.julian_day)]
+
+    def add_business_days(self, date: Date, days: int) -> Date:
+        """
+        Returns the *days*-th business day after *date* (or before it if *days* is negative). *date* itself does not need to be
+        a business day. Returns *date* unchanged when *days* is 0.
+
+        Raises ``ValueError`` when the result falls outside the calendar span.
+        """
+        offset: int = self._offset(date.julian_day)
+        if days == 0:
+            return Date.from_julian_day(date.julian_day)
+
+        if days > 0:
+            target: int = self._cumulative[offset + 1] + days
+        else:
+            target: int = self._cumulative[offset] + days + 1
+        result: int = bisect_left(self._cumulative, target) - 1
+
+        if not 0 <= result < len(self._cumulative) - 1:
+            raise ValueError(f'Adding {days} business days to {date!r} falls outside of the calendar')
+        return Date.from_julian_day(self._first_julian_day + result)
+
+    def iter_business_days(self, start: Date, end: Date) -> Iterator[Date]:
+        """
+        Yields every business day from *start* up to and including *end*.
+        """
+        for offset in range(self._offset(start.julian_day), self._offset(end.julian_day) + 1):
+            if self._is_business_offset(offset):
+                yield Date.from_julian_day(self._first_julian_day + offset)
+
+    def _offset(self, julian_day: int) -> int:
+        if not self._first_julian_day <= julian_day <= self._last_julian_day:
+            raise ValueError(f'{QDate.fromJulianDay(julian_day)!r} is outside of the calendar')
+        return julian_day - self._first_julian_day
+
+    def _is_business_offset(self, offset: int) -> bool:
+        # Julian day 0 is a Monday, hence ``jd % 7 + 1`` is Qt's day of week
+        if self._weekend_mask & (1 << ((self._first_julian_day + offset) % 7 + 1)):
+            return False
+        return not self._holidays[offset >> 3] & (1 << (offset & 7))
+
+
+def _read_holidays(path: str, date_format: str) -> Iterator[Date]:
+    with open(path, 'r', encoding='utf-8') as file:
+        for line_number, line in enumerate(file, start=1):
+            line = line.split('#', 1)[0].strip()
+            if not line:
+                continue
+
+            holiday: Date = Date.from_string(line, date_format)
+            if not holiday.is_valid:
+                raise ValueError(f'{path}:{line_number}: cannot parse "{line}" using format "{date_format}"')
+            yield holiday
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import gc
+import os
+import weakref
+from types import FrameType
+from typing import Any, NamedTuple
+
+from PySide6.QtCore import QObject
+
+
+class CensusCount(NamedTuple):
+    facades: int  #: live facade instances
+    destroyed_peers: int  #: live facades whose Qt object was destroyed
+    listeners: int  #: callbacks held in the listener lists of the live facades
+
+    def __sub__(self, other: CensusCount) -> CensusCount:
+        return CensusCount(self.facades - other.facades, self.destroyed_peers - other.destroyed_peers, self.listeners - other.listeners)
+
+
+class ZombieRecord(NamedTuple):
+    """
+    Facade still reachable although its Qt object was destroyed.
+    """
+    class_name: str
+    object_name: str  #: of the Qt object, when it was destroyed
+    facade: Any
+    listeners: int
+    referrers: tuple[str, ...]  #: type names of the objects referring to the facade, when requested
+
+
+class _Entry:
+    __slots__ = (
+        'facade',
+        'class_name',
+        'peer_destroyed',
+        'object_name'
+    )
+
+    def __init__(self, facade: weakref.ref, class_name: str):
+        self.facade: weakref.ref = facade
+        self.class_name: str = class_name
+        self.peer_destroyed: bool = False
+        self.object_name: str = ''
+
+
+def _listener_count(facade: Any) -> int:
+    count: int = 0
+    for cls in type(facade).__mro__:
+        for name in getattr(cls, '__slots__', ()):
+            if name.endswith('_listeners'):
+                count += len(getattr(facade, name, ()))
+    return count
+
+
+class FacadeCensus:
+    """
+    Registry of the live facade instances (:class:`Widget`, :class:`Action`, :class:`Dock`...), for tracking down leaks.
+
+    Facades are only held through weak references, and the ``destroyed`` signal of their Qt object is watched, so the census
+    neither keeps anything alive nor queries Qt objects that may be gone. Only facades built while the census is enabled are
+    tracked.
+    """
+    __slots__ = (
+        '_entries',
+        '_next_key',
+        '_released_count'
+    )
+
+    def __init__(self):
+        self._entries: dict[int, _Entry] = {}
+        self._next_key: int = 0
+        self._released_count: int = 0
+
+    @property
+    def released_count(self) -> int:
+        """
+        Number of tracked facades garbage collected so far.
+        """
+        return self._released_count
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def register(self, facade: Any, built_object: QObject) -> FacadeCensus:
+        key: int = self._next_key
+        self._next_key += 1
+
+        entry = _Entry(weakref.ref(facade, lambda _: self._release(key)), type(facade).__qualname__)
+        self._entries[key] = entry
+
+        def _peer_destroyed(destroyed_object: QObject = None):
+            entry.peer_destroyed = True
+            try:
+                entry.object_name = destroyed_object.objectName() if destroyed_object is not None else ''
+            except RuntimeError:
+                pass
+
+        built_object.destroyed.connect(_peer_destroyed)
+        return self
+
+    def snapshot(self, collect: bool = True) -> dict[str, CensusCount]:
+        """
+        Counts the live facades per class, after a garbage collection if *collect* is true.
+        """
+        if collect:
+            gc.collect()
+
+        counts: dict[str, list[int]] = {}
+        for entry in list(self._entries.values()):
+            facade: Any = entry.facade()
+            if facade is None:
+                continue
+            count: list[int] = counts.setdefault(entry.class_name, [0, 0, 0])
+            count[0] += 1
+            count[1] += entry.peer_destroyed
+            count[2] += _listener_count(facade)
+        return {class_name: CensusCount(*count) for class_name, count in sorted(counts.items())}
+
+    @staticmethod
+    def diff(before: dict[str, CensusCount], after: dict[str, CensusCount]) -> dict[str, CensusCount]:
+        """
+        Returns the per class changes from *before* to *after*, leaving out the classes whose counts did not change.
+        """
+        empty = CensusCount(0, 0, 0)
+        changes: dict[str, CensusCount] = {}
+        for class_name in sorted(before.keys() | after.keys()):
+            change: CensusCount = after.get(class_name, empty) - before.get(class_name, empty)
+            if change != empty:
+                changes[class_name] = change
+        return changes
+
+    def zombies(self, collect: bool = True, with_referrers: bool = False) -> list[ZombieRecord]:
+        """
+        Returns the facades whose Qt object was destroyed but which are still reachable, with the type of what refers to them
+        if *with_referrers* is true (slow: it scans every object tracked by the garbage collector).
+        """
+        if collect:
+            gc.collect()
+
+        zombies: list[ZombieRecord] = []
+        for entry in list(self._entries.values()):
+            facade: Any = entry.facade()
+            if facade is None or not entry.peer_destroyed:
+                continue
+
+            referrers: tuple[str, ...] = ()
+            if with_referrers:
+                referrer_types: set[str] = {
+                    type(referrer).__qualname__ for referrer in gc.get_referrers(facade) if not isinstance(referrer, FrameType)
+                }
+                referrers = tuple(sorted(referrer_types))
+            zombies.append(ZombieRecord(entry.class_name, entry.object_name, facade, _listener_count(facade), referrers))
+        return zombies
+
+    def report(self, with_referrers: bool = False) -> str:
+        lines: list[str] = ['Facade census:']
+        for class_name, count in self.snapshot().items():
+            lines.append(
+                f'  {class_name}: {count.facades} live, {count.destroyed_peers} with a destroyed Qt object, {count.listeners} listeners'
+            )
+
+        zombies: list[ZombieRecord] = self.zombies(collect=False, with_referrers=with_referrers)
+        if zombies:
+            lines.append(f'Zombies ({len(zombies)}):')
+            for zombie in zombies:
+                referrers: str = f', referred to by {", ".join(zombie.referrers)}' if zombie.referrers else ''
+                lines.append(f'  {zombie.class_name} {zombie.object_name!r}: {zombie.listeners} listeners{referrers}')
+        return '\n'.join(lines)
+
+    def _release(self, key: int):
+        if self._entries.pop(key, None) is not None:
+            self._released_count += 1
+
+
+_CENSUS: FacadeCensus | None = FacadeCensus() if os.environ.get('E_UI_CENSUS', '') not in ('', '0') else None
+
+
+def enable_census() -> FacadeCensus:
+    """
+    Starts tracking the facades built from now on. The census is also enabled on import if ``E_UI_CENSUS`` is set to anything but
+    ``0``.
+    """
+    global _CENSUS
+    if _CENSUS is None:
+        _CENSUS = FacadeCensus()
+    return _CENSUS
+
+
+def disable_census() -> None:
+    global _CENSUS
+    _CENSUS = None
+
+
+def census() -> FacadeCensus | None:
+    return _CENSUS
+
+
+def register_facade(facade: Any, built_object: QObject) -> None:
+    """
+    Called by facade constructors: records *facade* and its Qt object if the census is enabled, otherwise does nothing.
+    """
+    if _CENSUS is not None:
+        _CENSUS.register(facade, built_object)
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, TypeVar
+
+import shiboken6
+from PySide6.QtCore import QEvent, QObject
+
+
+T = TypeVar('T', bound=QObject)
+
+_CHILD_EVENTS: frozenset[QEvent.Type] = frozenset((QEvent.Type.ChildAdded, QEvent.Type.ChildRemoved))
+
+
+class ChildIndex(QObject):
+    """
+    Index of the descendants of a QObject by object name and by type, answering ``findChild``/``findChildren`` queries with a
+    dictionary lookup instead of a walk of the whole subtree.
+
+    Only the root is watched by an event filter, for its ``QChildEvent`` events: an event filter written in Python makes every
+    event of the filtered object (paints, mouse moves, timers...) call into Python, which would cost far more than the lookups
+    saved if installed on every descendant. Deeper changes are caught otherwise:
+
+    * a renamed descendant is moved on its ``objectNameChanged`` signal;
+    * a descendant deleted or moved out of the subtree is dropped when a lookup finds it;
+    * a descendant added below another indexed descendant is not seen by the index: :meth:`find_child` falls back to Qt's
+      ``findChild`` when the index has no match, and :meth:`find_children` always asks Qt's ``findChildren``, both indexing what
+      they find.
+
+    Lookups are thus always complete, but only :meth:`find_child` hits are saved a walk of the subtree. With
+    *watch_descendants*, every indexed object is watched like the root and :meth:`find_children` is answered by the index too,
+    at the cost of a Python call per event in the subtree.
+
+    Since a child is not fully constructed when its ``ChildAdded`` event is sent, the event only marks its parent as changed: the
+    children of changed parents are compared with the indexed ones on the next lookup.
+
+    Types are matched with ``isinstance`` semantics (an object is indexed under every class of its MRO). Unlike Qt, results are
+    in indexing order rather than in depth-first order.
+    """
+
+    def __init__(self, root: QObject, watch_descendants: bool = False):
+        super().__init__()
+        self._root: QObject = root
+        self._watch_descendants: bool = watch_descendants
+        self._children: dict[QObject, set[QObject]] = {root: set()}  #: indexed children of each indexed object, the root included
+        self._parents: dict[QObject, QObject] = {}  #: parent of each indexed descendant when indexed
+        self._names: dict[QObject, str] = {}
+        self._types: dict[QObject, tuple[type, ...]] = {}
+        self._by_name: dict[str, dict[QObject, None]] = {}
+        self._by_type: dict[type, dict[QObject, None]] = {}
+        self._dirty: dict[QObject, None] = {}
+
+        root.installEventFilter(self)
+        self._index_subtree(root)
+
+    def __len__(self) -> int:
+        self._flush()
+        if self._watch_descendants:
+            return len(self._names)
+        return sum(1 for _ in self._in_subtree(list(self._names)))
+
+    def find_child(self, name: str = None, object_type: type[T] = QObject) -> T | None:
+        """
+        Returns a descendant named *name* (any name if ``None``) and of type *object_type*, or ``None``.
+        """
+        for found in self._candidates(name, object_type):
+            return found
+        if self._watch_descendants:
+            return None
+
+        # an empty name only matches unnamed objects in Qt, any name needs the default null string
+        found: QObject | None = self._root.findChild(object_type) if name is None else self._root.findChild(object_type, name)
+        if found is not None:
+            self._index_ancestry(found)
+        return found
+
+    def find_children(self, name: str = None, object_type: type[T] = QObject) -> list[T]:
+        """
+        Returns the descendants named *name* (any name if ``None``) and of type *object_type*.
+        """
+        if self._watch_descendants:
+            return list(self._candidates(name, object_type))
+
+        found: list[QObject] = self._root.findChildren(object_type) if name is None else self._root.findChildren(object_type, name)
+        self._index_ancestry(*(child for child in found if child not in self._names))
+        return found
+
+    def refresh(self) -> ChildIndex:
+        """
+        Indexes the descendants added below other descendants since they were indexed, comparing every indexed object with its
+        children.
+        """
+        self._dirty.update(dict.fromkeys(self._children))
+        self._flush()
+        return self
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        if event.type() in _CHILD_EVENTS:
+            self._dirty[watched] = None
+        return False
+
+    def _candidates(self, name: str | None, object_type: type) -> Iterable[QObject]:
+        self._flush()
+        by_type: dict[QObject, None] = self._by_type.get(object_type, {})
+        if name is None:
+            candidates: Iterable[QObject] = by_type
+        else:
+            by_name: dict[QObject, None] = self._by_name.get(name, {})
+            if object_type is QObject:
+                candidates = by_name
+            elif len(by_name) <= len(by_type):
+                candidates = (found for found in by_name if found in by_type)
+            else:
+                candidates = (found for found in by_type if found in by_name)
+        return candidates if self._watch_descendants else self._in_subtree(candidates)
+
+    def _in_subtree(self, candidates: Iterable[QObject]) -> Iterator[QObject]:
+        """
+        Yields the *candidates* still below the root, dropping the others once the iteration is over.
+        """
+        below_root: set[QObject] = {self._root}
+        moved_out: list[QObject] = []
+        try:
+            for candidate in candidates:
+                if self._is_below_root(candidate, below_root):
+                    yield candidate
+                else:
+                    moved_out.append(candidate)
+        finally:
+            for candidate in moved_out:
+                self._drop(candidate)
+
+    @staticmethod
+    def _is_below_root(candidate: QObject, below_root: set[QObject]) -> bool:
+        """
+        Returns whether the chain of parents of *candidate* leads to an object of *below_root*, adding the chain to it if so.
+        """
+        chain: list[QObject] = []
+        node: QObject | None = candidate
+        try:
+            while node is not None and node not in below_root:
+                chain.append(node)
+                node = node.parent()
+        except RuntimeError:
+            # deleted
+            return False
+        if node is None:
+            return False
+        below_root.update(chain)
+        return True
+
+    def _index_ancestry(self, *found: QObject):
+        for child in found:
+            node: QObject | None = child.parent()
+            while node is not None and node not in self._dirty:
+                if node in self._children:
+                    self._dirty[node] = None
+                if node is self._root:
+                    break
+                node = node.parent()
+        self._flush()
+
+    def _flush(self):
+        if not self._dirty:
+            return
+
+        dirty: list[QObject] = list(self._dirty)
+        self._dirty.clear()
+
+        # removals first, so a child moved between two indexed parents is indexed again under its new parent
+        added: list[tuple[QObject, QObject]] = []
+        for parent in dirty:
+            indexed: set[QObject] | None = self._children.get(parent)
+            if indexed is None:
+                continue
+            try:
+                current: set[QObject] = set(parent.children())
+            except RuntimeError:
+                # the parent was deleted, its own parent is dirty too and drops it
+                continue
+            for child in indexed - current:
+                self._drop(child)
+            added.extend((parent, child) for child in current - indexed)
+
+        for parent, child in added:
+            if parent in self._children and child not in self._names:
+                self._index(parent, child)
+                self._index_subtree(child)
+
+    def _index_subtree(self, parent: QObject):
+        stack: list[QObject] = [parent]
+        while stack:
+            node: QObject = stack.pop()
+            for child in node.children():
+                if child not in self._names:
+                    self._index(node, child)
+                    stack.append(child)
+
+    def _index(self, parent: QObject, child: QObject):
+        name: str = child.objectName()
+        types: tuple[type, ...] = type(child).__mro__
+        self._children[parent].add(child)
+        self._children[child] = set()
+        self._parents[child] = parent
+        self._names[child] = name
+        self._types[child] = types
+        self._by_name.setdefault(name, {})[child] = None
+        for child_type in types:
+            self._by_type.setdefault(child_type, {})[child] = None
+        if self._watch_descendants:
+            child.installEventFilter(self)
+        child.objectNameChanged.connect(self._object_name_changed)
+
+    def _drop(self, child: QObject):
+        parent: QObject | None = self._parents.get(child)
+        if parent is not None and parent in self._children:
+            self._children[parent].discard(child)
+        self._unindex_subtree(child)
+
+    def _unindex_subtree(self, parent: QObject):
+        stack: list[QObject] = [parent]
+        while stack:
+            node: QObject = stack.pop()
+            if node not in self._names:
+                continue
+            stack.extend(self._children.pop(node, ()))
+            self._parents.pop(node, None)
+            self._dirty.pop(node, None)
+
+            name: str = self._names.pop(node)
+            by_name: dict[QObject, None] = self._by_name[name]
+            del by_name[node]
+            if not by_name:
+                del self._by_name[name]
+            for node_type in self._types.pop(node):
+                by_type: dict[QObject, None] = self._by_type[node_type]
+                del by_type[node]
+                if not by_type:
+                    del self._by_type[node_type]
+
+            if not shiboken6.isValid(node):
+                # deleted, its connections and event filters went with it
+                continue
+            if self._watch_descendants:
+                node.removeEventFilter(self)
+            node.objectNameChanged.disconnect(self._object_name_changed)
+
+    def _object_name_changed(self, name: str):
+        child: QObject = self.sender()
+        previous: str | None = self._names.get(child)
+        if previous is None:
+            return
+
+        by_name: dict[QObject, None] = self._by_name[previous]
+        del by_name[child]
+        if not by_name:
+            del self._by_name[previous]
+        self._names[child] = name
+        self._by_name.setdefault(name, {})[child] = None
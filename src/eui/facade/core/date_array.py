@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import sys
+from array import array
+from typing import Iterable, Iterator, overload
+
+from eui.facade.core.qdate import Date, SERIALIZED_DATE_SIZE
+
+
+_IS_LITTLE_ENDIAN: bool = sys.byteorder == 'little'
+
+
+class DateArray:
+    """
+    Compact, read-only column of dates, stored as 4-byte Julian days.
+
+    The serialized form is the raw little-endian buffer of Julian days (see :meth:`Date.to_bytes`), so a column can be sent to
+    another process or written to disk with a single copy, and loaded back with :meth:`from_buffer` without any copy on
+    little-endian hosts, e.g. straight from a ``mmap`` or a ``multiprocessing.shared_memory`` block.
+    """
+    __slots__ = (
+        '_julian_days',
+    )
+
+    def __init__(self, dates: Iterable[Date] = ()):
+        self._julian_days: array | memoryview = array('i', (date.serialized_julian_day for date in dates))
+
+    @classmethod
+    def from_julian_days(cls, julian_days: Iterable[int]) -> DateArray:
+        obj = cls.__new__(cls)
+        obj._julian_days = array('i', julian_days)
+        return obj
+
+    @classmethod
+    def from_buffer(cls, buffer: bytes | bytearray | memoryview) -> DateArray:
+        """
+        Wraps a buffer written by :meth:`to_bytes`. On little-endian hosts, the returned array is a view over *buffer*: it must be kept
+        alive and unmodified for as long as the array is used.
+        """
+        view: memoryview = memoryview(buffer).cast('B')
+        if len(view) % SERIALIZED_DATE_SIZE:
+            raise ValueError(f'Buffer length {len(view)} is not a multiple of {SERIALIZED_DATE_SIZE}')
+
+        obj = cls.__new__(cls)
+        if _IS_LITTLE_ENDIAN:
+            obj._julian_days = view.cast('i')
+        else:
+            obj._julian_days = array('i')
+            obj._julian_days.frombytes(view)
+            obj._julian_days.byteswap()
+        return obj
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the little-endian buffer of the Julian days of this array.
+        """
+        if _IS_LITTLE_ENDIAN:
+            return self._julian_days.tobytes()
+
+        swapped: array = array('i', self._julian_days)
+        swapped.byteswap()
+        return swapped.tobytes()
+
+    def as_memoryview(self) -> memoryview:
+        """
+        Returns a read-only view over the Julian days, in host byte order, e.g. for ``numpy.frombuffer(view, numpy.int32)``.
+        """
+        return memoryview(self._julian_days).toreadonly()
+
+    def julian_day(self, index: int) -> int:
+        return self._julian_days[index]
+
+    def __len__(self) -> int:
+        return len(self._julian_days)
+
+    @overload
+    def __getitem__(self, index: int) -> Date:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> DateArray:
+        ...
+
+    def __getitem__(self, index: int | slice) -> Date | DateArray:
+        if isinstance(index, slice):
+            obj = self.__class__.__new__(self.__class__)
+            obj._julian_days = self._julian_days[index]
+            return obj
+        return Date.from_serialized_julian_day(self._julian_days[index])
+
+    def __iter__(self) -> Iterator[Date]:
+        for julian_day in self._julian_days:
+            yield Date.from_serialized_julian_day(julian_day)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DateArray):
+            return NotImplemented
+        return self._julian_days == other._julian_days
+
+    def __reduce__(self):
+        return self.__class__.from_buffer, (self.to_bytes(),)
+
+    def __repr__(self) -> str:
+        return f'DateArray(<{len(self)} dates>)'
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator
+
+from PySide6.QtCore import QDate
+
+from eui.facade.core.qdate import Date
+from eui.facade.enums.date_enums import QTDayOfWeek, QTMonth
+
+
+def iter_days(start: Date, end: Date, step: int = 1) -> Iterator[Date]:
+    """
+    Yields every *step* day from *start* up to and including *end*.
+
+    Iteration is done over Julian days, so no intermediate QDate is built between two yielded dates.
+    """
+    if step <= 0:
+        raise ValueError(f'step must be strictly positive, got {step}')
+
+    for julian_day in range(start.julian_day, end.julian_day + 1, step):
+        yield Date.from_julian_day(julian_day)
+
+
+def iter_weeks(start: Date, end: Date, day_of_week: QTDayOfWeek = QTDayOfWeek.MONDAY, step: int = 1) -> Iterator[Date]:
+    """
+    Yields the *day_of_week* of every *step* week, from the first matching day on or after *start* up to and including *end*.
+    """
+    if step <= 0:
+        raise ValueError(f'step must be strictly positive, got {step}')
+
+    first_julian_day: int = start.julian_day
+    # Julian day 0 is a Monday, hence ``jd % 7 + 1`` is Qt's day of week
+    first_julian_day += (int(day_of_week) - (first_julian_day % 7 + 1)) % 7
+
+    for julian_day in range(first_julian_day, end.julian_day + 1, 7 * step):
+        yield Date.from_julian_day(julian_day)
+
+
+def iter_months(start: Date, end: Date, day: int = 1, months: Iterable[QTMonth] = None) -> Iterator[Date]:
+    """
+    Yields the *day* of every month from *start* up to and including *end*.
+
+    When *day* does not exist in a month (e.g. 31 in April), the last day of that month is yielded instead. If *months* is given,
+    only those months are yielded (e.g. ``(QTMonth.MARCH, QTMonth.JUNE, QTMonth.SEPTEMBER, QTMonth.DECEMBER)`` for quarter ends).
+    """
+    if not 1 <= day <= 31:
+        raise ValueError(f'day must be between 1 and 31, got {day}')
+
+    wanted_months: frozenset[int] = frozenset(int(month) for month in months) if months is not None else frozenset(range(1, 13))
+    start_julian_day: int = start.julian_day
+    end_julian_day: int = end.julian_day
+    year: int = start.year
+    month: int = int(start.month)
+
+    while True:
+        if month in wanted_months:
+            first_of_month: QDate = QDate(year, month, 1)
+            julian_day: int = first_of_month.toJulianDay() + min(day, first_of_month.daysInMonth()) - 1
+            if julian_day > end_julian_day:
+                return
+            if julian_day >= start_julian_day:
+                yield Date.from_julian_day(julian_day)
+        elif QDate(year, month, 1).toJulianDay() > end_julian_day:
+            return
+
+        month += 1
+        if month > 12:
+            month = 1
+            year += 1
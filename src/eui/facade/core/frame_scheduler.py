@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import time
+import traceback
+from enum import IntEnum
+from typing import TYPE_CHECKING, Callable, Hashable
+
+from PySide6.QtCore import QTimer, Qt
+from PySide6.QtGui import QGuiApplication
+
+if TYPE_CHECKING:
+    from eui.facade.widgets.widget import Widget
+
+
+class FramePhases(IntEnum):
+    LAYOUT = 0  #: geometry and data preparation, run first
+    PAINT = 1  #: repaint requests, run once every layout callback of the frame is done
+
+
+class FrameStatistics:
+    """
+    Costs of the frames run by a :class:`FrameScheduler`, in milliseconds.
+    """
+    __slots__ = (
+        'frame_count',
+        'callback_count',
+        'deduplicated_count',
+        'last_layout_ms',
+        'last_paint_ms',
+        'max_frame_ms',
+        'total_frame_ms'
+    )
+
+    def __init__(self):
+        self.frame_count: int = 0
+        self.callback_count: int = 0  #: callbacks run over all frames
+        self.deduplicated_count: int = 0  #: requests merged into an already pending one
+        self.last_layout_ms: float = 0.0
+        self.last_paint_ms: float = 0.0
+        self.max_frame_ms: float = 0.0
+        self.total_frame_ms: float = 0.0
+
+    @property
+    def last_frame_ms(self) -> float:
+        return self.last_layout_ms + self.last_paint_ms
+
+    @property
+    def average_frame_ms(self) -> float:
+        return self.total_frame_ms / self.frame_count if self.frame_count else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f'FrameStatistics(frames={self.frame_count}, callbacks={self.callback_count}, deduplicated={self.deduplicated_count}, '
+            f'last={self.last_frame_ms:.2f} ms, average={self.average_frame_ms:.2f} ms, max={self.max_frame_ms:.2f} ms)'
+        )
+
+
+class FrameScheduler:
+    """
+    Runs the work requested by all widgets in a single pass per display frame, like ``requestAnimationFrame``.
+
+    Requests are keyed: requesting again with a pending key replaces the callback instead of adding one, so a widget asking to be
+    repainted on every data tick is repainted once per frame. Layout callbacks run before paint callbacks, and paint requests issued
+    by layout callbacks are served in the same frame. Any other request issued while a frame runs goes to the next frame.
+
+    A callback raising is logged and does not prevent the other callbacks of the frame from running.
+    """
+    __slots__ = (
+        '_frame_interval',
+        '_timer',
+        '_pending',
+        '_last_frame_time',
+        '_running_phase',
+        '_statistics',
+        '__weakref__'
+    )
+
+    def __init__(self, frame_interval_ms: float = None):
+        if frame_interval_ms is None:
+            screen = QGuiApplication.primaryScreen() if QGuiApplication.instance() is not None else None
+            refresh_rate: float = screen.refreshRate() if screen is not None else 0.0
+            frame_interval_ms = 1000.0 / refresh_rate if refresh_rate > 0 else 1000.0 / 60
+
+        self._frame_interval: float = frame_interval_ms / 1000
+        self._timer: QTimer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._run_frame)
+
+        self._pending: tuple[dict[Hashable, Callable[[], None]], ...] = ({}, {})
+        self._last_frame_time: float = 0.0
+        self._running_phase: FramePhases | None = None
+        self._statistics: FrameStatistics = FrameStatistics()
+
+    @property
+    def statistics(self) -> FrameStatistics:
+        return self._statistics
+
+    @property
+    def frame_interval_ms(self) -> float:
+        return self._frame_interval * 1000
+
+    def request_frame(self, callback: Callable[[], None], *, key: Hashable = None, phase: FramePhases = FramePhases.PAINT) -> FrameScheduler:
+        """
+        Runs *callback* during the next frame. Requests sharing the same *key* (by default, the callback itself) are merged: only
+        the last callback is run.
+        """
+        pending: dict[Hashable, Callable[[], None]] = self._pending[phase]
+        key = key if key is not None else callback
+        if key in pending:
+            self._statistics.deduplicated_count += 1
+        pending[key] = callback
+        self._schedule()
+        return self
+
+    def request_layout(self, widget: Widget, callback: Callable[[], None]) -> FrameScheduler:
+        """
+        Runs *callback* in the layout phase of the next frame, once per frame for a given *widget* and *callback*.
+        """
+        return self.request_frame(callback, key=(widget, callback), phase=FramePhases.LAYOUT)
+
+    def request_update(self, widget: Widget) -> FrameScheduler:
+        """
+        Repaints *widget* in the paint phase of the next frame, once whatever the number of requests.
+        """
+        return self.request_frame(widget.update, key=widget, phase=FramePhases.PAINT)
+
+    def cancel(self, key: Hashable) -> FrameScheduler:
+        for pending in self._pending:
+            pending.pop(key, None)
+        return self
+
+    def _schedule(self):
+        if self._timer.isActive() or self._running_phase is not None:
+            return
+
+        # aligned on the frame grid: back-to-back requests never run more often than once per frame
+        delay: float = max(self._frame_interval - (time.perf_counter() - self._last_frame_time), 0.0)
+        self._timer.start(int(delay * 1000))
+
+    def _run_frame(self):
+        start: float = time.perf_counter()
+        self._last_frame_time = start
+        callback_count: int = 0
+
+        layout: dict[Hashable, Callable[[], None]] = self._pending[FramePhases.LAYOUT]
+        self._pending = ({}, self._pending[FramePhases.PAINT])
+        self._running_phase = FramePhases.LAYOUT
+        try:
+            self._run_callbacks(layout)
+            callback_count += len(layout)
+            layout_end: float = time.perf_counter()
+
+            paint: dict[Hashable, Callable[[], None]] = self._pending[FramePhases.PAINT]
+            self._pending = (self._pending[FramePhases.LAYOUT], {})
+            self._running_phase = FramePhases.PAINT
+            self._run_callbacks(paint)
+            callback_count += len(paint)
+        finally:
+            self._running_phase = None
+            # the work requested during the frame must not wait for another request, even if the frame was interrupted
+            if any(self._pending):
+                self._schedule()
+
+        end: float = time.perf_counter()
+        statistics: FrameStatistics = self._statistics
+        statistics.frame_count += 1
+        statistics.callback_count += callback_count
+        statistics.last_layout_ms = (layout_end - start) * 1000
+        statistics.last_paint_ms = (end - layout_end) * 1000
+        statistics.total_frame_ms += (end - start) * 1000
+        statistics.max_frame_ms = max(statistics.max_frame_ms, (end - start) * 1000)
+
+    @staticmethod
+    def _run_callbacks(callbacks: dict[Hashable, Callable[[], None]]):
+        for callback in callbacks.values():
+            try:
+                callback()
+            except Exception:
+                # imported here only: every widget imports this module, and must not need the reporting package
+                import ereport
+                ereport.get_or_make_reporter('EUI', 'E_UI_LOGGING_LEVEL').error(
+                    f'Frame callback {callback!r} raised:\n{traceback.format_exc()}'
+                )
+
+
+_DEFAULT_SCHEDULER: FrameScheduler | None = None
+
+
+def frame_scheduler() -> FrameScheduler:
+    """
+    Returns the application-wide scheduler, created on first use (after the application object).
+    """
+    global _DEFAULT_SCHEDULER
+    if _DEFAULT_SCHEDULER is None:
+        _DEFAULT_SCHEDULER = FrameScheduler()
+    return _DEFAULT_SCHEDULER
+
+
+def request_frame(callback: Callable[[], None], *, key: Hashable = None, phase: FramePhases = FramePhases.PAINT) -> FrameScheduler:
+    """
+    Runs *callback* during the next frame of the application-wide scheduler, see :meth:`FrameScheduler.request_frame`.
+    """
+    return frame_scheduler().request_frame(callback, key=key, phase=phase)
@@ -1,11 +1,18 @@
 from __future__ import annotations
 from datetime import datetime
+from struct import Struct
+from typing import Final
 
 from PySide6.QtCore import QDate, QCalendar
 
 from eui.facade.enums.date_enums import QTDayOfWeek, QTMonth
 
 
+SERIALIZED_NULL_JULIAN_DAY: Final[int] = -(2 ** 31)  #: 4-byte ordinal standing for a null date in the compact format
+SERIALIZED_DATE_SIZE: Final[int] = 4
+_SERIALIZED_DATE: Final[Struct] = Struct('<i')
+
+
 class Date:
     """
     https://doc.qt.io/qtforpython-6/PySide6/QtCore/QDate.html
@@ -57,7 +64,7 @@ class Date:
         +------+--------------------------------------------------------------------------------------------+
         """
         date = QDate.fromString(string, format)
-        obj = cls()
+        obj = cls.__new__(cls)
         obj._date = date
         return obj
 
@@ -69,6 +76,15 @@ class Date:
     def encapsulate(cls, date: QDate) -> Date:
         return cls(date.year(), date.month(), date.day())
 
+    @classmethod
+    def from_julian_day(cls, julian_day: int) -> Date:
+        """
+        Converts the Julian day jd to a QDate .
+        """
+        obj = cls.__new__(cls)
+        obj._date = QDate.fromJulianDay(julian_day)
+        return obj
+
     def to_python_date(self) -> datetime:
         return datetime(self._date.year(), self._date.month(), self._date.day())
 
@@ -211,6 +227,40 @@ class Date:
         """
         return self._date.daysTo(QDate(date.year, date.month, date.day))
 
+    @property
+    def julian_day(self) -> int:
+        """
+        Converts the date to a Julian day.
+        """
+        return self._date.toJulianDay()
+
+    @property
+    def serialized_julian_day(self) -> int:
+        """
+        Returns the Julian day as stored by the compact format: a signed 32-bit integer, null dates being stored as
+        ``SERIALIZED_NULL_JULIAN_DAY``.
+        """
+        return self._date.toJulianDay() if not self._date.isNull() else SERIALIZED_NULL_JULIAN_DAY
+
+    @classmethod
+    def from_serialized_julian_day(cls, julian_day: int) -> Date:
+        obj = cls.__new__(cls)
+        obj._date = QDate.fromJulianDay(julian_day) if julian_day != SERIALIZED_NULL_JULIAN_DAY else QDate()
+        return obj
+
+    def to_bytes(self) -> bytes:
+        """
+        Returns the date in the compact format: its Julian day as a 4-byte little-endian signed integer.
+        """
+        return _SERIALIZED_DATE.pack(self.serialized_julian_day)
+
+    @classmethod
+    def from_bytes(cls, data: bytes | bytearray | memoryview, offset: int = 0) -> Date:
+        """
+        Reads a date written by :meth:`to_bytes` at *offset* in *data*, without copying *data*.
+        """
+        return cls.from_serialized_julian_day(_SERIALIZED_DATE.unpack_from(data, offset)[0])
+
     @property
     def is_leap_year(self) -> bool:
         """
@@ -324,7 +374,7 @@ class Date:
         return self._date.year(calendar)
 
     def __reduce__(self):
-        return self._date.__reduce__()
+        return self.__class__.from_serialized_julian_day, (self.serialized_julian_day,)
 
     def __repr__(self) -> str:
         return self._date.__repr__()
@@ -1,10 +1,20 @@
 from __future__ import annotations
+
+from typing import TypeVar
+
 from PySide6.QtCore import QObject, QChildEvent
 
+from eui.facade.core.child_index import ChildIndex
+from eui.facade.core.signal_batch import SignalBatch
+
+
+T = TypeVar('T', bound=QObject)
+
 
 class Object:
     __slots__ = (
-        '_built_object'
+        '_built_object',
+        '_child_index'
     )
 
     def __init__(
@@ -13,6 +23,7 @@ class Object:
         parent: QObject = None
     ):
         self._built_object: QObject = built_object or QObject(parent)
+        self._child_index: ChildIndex | None = None
 
     @property
     def object_name(self) -> str:
@@ -26,6 +37,28 @@ class Object:
     def object_name(self, name: str):
         self._built_object.setObjectName(name)
 
+    def find_child(self, name: str = None, object_type: type[T] = QObject) -> T | None:
+        """
+        Returns a descendant of this object named *name* (any name if ``None``) and of type *object_type*, or ``None``.
+
+        The first lookup indexes the descendants by name and type, the next ones are dictionary lookups: see :class:`ChildIndex`.
+        """
+        return self.child_index().find_child(name, object_type)
+
+    def find_children(self, name: str = None, object_type: type[T] = QObject) -> list[T]:
+        """
+        Returns the descendants of this object named *name* (any name if ``None``) and of type *object_type*.
+        """
+        return self.child_index().find_children(name, object_type)
+
+    def child_index(self) -> ChildIndex:
+        """
+        Returns the index of the descendants of this object, created on first use and kept up to date from then on.
+        """
+        if self._child_index is None:
+            self._child_index = ChildIndex(self._built_object)
+        return self._child_index
+
     def block_signals(self, state: bool) -> Object:
         """
         If block is true, signals emitted by this object are blocked (i.e., emitting a signal will not invoke anything connected to it). If block is false, no such blocking will occur.
@@ -34,11 +67,19 @@ class Object:
 
         Note that the destroyed() signal will be emitted even if the signals for this object have been blocked.
 
-        Signals emitted while being blocked are not buffered.
+        Signals emitted while being blocked are not buffered, see :meth:`batch_update` to have property changes notified once
+        blocking ends.
         """
         self._built_object.blockSignals(state)
         return self
 
+    def batch_update(self) -> SignalBatch:
+        """
+        Returns a context manager blocking the signals of this object for a bulk edit, then emitting the notify signal of each
+        property changed meanwhile once, with its final value.
+        """
+        return SignalBatch(self._built_object)
+
     def child_event(self, event: QChildEvent) -> Object:
         """
         This event handler can be reimplemented in a subclass to receive child events. The event is passed in the event parameter.
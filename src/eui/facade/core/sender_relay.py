@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from PySide6.QtCore import QObject
+
+
+class SenderRelay(QObject):
+    """
+    Forwards the signals of many objects to a single callback receiving the emitting object, e.g. the ``changed`` signal of every
+    indexed action.
+
+    PySide connects a signal to a slot of a QObject in constant time, but to a plain Python callable (function, lambda, partial) in a
+    time growing with the number of such connections already made: connecting thousands of objects through a relay stays linear.
+    """
+
+    def __init__(self, callback: Callable[[QObject], None]):
+        super().__init__()
+        self._callback: Callable[[QObject], None] = callback
+
+    def relay(self, *_):
+        self._callback(self.sender())
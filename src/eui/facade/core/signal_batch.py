@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Any
+
+from PySide6.QtCore import QMetaMethod, QMetaProperty, QObject
+from PySide6.QtWidgets import QWidget
+
+
+_ACTIVE_BATCHES: dict[QObject, SignalBatch] = {}
+
+
+class SignalBatch:
+    """
+    Context manager suspending the signals (and, for widgets, the repaints) of a QObject during a bulk edit.
+
+    On entry, the values of the properties having a notify signal are recorded and signals are blocked. On exit, signals are
+    unblocked and the notify signal of every property whose value changed is emitted once, with its final value: setting a
+    property a thousand times results in a single notification, and a property set back to its initial value in none. A notify
+    signal shared by several properties is emitted once.
+
+    Signals that do not notify a property change are dropped as with ``QObject.blockSignals``. Nested batches on the same object
+    are merged into the outermost one, and nothing is replayed if signals were already blocked before the batch.
+    """
+    __slots__ = (
+        '_built_object',
+        '_suspend_updates',
+        '_depth',
+        '_snapshot',
+        '_signals_were_blocked',
+        '_updates_were_enabled'
+    )
+
+    def __init__(self, built_object: QObject, suspend_updates: bool = True):
+        self._built_object: QObject = built_object
+        self._suspend_updates: bool = suspend_updates
+        self._depth: int = 0
+        self._snapshot: list[tuple[QMetaProperty, Any]] = []
+        self._signals_were_blocked: bool = False
+        self._updates_were_enabled: bool = False
+
+    def __enter__(self) -> SignalBatch:
+        active: SignalBatch | None = _ACTIVE_BATCHES.get(self._built_object)
+        if active is not None and active is not self:
+            active._depth += 1
+            return active
+
+        if self._depth == 0:
+            _ACTIVE_BATCHES[self._built_object] = self
+            self._begin()
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        active: SignalBatch = _ACTIVE_BATCHES.get(self._built_object, self)
+        active._depth -= 1
+        if active._depth == 0:
+            del _ACTIVE_BATCHES[self._built_object]
+            active._end()
+
+    def _begin(self):
+        built_object: QObject = self._built_object
+        meta_object = built_object.metaObject()
+        self._snapshot = []
+        for index in range(meta_object.propertyCount()):
+            meta_property: QMetaProperty = meta_object.property(index)
+            if meta_property.hasNotifySignal() and meta_property.isReadable():
+                self._snapshot.append((meta_property, built_object.property(meta_property.name())))
+
+        self._signals_were_blocked = built_object.blockSignals(True)
+        if self._suspend_updates and isinstance(built_object, QWidget):
+            self._updates_were_enabled = built_object.updatesEnabled()
+            built_object.setUpdatesEnabled(False)
+
+    def _end(self):
+        built_object: QObject = self._built_object
+        if self._suspend_updates and isinstance(built_object, QWidget):
+            # re-enabling updates schedules a single repaint of the whole widget
+            built_object.setUpdatesEnabled(self._updates_were_enabled)
+        built_object.blockSignals(self._signals_were_blocked)
+
+        snapshot: list[tuple[QMetaProperty, Any]] = self._snapshot
+        self._snapshot = []
+        if self._signals_were_blocked:
+            return
+
+        changed: dict[int, tuple[QMetaMethod, Any]] = {}
+        for meta_property, initial_value in snapshot:
+            value: Any = built_object.property(meta_property.name())
+            if value != initial_value:
+                changed[meta_property.notifySignalIndex()] = (meta_property.notifySignal(), value)
+
+        for notify_signal, value in changed.values():
+            signal = getattr(built_object, bytes(notify_signal.name()).decode())
+            if notify_signal.parameterCount():
+                signal.emit(value)
+            else:
+                signal.emit()
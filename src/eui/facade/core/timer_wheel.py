@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable, Final
+
+from PySide6.QtCore import QTimer, Qt
+
+
+_SLOT_BITS: Final[int] = 6
+_SLOTS: Final[int] = 1 << _SLOT_BITS
+_SLOT_MASK: Final[int] = _SLOTS - 1
+_LEVELS: Final[int] = 4
+_MAX_SPAN: Final[int] = 1 << (_SLOT_BITS * _LEVELS)  #: furthest deadline, in ticks, a timer can be placed at directly
+
+
+def _lowest_bit(mask: int) -> int:
+    return (mask & -mask).bit_length() - 1
+
+
+class TimerHandle:
+    """
+    Logical timer scheduled on a :class:`TimerWheel`.
+    """
+    __slots__ = (
+        '_wheel',
+        '_callback',
+        '_interval',
+        '_slack',
+        '_repeat',
+        '_nominal',
+        '_deadline',
+        '_level',
+        '_slot',
+        '__weakref__'
+    )
+
+    def __init__(self, wheel: TimerWheel, callback: Callable[[], None], interval: int, slack: int, repeat: bool):
+        self._wheel: TimerWheel = wheel
+        self._callback: Callable[[], None] = callback
+        self._interval: int = interval  #: in ticks
+        self._slack: int = slack  #: in ticks
+        self._repeat: bool = repeat
+        self._nominal: int = 0  #: deadline before the slack is applied, in ticks: repeats are counted from it so they never drift
+        self._deadline: int = 0  #: in ticks
+        self._level: int = -1  #: -1 when not scheduled, -2 while due in the tick being processed
+        self._slot: int = 0
+
+    @property
+    def active(self) -> bool:
+        return self._level != -1
+
+    @property
+    def repeat(self) -> bool:
+        return self._repeat
+
+    def cancel(self) -> None:
+        """
+        Stops the timer. Does nothing if it already fired (single shot) or was cancelled.
+        """
+        self._wheel.cancel(self)
+
+
+class TimerWheel:
+    """
+    Multiplexes any number of logical timers onto a single coarse QTimer.
+
+    Timers are kept in a hierarchical timing wheel (4 levels of 64 slots, the first level having one slot per *tick_ms*), so
+    scheduling and cancelling are O(1) whatever the number of timers. The QTimer only wakes the event loop when a slot holding timers
+    is due, or when timers of an upper level have to be moved down: never once per timer.
+
+    Deadlines are rounded up to the next tick. A timer given a *slack* may be delayed by up to that much so its deadline falls on a
+    coarser boundary, which makes timers with nearby deadlines fire during the same wakeup.
+    """
+    __slots__ = (
+        '_tick_seconds',
+        '_origin',
+        '_tick',
+        '_wheels',
+        '_masks',
+        '_count',
+        '_timer',
+        '__weakref__'
+    )
+
+    def __init__(self, tick_ms: float = 10.0):
+        if tick_ms <= 0:
+            raise ValueError(f'tick_ms must be strictly positive, got {tick_ms}')
+
+        self._tick_seconds: float = tick_ms / 1000
+        self._origin: float = time.monotonic()
+        self._tick: int = 0  #: last processed tick
+        self._wheels: list[list[dict[TimerHandle, None]]] = [[{} for _ in range(_SLOTS)] for _ in range(_LEVELS)]
+        self._masks: list[int] = [0] * _LEVELS  #: bit i set when slot i of the level holds timers
+        self._count: int = 0
+
+        self._timer: QTimer = QTimer()
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+    @property
+    def tick_ms(self) -> float:
+        return self._tick_seconds * 1000
+
+    def __len__(self) -> int:
+        return self._count
+
+    def schedule(self, delay_ms: float, callback: Callable[[], None], *, repeat: bool = False, slack_ms: float = 0.0) -> TimerHandle:
+        """
+        Calls *callback* once after *delay_ms*, or every *delay_ms* if *repeat* is true, possibly delayed by up to *slack_ms*.
+        """
+        # the epsilon absorbs the float error of the division (70 / 10 ms ticks must be 7 ticks, not 8)
+        interval: int = max(math.ceil(delay_ms / self.tick_ms - 1e-9), 1)
+        slack: int = int(slack_ms / self.tick_ms + 1e-9)
+        handle = TimerHandle(self, callback, interval, slack, repeat)
+
+        # counted from now, but the ticks elapsed meanwhile are left to the wheel timer: no other callback runs from here
+        self._add(handle, max(self._now(), self._tick) + interval)
+        self._rearm()
+        return handle
+
+    def cancel(self, handle: TimerHandle) -> TimerWheel:
+        if handle._level < 0:
+            # a timer due in the tick being processed is only skipped
+            handle._level = -1
+            return self
+
+        self._remove(handle)
+        self._rearm()
+        return self
+
+    def _now(self) -> int:
+        return int((time.monotonic() - self._origin) / self._tick_seconds)
+
+    def _add(self, handle: TimerHandle, nominal: int):
+        handle._nominal = nominal
+        deadline: int = nominal
+        if handle._slack:
+            # latest power of two boundary within the slack, shared by every timer of similar slack around that deadline
+            granularity: int = 1 << (handle._slack.bit_length() - 1)
+            deadline = -(-deadline // granularity) * granularity
+        self._insert(handle, deadline)
+
+    def _insert(self, handle: TimerHandle, deadline: int):
+        handle._deadline = max(deadline, self._tick + 1)
+        self._place(handle)
+        self._count += 1
+
+    def _place(self, handle: TimerHandle):
+        delta: int = handle._deadline - self._tick
+        if delta >= _MAX_SPAN:
+            # parked in the last slot reached before the top level wraps around, placed again when it cascades
+            level: int = _LEVELS - 1
+            slot: int = ((self._tick >> (_SLOT_BITS * level)) - 1) & _SLOT_MASK
+        else:
+            level = 0
+            while delta >= 1 << (_SLOT_BITS * (level + 1)):
+                level += 1
+            slot = (handle._deadline >> (_SLOT_BITS * level)) & _SLOT_MASK
+
+        handle._level = level
+        handle._slot = slot
+        self._wheels[level][slot][handle] = None
+        self._masks[level] |= 1 << slot
+
+    def _remove(self, handle: TimerHandle):
+        slot: dict[TimerHandle, None] = self._wheels[handle._level][handle._slot]
+        del slot[handle]
+        if not slot:
+            self._masks[handle._level] &= ~(1 << handle._slot)
+        handle._level = -1
+        self._count -= 1
+
+    def _cascade(self, level: int, slot_index: int):
+        slot: dict[TimerHandle, None] = self._wheels[level][slot_index]
+        if not slot:
+            return
+
+        self._wheels[level][slot_index] = {}
+        self._masks[level] &= ~(1 << slot_index)
+        for handle in slot:
+            self._place(handle)
+
+    def _advance(self, target: int):
+        """
+        Processes every tick up to *target*, jumping over the ticks without timers.
+        """
+        while self._tick < target:
+            if not self._count:
+                self._tick = target
+                return
+
+            position: int = self._tick & _SLOT_MASK
+            pending: int = self._masks[0] >> (position + 1)
+            boundary: int = self._tick - position + _SLOTS
+            next_tick: int = min(self._tick + 1 + _lowest_bit(pending) if pending else boundary, boundary, target)
+            self._tick = next_tick
+
+            if not next_tick & _SLOT_MASK:
+                for level in range(_LEVELS - 1, 0, -1):
+                    if not next_tick & ((1 << (_SLOT_BITS * level)) - 1):
+                        self._cascade(level, (next_tick >> (_SLOT_BITS * level)) & _SLOT_MASK)
+
+            if self._masks[0] & (1 << (next_tick & _SLOT_MASK)):
+                self._fire(next_tick & _SLOT_MASK, target)
+
+    def _fire(self, slot_index: int, now: int):
+        due: list[TimerHandle] = list(self._wheels[0][slot_index])
+        self._wheels[0][slot_index] = {}
+        self._masks[0] &= ~(1 << slot_index)
+        self._count -= len(due)
+        for handle in due:
+            handle._level = -2
+
+        for index, handle in enumerate(due):
+            if handle._level == -1:
+                continue
+            handle._level = -1
+            if handle._repeat:
+                nominal: int = handle._nominal + handle._interval
+                if nominal <= now:
+                    # the event loop was blocked for whole intervals: skip the missed ones rather than firing them in a burst
+                    nominal += ((now - nominal) // handle._interval + 1) * handle._interval
+                self._add(handle, nominal)
+            try:
+                handle._callback()
+            except BaseException:
+                # the remaining timers of the slot are postponed to the next tick rather than lost
+                for remaining in due[index + 1:]:
+                    if remaining._level == -2:
+                        self._insert(remaining, self._tick + 1)
+                raise
+
+    def _next_event_tick(self) -> int | None:
+        """
+        Returns the next tick at which a timer fires or timers have to be moved down a level, or ``None`` if there are no timers.
+        """
+        if not self._count:
+            return None
+
+        position: int = self._tick & _SLOT_MASK
+        pending: int = self._masks[0] >> (position + 1)
+        if pending:
+            return self._tick + 1 + _lowest_bit(pending)
+        if self._masks[0]:
+            return self._tick - position + _SLOTS
+
+        # only upper levels hold timers: the next boundary of level 1 holding timers, or the next boundary of level 2
+        level_position: int = (self._tick >> _SLOT_BITS) & _SLOT_MASK
+        pending = self._masks[1] >> (level_position + 1)
+        if pending:
+            return ((self._tick >> _SLOT_BITS) + 1 + _lowest_bit(pending)) << _SLOT_BITS
+        return ((self._tick >> (2 * _SLOT_BITS)) + 1) << (2 * _SLOT_BITS)
+
+    def _rearm(self):
+        next_tick: int | None = self._next_event_tick()
+        if next_tick is None:
+            self._timer.stop()
+            return
+
+        delay: float = self._origin + next_tick * self._tick_seconds - time.monotonic()
+        self._timer.start(max(math.ceil(delay * 1000), 0))
+
+    def _on_timeout(self):
+        try:
+            self._advance(self._now())
+        finally:
+            self._rearm()
+
+
+_DEFAULT_WHEEL: TimerWheel | None = None
+
+
+def timer_wheel() -> TimerWheel:
+    """
+    Returns the application-wide timer wheel, created on first use.
+    """
+    global _DEFAULT_WHEEL
+    if _DEFAULT_WHEEL is None:
+        _DEFAULT_WHEEL = TimerWheel()
+    return _DEFAULT_WHEEL
@@ -0,0 +1,8 @@
+from enum import IntEnum
+
+
+class ShortcutContexts(IntEnum):
+    WIDGET = 0  #: active when the parent widget has focus
+    WINDOW = 1  #: active when the parent widget is a logical subwidget of the active top-level window
+    APPLICATION = 2  #: active when one of the application's windows is active
+    WIDGET_WITH_CHILDREN = 3  #: active when the parent widget or any of its children has focus
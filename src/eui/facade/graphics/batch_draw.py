@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import numpy as np
+import shiboken6
+from PySide6.QtGui import QPainter, QPen, QPolygonF
+
+from eui.facade.graphics.pen import Pen, PenSpec
+from eui.facade.graphics.pen_cache import get_pen
+
+
+_QPOINTF_SIZE: int = 16  # two doubles
+
+
+def resolve_pen(pen: Pen | PenSpec | QPen) -> QPen:
+    """
+    Returns the QPen to paint with: specs are resolved through the shared pen cache.
+    """
+    if isinstance(pen, PenSpec):
+        return get_pen(pen)
+    if isinstance(pen, Pen):
+        return pen.get()
+    return pen
+
+
+class PointBuffer:
+    """
+    Reusable QPolygonF whose memory is exposed as an ``(n, 2)`` float64 NumPy array, so coordinates are written in bulk by NumPy
+    instead of building one QPointF per point.
+
+    The polygon only grows: keeping one buffer per series (or per painter) between frames means no allocation happens once the
+    largest frame was drawn.
+    """
+    __slots__ = (
+        '_polygon',
+    )
+
+    def __init__(self, capacity: int = 0):
+        self._polygon: QPolygonF = QPolygonF()
+        if capacity:
+            self._polygon.reserve(capacity)
+
+    @property
+    def polygon(self) -> QPolygonF:
+        return self._polygon
+
+    @property
+    def capacity(self) -> int:
+        return self._polygon.capacity()
+
+    def view(self, size: int) -> np.ndarray:
+        """
+        Resizes the polygon to *size* points and returns a writable ``(size, 2)`` array over its memory.
+
+        The array is only valid until the next call: resizing may reallocate the polygon.
+        """
+        if size > self._polygon.capacity():
+            self._polygon.reserve(max(size, self._polygon.capacity() * 3 // 2))
+        self._polygon.resize(size)
+        if not size:
+            return np.empty((0, 2), dtype=np.float64)
+
+        memory = shiboken6.VoidPtr(self._polygon.data(), size * _QPOINTF_SIZE, True)
+        return np.frombuffer(memory, dtype=np.float64).reshape(size, 2)
+
+    def fill_xy(self, x: np.ndarray, y: np.ndarray) -> QPolygonF:
+        """
+        Copies the *x* and *y* coordinates into the polygon and returns it.
+        """
+        if len(x) != len(y):
+            raise ValueError(f'x and y must have the same length, got {len(x)} and {len(y)}')
+
+        points: np.ndarray = self.view(len(x))
+        points[:, 0] = x
+        points[:, 1] = y
+        return self._polygon
+
+    def fill_segments(self, x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray) -> QPolygonF:
+        """
+        Copies the segments (x1, y1) -> (x2, y2) into the polygon as consecutive point pairs and returns it.
+        """
+        count: int = len(x1)
+        if not count == len(y1) == len(x2) == len(y2):
+            raise ValueError('All segment coordinate arrays must have the same length')
+
+        points: np.ndarray = self.view(2 * count).reshape(count, 4)
+        points[:, 0] = x1
+        points[:, 1] = y1
+        points[:, 2] = x2
+        points[:, 3] = y2
+        return self._polygon
+
+
+class BatchPainter:
+    """
+    Draws NumPy series with a single ``drawPolyline`` or ``drawLines`` call per series.
+
+    Keep one instance alive between frames (e.g. on the painted widget) so its buffers are reused.
+    """
+    __slots__ = (
+        '_polyline_buffer',
+        '_lines_buffer'
+    )
+
+    def __init__(self, capacity: int = 0):
+        self._polyline_buffer: PointBuffer = PointBuffer(capacity)
+        self._lines_buffer: PointBuffer = PointBuffer(2 * capacity)
+
+    def draw_polyline(self, painter: QPainter, x: np.ndarray, y: np.ndarray, pen: Pen | PenSpec | QPen) -> BatchPainter:
+        """
+        Draws the polyline going through every (x[i], y[i]) point.
+        """
+        if len(x) < 2:
+            return self
+
+        painter.setPen(resolve_pen(pen))
+        painter.drawPolyline(self._polyline_buffer.fill_xy(x, y))
+        return self
+
+    def draw_lines(
+        self,
+        painter: QPainter,
+        x1: np.ndarray,
+        y1: np.ndarray,
+        x2: np.ndarray,
+        y2: np.ndarray,
+        pen: Pen | PenSpec | QPen
+    ) -> BatchPainter:
+        """
+        Draws every (x1[i], y1[i]) -> (x2[i], y2[i]) segment.
+        """
+        count: int = len(x1)
+        if not count:
+            return self
+
+        polygon: QPolygonF = self._lines_buffer.fill_segments(x1, y1, x2, y2)
+        painter.setPen(resolve_pen(pen))
+        painter.drawLines(polygon)
+        return self
+
+    def draw_segments(self, painter: QPainter, x: np.ndarray, y: np.ndarray, pen: Pen | PenSpec | QPen) -> BatchPainter:
+        """
+        Draws the segments joining consecutive points, like :meth:`draw_polyline`, but without joins between segments.
+        """
+        if len(x) < 2:
+            return self
+        return self.draw_lines(painter, x[:-1], y[:-1], x[1:], y[1:], pen)
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import numpy as np
+
+
+def decimate_min_max(x: np.ndarray, y: np.ndarray, x_start: float, x_end: float, columns: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduces the points of a series sorted by *x* to, at most, its minimum and its maximum per pixel column of the
+    [x_start, x_end] range split into *columns* columns. The polyline going through the result is visually identical to the
+    full series at that width.
+
+    The point right before and the point right after the range are kept, so the line still enters and leaves the view.
+    """
+    first, last = _visible_slice(x, x_start, x_end)
+    x = x[first:last]
+    y = y[first:last]
+    if len(x) <= 2 * columns:
+        return x, y
+    return _reduce_columns(x, y, x, y, x, x_start, x_end, columns)
+
+
+def decimate_lttb(x: np.ndarray, y: np.ndarray, threshold: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Largest-Triangle-Three-Buckets downsampling of a series sorted by *x* to *threshold* points.
+
+    LTTB preserves the visual shape of the series better than min/max for line charts that are not drawn at one point per pixel
+    (e.g. with markers), at the cost of one NumPy pass per bucket.
+    """
+    length: int = len(x)
+    if threshold >= length or threshold < 3:
+        return x, y
+
+    # bucket i (1 <= i <= threshold - 2) spans [edges[i - 1], edges[i]), first and last points are kept as is
+    edges: np.ndarray = (np.arange(threshold - 1) * ((length - 2) / (threshold - 2)) + 1).astype(np.intp)
+    edges[-1] = length - 1
+    selected: np.ndarray = np.empty(threshold, dtype=np.intp)
+    selected[0] = 0
+    selected[-1] = length - 1
+
+    previous: int = 0
+    for bucket in range(threshold - 2):
+        start: int = edges[bucket]
+        end: int = edges[bucket + 1]
+        next_start: int = end
+        next_end: int = edges[bucket + 2] if bucket + 2 < len(edges) else length
+        next_x: float = x[next_start:next_end].mean()
+        next_y: float = y[next_start:next_end].mean()
+
+        previous_x: float = x[previous]
+        previous_y: float = y[previous]
+        areas: np.ndarray = np.abs(
+            (previous_x - next_x) * (y[start:end] - previous_y) - (previous_x - x[start:end]) * (next_y - previous_y)
+        )
+        previous = start + int(areas.argmax())
+        selected[bucket + 1] = previous
+
+    return x[selected], y[selected]
+
+
+class DecimationPyramid:
+    """
+    Multi-resolution min/max summary of a series sorted by x, built once and reused on every zoom or pan.
+
+    Level ``k`` holds, for each block of ``2 ** k`` consecutive points, the index of its minimum and of its maximum. A query picks the
+    coarsest level still having at least two blocks per pixel column and only reduces the visible blocks of that level, so its cost
+    depends on the width of the view rather than on the number of points in it. Levels are built lazily from the previous one.
+
+    Appending points (e.g. for a live series) only recomputes the trailing blocks of each built level. The decimated points are meant
+    to be drawn with :meth:`eui.facade.graphics.batch_draw.BatchPainter.draw_polyline`.
+    """
+    __slots__ = (
+        '_x',
+        '_y',
+        '_base_level',
+        '_levels'
+    )
+
+    def __init__(self, x: np.ndarray, y: np.ndarray, base_level: int = 4):
+        if len(x) != len(y):
+            raise ValueError(f'x and y must have the same length, got {len(x)} and {len(y)}')
+
+        self._x: np.ndarray = np.asarray(x)
+        self._y: np.ndarray = np.asarray(y)
+        self._base_level: int = base_level
+        self._levels: list[tuple[np.ndarray, np.ndarray]] = []  # (argmin, argmax) per level, from base_level upwards
+
+    @property
+    def x(self) -> np.ndarray:
+        return self._x
+
+    @property
+    def y(self) -> np.ndarray:
+        return self._y
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    def append(self, x: np.ndarray, y: np.ndarray) -> DecimationPyramid:
+        """
+        Appends points, which must come after the existing ones along x.
+        """
+        if len(x) != len(y):
+            raise ValueError(f'x and y must have the same length, got {len(x)} and {len(y)}')
+
+        previous_length: int = len(self._x)
+        self._x = np.concatenate((self._x, x))
+        self._y = np.concatenate((self._y, y))
+
+        for level_offset, (argmin, argmax) in enumerate(self._levels):
+            # the last block of the level may have been partial, it is recomputed with the new points
+            kept_blocks: int = previous_length >> (self._base_level + level_offset)
+            tail_min, tail_max = self._build_level(level_offset, kept_blocks)
+            self._levels[level_offset] = (np.concatenate((argmin[:kept_blocks], tail_min)), np.concatenate((argmax[:kept_blocks], tail_max)))
+        return self
+
+    def decimate(self, x_start: float, x_end: float, columns: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Same result as :func:`decimate_min_max` over the whole series, using the pyramid, except that a block of points crossing
+        the border of two pixel columns counts in the column it starts in. The points before the first whole block and after the
+        last one, including the points right before and right after the range, are reduced point by point.
+        """
+        first, last = _visible_slice(self._x, x_start, x_end)
+        count: int = last - first
+        if count <= 4 * columns:
+            return decimate_min_max(self._x[first:last], self._y[first:last], x_start, x_end, columns)
+
+        level: int = int(np.log2(count / (2 * columns)))
+        first_block: int = -(-first >> level)
+        last_block: int = last >> level
+        if level < self._base_level or last_block <= first_block:
+            x = self._x[first:last]
+            y = self._y[first:last]
+            return _reduce_columns(x, y, x, y, x, x_start, x_end, columns)
+
+        argmin, argmax = self._level(level - self._base_level)
+        head: np.ndarray = np.arange(first, first_block << level, dtype=np.intp)
+        tail: np.ndarray = np.arange(last_block << level, last, dtype=np.intp)
+        block_start: np.ndarray = np.arange(first_block, last_block, dtype=np.intp) << level
+        min_index: np.ndarray = np.concatenate((head, argmin[first_block:last_block], tail))
+        max_index: np.ndarray = np.concatenate((head, argmax[first_block:last_block], tail))
+        key_index: np.ndarray = np.concatenate((head, block_start, tail))
+        return _reduce_columns(
+            self._x[min_index], self._y[min_index], self._x[max_index], self._y[max_index], self._x[key_index], x_start, x_end, columns
+        )
+
+    def _level(self, level_offset: int) -> tuple[np.ndarray, np.ndarray]:
+        while len(self._levels) <= level_offset:
+            self._levels.append(self._build_level(len(self._levels), 0))
+        return self._levels[level_offset]
+
+    def _build_level(self, level_offset: int, first_block: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the (argmin, argmax) of the blocks of a level, starting at *first_block*.
+        """
+        if level_offset == 0:
+            block_size: int = 1 << self._base_level
+            start: int = first_block * block_size
+            values: np.ndarray = self._y[start:]
+            full_blocks: int = len(values) // block_size
+            offsets: np.ndarray = start + np.arange(full_blocks, dtype=np.intp) * block_size
+            blocks: np.ndarray = values[:full_blocks * block_size].reshape(full_blocks, block_size)
+            argmin: np.ndarray = offsets + _argmin(blocks)
+            argmax: np.ndarray = offsets + _argmax(blocks)
+
+            if len(values) > full_blocks * block_size:
+                tail_start: int = start + full_blocks * block_size
+                tail: np.ndarray = self._y[tail_start:]
+                argmin = np.append(argmin, tail_start + _argmin(tail))
+                argmax = np.append(argmax, tail_start + _argmax(tail))
+            return argmin, argmax
+
+        # pairs of blocks of the previous level, which must exist up to the end of the series
+        lower_min, lower_max = self._levels[level_offset - 1]
+        lower_min = lower_min[2 * first_block:]
+        lower_max = lower_max[2 * first_block:]
+        if len(lower_min) % 2:
+            lower_min = np.append(lower_min, lower_min[-1])
+            lower_max = np.append(lower_max, lower_max[-1])
+
+        pairs_min: np.ndarray = lower_min.reshape(-1, 2)
+        pairs_max: np.ndarray = lower_max.reshape(-1, 2)
+        rows: np.ndarray = np.arange(len(pairs_min))
+        argmin = pairs_min[rows, _argmin(self._y[pairs_min])]
+        argmax = pairs_max[rows, _argmax(self._y[pairs_max])]
+        return argmin, argmax
+
+
+def _argmin(values: np.ndarray) -> np.ndarray:
+    """
+    ``argmin`` along the last axis ignoring NaN, the first index for all-NaN rows.
+    """
+    return _arg_extremum(values, np.ndarray.argmin, np.inf)
+
+
+def _argmax(values: np.ndarray) -> np.ndarray:
+    """
+    ``argmax`` along the last axis ignoring NaN, the first index for all-NaN rows.
+    """
+    return _arg_extremum(values, np.ndarray.argmax, -np.inf)
+
+
+def _arg_extremum(values: np.ndarray, arg_function: Callable[..., np.ndarray], nan_fill: float) -> np.ndarray:
+    rows: np.ndarray = values.reshape(-1, values.shape[-1])
+    at: np.ndarray = arg_function(rows, axis=1)
+    # a sum is NaN if any value is (or from inf - inf): a cheap test before looking for them
+    if values.dtype.kind == 'f' and np.isnan(rows.sum()):
+        # NumPy stops at the first NaN: only the rows where it did are searched again, without their NaN
+        nan_rows: np.ndarray = np.flatnonzero(np.isnan(rows[np.arange(len(rows)), at]))
+        if len(nan_rows):
+            at[nan_rows] = arg_function(np.where(np.isnan(rows[nan_rows]), nan_fill, rows[nan_rows]), axis=1)
+    return at.reshape(values.shape[:-1])
+
+
+def _visible_slice(x: np.ndarray, x_start: float, x_end: float) -> tuple[int, int]:
+    first: int = max(int(np.searchsorted(x, x_start, side='left')) - 1, 0)
+    last: int = min(int(np.searchsorted(x, x_end, side='right')) + 1, len(x))
+    return first, last
+
+
+def _reduce_columns(
+    x_min: np.ndarray,
+    y_min: np.ndarray,
+    x_max: np.ndarray,
+    y_max: np.ndarray,
+    x_key: np.ndarray,
+    x_start: float,
+    x_end: float,
+    columns: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Keeps, for each pixel column, the lowest of the *y_min* candidates and the highest of the *y_max* candidates, ordered along x.
+    *x_key* (sorted) assigns candidates to columns. NaN candidates are ignored, a column of NaN only keeps its first one.
+    """
+    width: float = x_end - x_start
+    if width <= 0:
+        raise ValueError(f'x_end must be greater than x_start, got [{x_start}, {x_end}]')
+
+    column: np.ndarray = ((x_key - x_start) * (columns / width)).astype(np.intp)
+    np.clip(column, -1, columns, out=column)
+    starts: np.ndarray = np.flatnonzero(np.concatenate(([True], column[1:] != column[:-1])))
+    lengths: np.ndarray = np.diff(np.append(starts, len(column)))
+    segment: np.ndarray = np.repeat(np.arange(len(starts)), lengths)
+
+    lowest: np.ndarray = np.fmin.reduceat(y_min, starts)
+    highest: np.ndarray = np.fmax.reduceat(y_max, starts)
+    lowest_at: np.ndarray = _first_reaching(y_min, lowest, segment)
+    highest_at: np.ndarray = _first_reaching(y_max, highest, segment)
+
+    lowest_x: np.ndarray = x_min[lowest_at]
+    highest_x: np.ndarray = x_max[highest_at]
+    min_first: np.ndarray = lowest_x <= highest_x
+
+    out_x: np.ndarray = np.empty(2 * len(starts), dtype=np.result_type(x_min, x_max))
+    out_y: np.ndarray = np.empty(2 * len(starts), dtype=np.result_type(y_min, y_max))
+    out_x[0::2] = np.where(min_first, lowest_x, highest_x)
+    out_x[1::2] = np.where(min_first, highest_x, lowest_x)
+    out_y[0::2] = np.where(min_first, lowest, highest)
+    out_y[1::2] = np.where(min_first, highest, lowest)
+    return out_x, out_y
+
+
+def _first_reaching(values: np.ndarray, extremum: np.ndarray, segment: np.ndarray) -> np.ndarray:
+    """
+    Returns the index of the first value of each segment equal to its *extremum*, the first value of the segment if NaN.
+    """
+    reaching: np.ndarray = values == extremum[segment]
+    if extremum.dtype.kind == 'f':
+        nan_extremum: np.ndarray = np.isnan(extremum)
+        if nan_extremum.any():
+            # no value equals NaN: every value of an all-NaN segment reaches it
+            reaching |= nan_extremum[segment]
+    at: np.ndarray = np.flatnonzero(reaching)
+    return at[np.unique(segment[at], return_index=True)[1]]
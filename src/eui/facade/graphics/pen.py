@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Sequence
+from typing import NamedTuple, Sequence
 
 from PySide6.QtGui import QPen, QBrush, QColor
 from PySide6.QtGui import Qt
@@ -45,16 +45,106 @@ class PenCapStyles(Enum):
     ROUND_CAP = Qt.PenCapStyle.RoundCap
 
 
+class PenSpec(NamedTuple):
+    """
+    Immutable and hashable description of a QPen, usable as a dictionary key (see :class:`eui.facade.graphics.pen_cache.PenCache`).
+
+    The color is stored as an ARGB integer, as returned by ``QColor.rgba()``. Pens using a non-solid brush cannot be described.
+    """
+    style: PenStyles = PenStyles.SOLID_LINE
+    cap_style: PenCapStyles = PenCapStyles.SQUARE_CAP
+    join_style: PenJoinStyles = PenJoinStyles.BEVEL_JOIN
+    width: float = 1.0
+    color: int = 0xFF000000
+    dash_pattern: tuple[float, ...] = ()
+    dash_offset: float = 0.0
+    cosmetic: bool = False
+    miter_limit: float = 2.0
+
+    def build(self) -> QPen:
+        pen = QPen()
+        pen.setStyle(self.style.value)
+        pen.setCapStyle(self.cap_style.value)
+        pen.setJoinStyle(self.join_style.value)
+        pen.setWidthF(self.width)
+        pen.setColor(QColor.fromRgba(self.color))
+        if self.dash_pattern:
+            pen.setDashPattern(list(self.dash_pattern))
+        if self.dash_offset:
+            pen.setDashOffset(self.dash_offset)
+        pen.setCosmetic(self.cosmetic)
+        pen.setMiterLimit(self.miter_limit)
+        return pen
+
+    def to_compact(self) -> tuple:
+        """
+        Returns the spec as a tuple of plain numbers, which is what gets pickled (enums are stored by value, not by reference).
+        """
+        return (
+            self.style.value.value,
+            self.cap_style.value.value,
+            self.join_style.value.value,
+            self.width,
+            self.color,
+            self.dash_pattern,
+            self.dash_offset,
+            self.cosmetic,
+            self.miter_limit
+        )
+
+    @classmethod
+    def from_compact(cls, compact: tuple) -> PenSpec:
+        style, cap_style, join_style, *others = compact
+        return cls(
+            PenStyles(Qt.PenStyle(style)),
+            PenCapStyles(Qt.PenCapStyle(cap_style)),
+            PenJoinStyles(Qt.PenJoinStyle(join_style)),
+            *others
+        )
+
+    def __reduce__(self):
+        return PenSpec.from_compact, (self.to_compact(),)
+
+
 class Pen:
     """
     Builds a QPen instance
     """
+    __slots__ = (
+        '_pen',
+    )
+
     def __init__(self):
         self._pen = QPen()
 
+    @classmethod
+    def from_spec(cls, spec: PenSpec) -> Pen:
+        obj = cls.__new__(cls)
+        obj._pen = spec.build()
+        return obj
+
     def get(self) -> QPen:
         return self._pen
 
+    def to_spec(self) -> PenSpec:
+        """
+        Returns the immutable description of the pen built so far.
+        """
+        return PenSpec(
+            style=PenStyles(self._pen.style()),
+            cap_style=PenCapStyles(self._pen.capStyle()),
+            join_style=PenJoinStyles(self._pen.joinStyle()),
+            width=self._pen.widthF(),
+            color=self._pen.color().rgba(),
+            dash_pattern=tuple(self._pen.dashPattern()) if self._pen.style() == Qt.PenStyle.CustomDashLine else (),
+            dash_offset=self._pen.dashOffset(),
+            cosmetic=self._pen.isCosmetic(),
+            miter_limit=self._pen.miterLimit()
+        )
+
+    def __reduce__(self):
+        return Pen.from_spec, (self.to_spec(),)
+
     def set_brush(self, brush: QBrush) -> Pen:
         """
         Sets the brush used to fill strokes generated with this pen to the given brush.
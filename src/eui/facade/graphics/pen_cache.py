@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from threading import Lock
+
+from PySide6.QtGui import QPen
+
+from eui.facade.graphics.pen import PenSpec
+
+
+class PenCache:
+    """
+    Interning cache of QPen instances, keyed by :class:`PenSpec`.
+
+    Each distinct spec is built once and the same QPen is returned afterwards, so painters can ask for their pens in every
+    ``paintEvent`` without rebuilding them. Least recently used pens are evicted once *max_size* pens are cached.
+
+    Returned pens are shared: they must not be modified. Copy them first (``QPen(pen)``) if needed.
+    Thread-safe, so a cache can be shared between painters of different threads.
+    """
+    __slots__ = (
+        '_pens',
+        '_max_size',
+        '_lock',
+        '_hits',
+        '_misses',
+        '_evictions'
+    )
+
+    def __init__(self, max_size: int = 256):
+        if max_size <= 0:
+            raise ValueError(f'max_size must be strictly positive, got {max_size}')
+
+        self._pens: OrderedDict[PenSpec, QPen] = OrderedDict()
+        self._max_size: int = max_size
+        self._lock: Lock = Lock()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def get(self, spec: PenSpec) -> QPen:
+        """
+        Returns the shared QPen described by *spec*, building it on the first request.
+        """
+        with self._lock:
+            pen: QPen | None = self._pens.get(spec)
+            if pen is not None:
+                self._pens.move_to_end(spec)
+                self._hits += 1
+                return pen
+
+            self._misses += 1
+            pen = spec.build()
+            self._pens[spec] = pen
+            if len(self._pens) > self._max_size:
+                self._pens.popitem(last=False)
+                self._evictions += 1
+            return pen
+
+    def clear(self) -> PenCache:
+        with self._lock:
+            self._pens.clear()
+        return self
+
+    def reset_stats(self) -> PenCache:
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+        return self
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        return len(self._pens)
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the ratio of requests served from the cache, between 0 and 1 (0 when nothing was requested yet).
+        """
+        requests: int = self._hits + self._misses
+        return self._hits / requests if requests else 0.0
+
+    def __len__(self) -> int:
+        return len(self._pens)
+
+    def __contains__(self, spec: PenSpec) -> bool:
+        return spec in self._pens
+
+    def __repr__(self) -> str:
+        return f'PenCache(size={self.size}/{self._max_size}, hits={self._hits}, misses={self._misses}, evictions={self._evictions})'
+
+
+_DEFAULT_CACHE: PenCache = PenCache()
+
+
+def get_pen(spec: PenSpec) -> QPen:
+    """
+    Returns the shared QPen described by *spec* from the application-wide cache.
+    """
+    return _DEFAULT_CACHE.get(spec)
+
+
+def default_pen_cache() -> PenCache:
+    return _DEFAULT_CACHE
@@ -0,0 +1,237 @@
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from enum import Enum
+from multiprocessing.shared_memory import SharedMemory
+from typing import Iterable, Iterator, NamedTuple
+
+import numpy as np
+from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+from PySide6.QtGui import QColor, QGuiApplication, QImage, QPainter
+
+from eui.facade.graphics.batch_draw import BatchPainter
+from eui.facade.graphics.pen import PenSpec
+
+
+class DrawCommandKinds(Enum):
+    POLYLINE = 'polyline'  #: joins consecutive points
+    SEGMENTS = 'segments'  #: draws each (x[2i], y[2i]) -> (x[2i + 1], y[2i + 1]) segment
+
+
+class DrawCommand(NamedTuple):
+    kind: DrawCommandKinds
+    pen: PenSpec
+    x: np.ndarray
+    y: np.ndarray
+
+
+class SceneDescription(NamedTuple):
+    """
+    Picklable description of an image to render in a worker process. Coordinates are in pixels.
+    """
+    width: int
+    height: int
+    commands: tuple[DrawCommand, ...]
+    background: int = 0xFFFFFFFF  #: ARGB, as returned by ``QColor.rgba()``
+
+
+class ImageFormats(Enum):
+    PNG = 'png'
+    RAW_ARGB32 = 'raw_argb32'  #: premultiplied ARGB32 pixels, ``width * 4`` bytes per line
+
+
+class RenderedImage:
+    """
+    Rendered image held in a shared memory block: :attr:`data` is a view over it, no bytes are copied back from the worker.
+
+    The block is released by :meth:`close` (or on exit when used as a context manager); views taken from :attr:`data` must be
+    released first.
+    """
+    __slots__ = (
+        '_shared_memory',
+        '_size',
+        '_width',
+        '_height',
+        '_image_format'
+    )
+
+    def __init__(self, shared_memory: SharedMemory, size: int, width: int, height: int, image_format: ImageFormats):
+        self._shared_memory: SharedMemory | None = shared_memory
+        self._size: int = size
+        self._width: int = width
+        self._height: int = height
+        self._image_format: ImageFormats = image_format
+
+    @property
+    def data(self) -> memoryview:
+        return self._shared_memory.buf[:self._size]
+
+    @property
+    def width(self) -> int:
+        return self._width
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    @property
+    def image_format(self) -> ImageFormats:
+        return self._image_format
+
+    def to_qimage(self) -> QImage:
+        """
+        Returns a QImage owning a copy of the pixels, independent of the shared memory block.
+        """
+        if self._image_format is ImageFormats.PNG:
+            return QImage.fromData(bytes(self.data), 'PNG')
+        return QImage(self.data, self._width, self._height, 4 * self._width, QImage.Format.Format_ARGB32_Premultiplied).copy()
+
+    def close(self) -> None:
+        if self._shared_memory is None:
+            return
+
+        self._shared_memory.close()
+        self._shared_memory.unlink()
+        self._shared_memory = None
+
+    def __enter__(self) -> RenderedImage:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class ProcessRenderer:
+    """
+    Renders scene descriptions into images on a pool of worker processes, for exports heavy enough to be bound by the GIL in
+    threads.
+
+    Workers are spawned (not forked, so they never inherit the Qt state of the parent) and run headless on the ``offscreen``
+    platform unless ``QT_QPA_PLATFORM`` says otherwise. Every image is written into a shared memory block allocated by the parent,
+    which owns it from start to end: raw images are painted directly into it, PNG images are encoded into a block sized for the
+    worst case of their encoding (unused pages are never touched). Only the block name and the image size go through a pipe.
+    """
+    __slots__ = (
+        '_executor',
+    )
+
+    def __init__(self, workers: int = None):
+        self._executor: ProcessPoolExecutor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker
+        )
+
+    def render(self, scenes: Iterable[SceneDescription], image_format: ImageFormats = ImageFormats.PNG) -> Iterator[RenderedImage]:
+        """
+        Renders every scene and yields the images in the order of *scenes*, as soon as each one (and the ones before it) is done.
+        """
+        submitted: list[tuple[Future, SceneDescription, SharedMemory]] = []
+        try:
+            for scene in scenes:
+                if image_format is ImageFormats.RAW_ARGB32:
+                    shared_memory = SharedMemory(create=True, size=max(4 * scene.width * scene.height, 1))
+                    submitted.append((self._executor.submit(_render_raw, scene, shared_memory.name), scene, shared_memory))
+                else:
+                    shared_memory = SharedMemory(create=True, size=_png_capacity(scene))
+                    submitted.append((self._executor.submit(_render_png, scene, shared_memory.name), scene, shared_memory))
+
+            while submitted:
+                future, scene, shared_memory = submitted[0]
+                size: int = future.result()
+                submitted.pop(0)
+                yield RenderedImage(shared_memory, size, scene.width, scene.height, image_format)
+        finally:
+            for future, scene, shared_memory in submitted:
+                if not future.cancel():
+                    # running: the worker is attached to the block, its registration must reach the tracker before the unlink
+                    future.exception()
+                shared_memory.close()
+                shared_memory.unlink()
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> ProcessRenderer:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+
+def _init_worker():
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    if QGuiApplication.instance() is None:
+        # kept referenced by Qt itself for the lifetime of the worker
+        globals()['_APPLICATION'] = QGuiApplication([])
+
+
+def _paint_scene(image: QImage, scene: SceneDescription):
+    image.fill(QColor.fromRgba(scene.background))
+    painter = QPainter(image)
+    try:
+        batch_painter = BatchPainter()
+        for command in scene.commands:
+            if command.kind is DrawCommandKinds.POLYLINE:
+                batch_painter.draw_polyline(painter, command.x, command.y, command.pen)
+            else:
+                batch_painter.draw_lines(painter, command.x[0::2], command.y[0::2], command.x[1::2], command.y[1::2], command.pen)
+    finally:
+        painter.end()
+
+
+def _png_capacity(scene: SceneDescription) -> int:
+    """
+    Returns an upper bound of the size of *scene* encoded as PNG: the filtered ARGB rows (a filter byte each) stored
+    uncompressed, as zlib does at worst with 5 bytes per 16 KiB block, split into IDAT chunks of 12 bytes of overhead per 8 KiB,
+    plus the header and ancillary chunks.
+    """
+    filtered: int = scene.height * (1 + 4 * scene.width)
+    return filtered + filtered // 256 + 4096
+
+
+def _attach(shared_memory_name: str) -> SharedMemory:
+    """
+    Attaches a worker to a block owned by the parent: before Python 3.13, attaching registers the block again in the resource
+    tracker shared with the parent, which is harmless as long as the parent unlinks it after the worker is done.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=shared_memory_name, track=False)
+    return SharedMemory(name=shared_memory_name)
+
+
+def _render_raw(scene: SceneDescription, shared_memory_name: str) -> int:
+    shared_memory = _attach(shared_memory_name)
+    try:
+        buffer: memoryview = shared_memory.buf
+        image = QImage(buffer, scene.width, scene.height, 4 * scene.width, QImage.Format.Format_ARGB32_Premultiplied)
+        _paint_scene(image, scene)
+        del image
+        buffer.release()
+    finally:
+        shared_memory.close()
+    return 4 * scene.width * scene.height
+
+
+def _render_png(scene: SceneDescription, shared_memory_name: str) -> int:
+    image = QImage(scene.width, scene.height, QImage.Format.Format_ARGB32_Premultiplied)
+    _paint_scene(image, scene)
+
+    encoded = QByteArray()
+    buffer = QBuffer(encoded)
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, 'PNG')
+    buffer.close()
+
+    size: int = encoded.size()
+    shared_memory = _attach(shared_memory_name)
+    try:
+        if size > shared_memory.size:
+            raise ValueError(f'PNG image of {size} bytes larger than its {shared_memory.size} bytes block')
+        shared_memory.buf[:size] = encoded.data()
+    finally:
+        shared_memory.close()
+    return size
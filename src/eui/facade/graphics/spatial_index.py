@@ -0,0 +1,225 @@
+from __future__ import annotations
+
+from typing import Generic, Hashable, Iterable, TypeVar
+
+from PySide6.QtCore import QRectF
+
+
+T = TypeVar('T', bound=Hashable)
+Rect = tuple[float, float, float, float]  #: (left, top, right, bottom)
+
+
+def to_rect(rect: QRectF | Rect) -> Rect:
+    if isinstance(rect, QRectF):
+        return rect.left(), rect.top(), rect.right(), rect.bottom()
+    return rect
+
+
+class _Node:
+    __slots__ = (
+        'bounds',
+        'loose_bounds',
+        'depth',
+        'items',
+        'children'
+    )
+
+    def __init__(self, bounds: Rect, depth: int):
+        left, top, right, bottom = bounds
+        half_width: float = (right - left) / 2
+        half_height: float = (bottom - top) / 2
+        self.bounds: Rect = bounds
+        self.loose_bounds: Rect = (left - half_width, top - half_height, right + half_width, bottom + half_height)
+        self.depth: int = depth
+        self.items: dict = {}
+        self.children: list[_Node] | None = None
+
+    def child_index(self, rect: Rect) -> int:
+        """
+        Returns the index of the child whose loose bounds contain *rect*, or -1.
+        """
+        left, top, right, bottom = self.bounds
+        index: int = 2 * ((rect[1] + rect[3]) >= top + bottom) + ((rect[0] + rect[2]) >= left + right)
+        child_left, child_top, child_right, child_bottom = self.children[index].loose_bounds
+        if child_left <= rect[0] and rect[2] <= child_right and child_top <= rect[1] and rect[3] <= child_bottom:
+            return index
+        return -1
+
+    def split(self):
+        left, top, right, bottom = self.bounds
+        middle_x: float = (left + right) / 2
+        middle_y: float = (top + bottom) / 2
+        depth: int = self.depth + 1
+        self.children = [
+            _Node((left, top, middle_x, middle_y), depth),
+            _Node((middle_x, top, right, middle_y), depth),
+            _Node((left, middle_y, middle_x, bottom), depth),
+            _Node((middle_x, middle_y, right, bottom), depth)
+        ]
+
+
+class QuadTree(Generic[T]):
+    """
+    Loose quadtree of rectangular items, for hit-testing custom-painted content.
+
+    Each node accepts items extending up to half its size beyond its bounds, and an item is stored in the deepest node, chosen by the
+    item center, still containing it. Unlike a strict quadtree, items crossing a split line do not pile up in the upper nodes, so a
+    point query visits a bounded number of nodes per level: O(log n) for items that are small compared to the indexed area. Items
+    are kept in a dictionary per node and their node is remembered, so removing or moving an item does not search the tree.
+
+    Items lying outside *bounds* are kept at the root: they are still found, but are checked by every query.
+    When several items overlap, the one inserted last is considered on top.
+    """
+    __slots__ = (
+        '_root',
+        '_max_items',
+        '_max_depth',
+        '_nodes',
+        '_order',
+        '_next_order'
+    )
+
+    def __init__(self, bounds: QRectF | Rect, max_items: int = 16, max_depth: int = 12):
+        self._root: _Node = _Node(to_rect(bounds), 0)
+        self._max_items: int = max_items
+        self._max_depth: int = max_depth
+        self._nodes: dict[T, _Node] = {}
+        self._order: dict[T, int] = {}
+        self._next_order: int = 0
+
+    @property
+    def bounds(self) -> Rect:
+        return self._root.bounds
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._nodes
+
+    def rect_of(self, item: T) -> Rect:
+        return self._nodes[item].items[item]
+
+    def insert(self, item: T, rect: QRectF | Rect) -> QuadTree[T]:
+        """
+        Adds *item* covering *rect*, or moves it if it is already indexed.
+        """
+        if item in self._nodes:
+            self.remove(item)
+
+        self._order[item] = self._next_order
+        self._next_order += 1
+        self._insert(self._root, item, to_rect(rect))
+        return self
+
+    def bulk_load(self, items: Iterable[tuple[T, QRectF | Rect]]) -> QuadTree[T]:
+        """
+        Replaces the content of the tree with *items*, building it top-down in one pass instead of splitting nodes as items come.
+        """
+        self._root = _Node(self._root.bounds, 0)
+        self._nodes.clear()
+        self._order.clear()
+        self._next_order = 0
+
+        entries: list[tuple[T, Rect]] = []
+        for item, rect in items:
+            self._order[item] = self._next_order
+            self._next_order += 1
+            entries.append((item, to_rect(rect)))
+        self._bulk_insert(self._root, entries)
+        return self
+
+    def remove(self, item: T) -> QuadTree[T]:
+        node: _Node = self._nodes.pop(item)
+        del node.items[item]
+        del self._order[item]
+        return self
+
+    def clear(self) -> QuadTree[T]:
+        self._root = _Node(self._root.bounds, 0)
+        self._nodes.clear()
+        self._order.clear()
+        return self
+
+    def query_point(self, x: float, y: float) -> list[T]:
+        """
+        Returns the items whose rectangle contains (x, y), bottom-most first.
+        """
+        found: list[T] = []
+        stack: list[_Node] = [self._root]
+        while stack:
+            node: _Node = stack.pop()
+            for item, (left, top, right, bottom) in node.items.items():
+                if left <= x <= right and top <= y <= bottom:
+                    found.append(item)
+            if node.children is not None:
+                for child in node.children:
+                    left, top, right, bottom = child.loose_bounds
+                    if left <= x <= right and top <= y <= bottom and (child.items or child.children is not None):
+                        stack.append(child)
+
+        found.sort(key=self._order.__getitem__)
+        return found
+
+    def item_at(self, x: float, y: float) -> T | None:
+        """
+        Returns the top-most item containing (x, y), if any.
+        """
+        found: list[T] = self.query_point(x, y)
+        return found[-1] if found else None
+
+    def query_rect(self, rect: QRectF | Rect) -> list[T]:
+        """
+        Returns the items whose rectangle intersects *rect*, bottom-most first.
+        """
+        left, top, right, bottom = to_rect(rect)
+        found: list[T] = []
+        stack: list[_Node] = [self._root]
+        while stack:
+            node: _Node = stack.pop()
+            for item, (item_left, item_top, item_right, item_bottom) in node.items.items():
+                if item_left <= right and left <= item_right and item_top <= bottom and top <= item_bottom:
+                    found.append(item)
+            if node.children is not None:
+                for child in node.children:
+                    child_left, child_top, child_right, child_bottom = child.loose_bounds
+                    if child_left <= right and left <= child_right and child_top <= bottom and top <= child_bottom:
+                        stack.append(child)
+
+        found.sort(key=self._order.__getitem__)
+        return found
+
+    def _insert(self, node: _Node, item: T, rect: Rect):
+        while node.children is not None:
+            index: int = node.child_index(rect)
+            if index < 0:
+                break
+            node = node.children[index]
+
+        node.items[item] = rect
+        self._nodes[item] = node
+        if node.children is None and len(node.items) > self._max_items and node.depth < self._max_depth:
+            entries: list[tuple[T, Rect]] = list(node.items.items())
+            node.items = {}
+            self._bulk_insert(node, entries)
+
+    def _bulk_insert(self, node: _Node, entries: list[tuple[T, Rect]]):
+        if len(entries) <= self._max_items or node.depth >= self._max_depth:
+            for item, rect in entries:
+                node.items[item] = rect
+                self._nodes[item] = node
+            return
+
+        node.split()
+        per_child: list[list[tuple[T, Rect]]] = [[], [], [], []]
+        for item, rect in entries:
+            index: int = node.child_index(rect)
+            if index < 0:
+                node.items[item] = rect
+                self._nodes[item] = node
+            else:
+                per_child[index].append((item, rect))
+
+        for child, child_entries in zip(node.children, per_child):
+            if child_entries:
+                self._bulk_insert(child, child_entries)
@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import math
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, NamedTuple
+
+from PySide6.QtCore import QObject, QPointF, QRectF, Signal
+from PySide6.QtGui import QColor, QImage, QPainter, QPaintEvent
+
+from eui.facade.widgets.widget import Widget
+
+
+SceneRenderer = Callable[[QPainter, QRectF, float], None]
+"""
+``def render(painter: QPainter, scene_rect: QRectF, zoom: float)``: paints the part of the scene within *scene_rect*. The painter is
+already scaled and translated, so the scene is painted in its own coordinates. Called concurrently from worker threads: it must
+not touch widgets and should take its pens from a :class:`eui.facade.graphics.pen_cache.PenCache`.
+"""
+
+
+class TileKey(NamedTuple):
+    column: int
+    row: int
+    zoom: float
+
+
+class _TileSignals(QObject):
+    tile_ready = Signal(object, object, int)
+
+
+class TiledRenderer:
+    """
+    Renders a scene offscreen, tile by tile, on a pool of worker threads, and composites finished tiles into a :class:`Widget`
+    through its paint hook.
+
+    The viewport is the scene position shown at the top-left corner of the widget and a zoom factor. Tiles are cached by
+    (column, row, zoom), so panning back and forth or returning to a previous zoom reuses the already rendered images. Painting never
+    waits for a tile: missing tiles are requested and the widget is updated as they arrive.
+    """
+    __slots__ = (
+        '_scene_renderer',
+        '_tile_size',
+        '_max_cached_tiles',
+        '_background',
+        '_executor',
+        '_signals',
+        '_tiles',
+        '_pending',
+        '_generation',
+        '_widget',
+        '_origin',
+        '_zoom',
+        '__weakref__'
+    )
+
+    def __init__(
+        self,
+        scene_renderer: SceneRenderer,
+        *,
+        tile_size: int = 256,
+        max_cached_tiles: int = 512,
+        workers: int = None,
+        background: QColor = None
+    ):
+        self._scene_renderer: SceneRenderer = scene_renderer
+        self._tile_size: int = tile_size
+        self._max_cached_tiles: int = max_cached_tiles
+        self._background: QColor = background if background is not None else QColor(0, 0, 0, 0)
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='eui-tile')
+        self._signals: _TileSignals = _TileSignals()
+        self._signals.tile_ready.connect(self._on_tile_ready)
+
+        self._tiles: OrderedDict[TileKey, QImage] = OrderedDict()
+        self._pending: dict[TileKey, Future] = {}
+        self._generation: int = 0
+        self._widget: Widget | None = None
+        self._origin: QPointF = QPointF(0, 0)
+        self._zoom: float = 1.0
+
+    def attach(self, widget: Widget) -> TiledRenderer:
+        """
+        Composites the rendered tiles into *widget* on each of its paint events.
+        """
+        self._widget = widget
+        widget.on_paint(self._paint)
+        widget.update()
+        return self
+
+    def set_viewport(self, origin: QPointF, zoom: float) -> TiledRenderer:
+        """
+        Shows the scene from *origin* (scene coordinates of the top-left corner of the widget) at the given *zoom*.
+        """
+        self._origin = QPointF(origin)
+        self._zoom = zoom
+        if self._widget is not None:
+            self._widget.update()
+        return self
+
+    def invalidate(self) -> TiledRenderer:
+        """
+        Drops every cached tile, to be called when the scene changes. Tiles being rendered for the previous scene are discarded.
+        """
+        self._generation += 1
+        self._tiles.clear()
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        if self._widget is not None:
+            self._widget.update()
+        return self
+
+    def shutdown(self) -> None:
+        for future in self._pending.values():
+            future.cancel()
+        self._pending.clear()
+        self._executor.shutdown(wait=True)
+
+    @property
+    def cached_tile_count(self) -> int:
+        return len(self._tiles)
+
+    @property
+    def pending_tile_count(self) -> int:
+        return len(self._pending)
+
+    def visible_tiles(self, width: int, height: int) -> list[TileKey]:
+        """
+        Returns the keys of the tiles covering a *width* x *height* pixels view at the current viewport, row by row.
+        """
+        first_column: int = math.floor(self._origin.x() * self._zoom / self._tile_size)
+        first_row: int = math.floor(self._origin.y() * self._zoom / self._tile_size)
+        last_column: int = math.floor((self._origin.x() * self._zoom + width) / self._tile_size)
+        last_row: int = math.floor((self._origin.y() * self._zoom + height) / self._tile_size)
+        return [
+            TileKey(column, row, self._zoom)
+            for row in range(first_row, last_row + 1)
+            for column in range(first_column, last_column + 1)
+        ]
+
+    def _paint(self, event: QPaintEvent):
+        widget = self._widget.get
+        visible: list[TileKey] = self.visible_tiles(widget.width(), widget.height())
+        visible_set: set[TileKey] = set(visible)
+
+        for key, future in list(self._pending.items()):
+            if key not in visible_set and future.cancel():
+                del self._pending[key]
+
+        device_pixel_ratio: float = widget.devicePixelRatioF()
+        painter = QPainter(widget)
+        try:
+            for key in visible:
+                image: QImage | None = self._tiles.get(key)
+                if image is None:
+                    self._request(key, device_pixel_ratio)
+                    continue
+
+                self._tiles.move_to_end(key)
+                painter.drawImage(
+                    QPointF(
+                        key.column * self._tile_size - self._origin.x() * self._zoom,
+                        key.row * self._tile_size - self._origin.y() * self._zoom
+                    ),
+                    image
+                )
+        finally:
+            painter.end()
+
+    def _request(self, key: TileKey, device_pixel_ratio: float):
+        if key in self._pending:
+            return
+        self._pending[key] = self._executor.submit(self._render_tile, key, device_pixel_ratio, self._generation)
+
+    def _render_tile(self, key: TileKey, device_pixel_ratio: float, generation: int):
+        size: int = math.ceil(self._tile_size * device_pixel_ratio)
+        image = QImage(size, size, QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(device_pixel_ratio)
+        image.fill(self._background)
+
+        scene_tile_size: float = self._tile_size / key.zoom
+        scene_rect = QRectF(key.column * scene_tile_size, key.row * scene_tile_size, scene_tile_size, scene_tile_size)
+
+        painter = QPainter(image)
+        try:
+            painter.setClipRect(QRectF(0, 0, self._tile_size, self._tile_size))
+            painter.scale(key.zoom, key.zoom)
+            painter.translate(-scene_rect.x(), -scene_rect.y())
+            self._scene_renderer(painter, scene_rect, key.zoom)
+        finally:
+            painter.end()
+
+        self._signals.tile_ready.emit(key, image, generation)
+
+    def _on_tile_ready(self, key: TileKey, image: QImage, generation: int):
+        if generation != self._generation:
+            return
+
+        self._pending.pop(key, None)
+        self._tiles[key] = image
+        self._tiles.move_to_end(key)
+        while len(self._tiles) > self._max_cached_tiles:
+            self._tiles.popitem(last=False)
+
+        if self._widget is not None:
+            self._widget.update()
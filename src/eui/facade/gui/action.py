@@ -1,8 +1,14 @@
 from __future__ import annotations
 from typing import Any, Callable
 
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon, QPixmap, QKeySequence, QActionGroup, QFont, QAction
 
+from eui.facade.core.census import register_facade
+from eui.facade.enums.action_enums import ShortcutContexts
+from eui.facade.gui.icon_cache import IconKey, icon_cache
+from eui.facade.gui.trigger_coalescer import TriggerCoalescer
+
 
 class Action:
     """
@@ -10,10 +16,23 @@ class Action:
 
     https://doc.qt.io/qtforpython/PySide6/QtGui/QAction.html#PySide6.QtGui.PySide6.QtGui.QAction.triggered
     """
-    __slots__ = ('_action',)
+    __slots__ = ('_action', '_icon_key', '__weakref__')
 
     def __init__(self, parent=None):
         self._action: QAction = QAction(parent=parent)
+        self._icon_key: IconKey | None = None  #: icon requested from the icon cache, until another icon is set
+        register_facade(self, self._action)
+
+    @classmethod
+    def encapsulate(cls, action: QAction) -> Action:
+        """
+        Returns a facade over the existing *action*.
+        """
+        obj = cls.__new__(cls)
+        obj._action = action
+        obj._icon_key = None
+        register_facade(obj, action)
+        return obj
 
     @property
     def get(self) -> QAction:
@@ -51,8 +70,25 @@ class Action:
         self._action.toggled.connect(callback)
         return self
 
-    def on_triggered(self, callback: Callable[[], None]) -> Action:
-        self._action.triggered.connect(callback)
+    def on_triggered(
+        self,
+        callback: Callable[[], None],
+        *,
+        max_rate: float = 0.0,
+        latest_wins: bool = False,
+        skip_while_running: bool = False
+    ) -> Action:
+        """
+        Connects "triggered", optionally coalescing the triggers of a held shortcut (see :class:`TriggerCoalescer`): at most
+        *max_rate* runs per second, triggers arriving while *callback* runs skipped, the last skipped trigger deferred rather than
+        dropped if *latest_wins* (which raises ``ValueError`` without *max_rate* or *skip_while_running*).
+        :param callback: ``def on_triggered(self)``
+        """
+        if max_rate or latest_wins or skip_while_running:
+            coalescer = TriggerCoalescer(self._action, callback, max_rate, latest_wins, skip_while_running)
+            self._action.triggered.connect(coalescer.trigger)
+        else:
+            self._action.triggered.connect(callback)
         return self
 
     def on_visible_changed(self, callback: Callable[[], None]) -> Action:
@@ -108,11 +144,20 @@ class Action:
         self._action.setFont(font)
         return self
 
-    def set_icon(self, icon: QIcon | QPixmap | None) -> Action:
+    def set_icon(self, icon: QIcon | QPixmap | IconKey | None) -> Action:
         """
         This property holds the action’s icon. In toolbars, the icon is used as the tool button icon; in menus, it is displayed to the left of the menu text. There is no default icon.
+
+        Given an :class:`IconKey`, the icon is taken from the application-wide icon cache: set right away if already decoded,
+        otherwise once decoded in the background, unless another icon was set meanwhile.
         """
-        self._action.setIcon(icon)
+        if isinstance(icon, IconKey):
+            self._icon_key = icon
+            icon_cache().request(icon, lambda pixmap: self._set_icon_pixmap(icon, pixmap))
+            return self
+
+        self._icon_key = None
+        self._action.setIcon(icon if icon is not None else QIcon())
         return self
 
     def set_icon_text(self, icon_text: str) -> Action:
@@ -147,7 +192,7 @@ class Action:
         """
         This property holds the context for the action’s shortcut. Valid values for this property can be found in ShortcutContext . The default value is WindowShortcut .
         """
-        self._action.setShortcutContext(shortcut_context)
+        self._action.setShortcutContext(Qt.ShortcutContext(shortcut_context))
         return self
 
     def set_status_bar_tip(self, status_bar_tip: str) -> Action:
@@ -176,4 +221,14 @@ class Action:
         This property holds the action’s “What’s This?” help text. The “What’s This?” text is used to provide a brief description of the action. The text may contain rich text. There is no default “What’s This?” text.
         """
         self._action.setWhatsThis(whats_this)
-        return self
\ No newline at end of file
+        return self
+
+    def _set_icon_pixmap(self, key: IconKey, pixmap: QPixmap):
+        if key != self._icon_key:
+            # superseded by an icon set after this one was requested
+            return
+        try:
+            self._action.setIcon(QIcon(pixmap))
+        except RuntimeError:
+            # the QAction was deleted while its icon was decoded
+            pass
\ No newline at end of file
@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import json
+from typing import Callable, Hashable, Iterable, NamedTuple
+
+from PySide6.QtGui import QAction, QKeySequence
+from PySide6.QtWidgets import QWidget
+
+from eui.facade.core.sender_relay import SenderRelay
+from eui.facade.enums.action_enums import ShortcutContexts
+from eui.facade.gui.action import Action
+
+
+_BindingKey = tuple[str, ShortcutContexts, Hashable]  #: (portable shortcut, context, scope)
+
+
+class ShortcutConflict(NamedTuple):
+    shortcut: str  #: in portable text, e.g. ``Ctrl+Shift+S``
+    context: ShortcutContexts
+    action_ids: tuple[str, ...]
+
+
+def normalize_shortcut(shortcut: str | QKeySequence) -> str:
+    """
+    Returns *shortcut* in portable text, so that e.g. ``ctrl+s`` and ``Ctrl+S`` are the same shortcut.
+    """
+    if not isinstance(shortcut, QKeySequence):
+        shortcut = QKeySequence(shortcut)
+    return shortcut.toString(QKeySequence.SequenceFormat.PortableText)
+
+
+class ActionRegistry:
+    """
+    Central index of actions by shortcut and shortcut context, reporting conflicting shortcuts as soon as they appear.
+
+    Each registered action is indexed under each of its shortcuts, so finding the actions bound to a shortcut or checking a new
+    binding for conflicts is a dictionary lookup. Two actions conflict when they share a shortcut in the same context: for the
+    widget contexts, only if they also share the same parent; an application shortcut also conflicts with the window shortcuts
+    using the same keys. Shortcuts set on a registered action through :class:`Action` directly are picked up from its ``changed``
+    signal.
+
+    Keymaps (``{action_id: shortcut or [shortcuts]}``, JSON on disk) are applied in a single pass: conflicts are only checked
+    once every binding is changed, so swapping two shortcuts does not report a transient conflict, and the menus and toolbars
+    showing the actions are repainted once.
+    """
+    __slots__ = (
+        '_actions',
+        '_bindings',
+        '_keys',
+        '_action_ids',
+        '_relay',
+        '_bulk_touched',
+        '_conflict_listeners',
+        '_registered_listeners',
+        '_unregistered_listeners'
+    )
+
+    def __init__(self):
+        self._actions: dict[str, Action] = {}
+        self._bindings: dict[_BindingKey, dict[str, None]] = {}  #: action ids bound to each key, in binding order
+        self._keys: dict[str, tuple[_BindingKey, ...]] = {}  #: keys each action is indexed under
+        self._action_ids: dict[QAction, str] = {}
+        self._relay: SenderRelay = SenderRelay(self._action_changed)
+        self._bulk_touched: dict[_BindingKey, None] | None = None  #: keys changed by the bulk update in progress
+        self._conflict_listeners: list[Callable[[ShortcutConflict], None]] = []
+        self._registered_listeners: list[Callable[[str, Action], None]] = []
+        self._unregistered_listeners: list[Callable[[str, Action], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._actions)
+
+    def __contains__(self, action_id: str) -> bool:
+        return action_id in self._actions
+
+    def action(self, action_id: str) -> Action:
+        return self._actions[action_id]
+
+    def items(self) -> list[tuple[str, Action]]:
+        return list(self._actions.items())
+
+    def on_conflict(self, callback: Callable[[ShortcutConflict], None]) -> ActionRegistry:
+        """
+        Registers *callback* as a listener for a binding making several actions share a shortcut
+        :param callback: ``def on_conflict(self, conflict: ShortcutConflict)``
+        """
+        self._conflict_listeners.append(callback)
+        return self
+
+    def on_registered(self, callback: Callable[[str, Action], None]) -> ActionRegistry:
+        """
+        Registers *callback* as a listener for an action being registered
+        :param callback: ``def on_registered(self, action_id: str, action: Action)``
+        """
+        self._registered_listeners.append(callback)
+        return self
+
+    def on_unregistered(self, callback: Callable[[str, Action], None]) -> ActionRegistry:
+        """
+        Registers *callback* as a listener for an action being unregistered
+        :param callback: ``def on_unregistered(self, action_id: str, action: Action)``
+        """
+        self._unregistered_listeners.append(callback)
+        return self
+
+    def register(self, action_id: str, action: Action) -> ActionRegistry:
+        """
+        Adds *action* under *action_id*, indexing the shortcuts it already has.
+        """
+        if action_id in self._actions:
+            raise ValueError(f'An action is already registered as {action_id!r}')
+
+        self._actions[action_id] = action
+        self._action_ids[action.get] = action_id
+        action.get.changed.connect(self._relay.relay)
+        self._reindex(action_id)
+        [callback(action_id, action) for callback in self._registered_listeners]
+        return self
+
+    def unregister(self, action_id: str) -> ActionRegistry:
+        action: Action = self._actions.pop(action_id)
+        self._action_ids.pop(action.get, None)
+        try:
+            action.get.changed.disconnect(self._relay.relay)
+        except RuntimeError:
+            # the QAction is already deleted
+            pass
+        self._unindex(action_id)
+        [callback(action_id, action) for callback in self._unregistered_listeners]
+        return self
+
+    def bind(self, action_id: str, shortcuts: str | Iterable[str] | None) -> ActionRegistry:
+        """
+        Replaces the shortcuts of the action registered as *action_id*; ``None`` or an empty list removes them.
+        """
+        if shortcuts is None:
+            shortcuts = []
+        elif isinstance(shortcuts, str):
+            shortcuts = [shortcuts]
+        self._actions[action_id].get.setShortcuts([QKeySequence(shortcut) for shortcut in shortcuts])
+        # the changed signal reindexes the action, unless signals are blocked
+        self._reindex(action_id)
+        return self
+
+    def actions_for(
+        self,
+        shortcut: str | QKeySequence,
+        context: ShortcutContexts = ShortcutContexts.WINDOW,
+        scope: Hashable = None
+    ) -> list[str]:
+        """
+        Returns the ids of the actions bound to *shortcut* in *context* (and, for widget contexts, under the parent *scope*).
+        """
+        return list(self._bindings.get((normalize_shortcut(shortcut), context, scope), ()))
+
+    def conflicts(self) -> list[ShortcutConflict]:
+        """
+        Returns every conflict currently in the registry.
+        """
+        conflicts: list[ShortcutConflict] = []
+        for key in self._bindings:
+            conflict: ShortcutConflict | None = self._conflict_at(key)
+            if conflict is not None and (key[1] is not ShortcutContexts.WINDOW or conflict.context is ShortcutContexts.WINDOW):
+                # an application/window conflict is reported once, under the application key
+                conflicts.append(conflict)
+        return conflicts
+
+    def apply_keymap(self, keymap: dict[str, str | list[str] | None]) -> ActionRegistry:
+        """
+        Rebinds every action of *keymap* in one pass; ids of unregistered actions are ignored.
+        """
+        self._bulk_touched = {}
+        suspended: list[QWidget] = []
+        try:
+            for action_id in keymap:
+                action: Action | None = self._actions.get(action_id)
+                if action is None:
+                    continue
+                for associated in action.get.associatedObjects():
+                    if isinstance(associated, QWidget) and associated.updatesEnabled():
+                        associated.setUpdatesEnabled(False)
+                        suspended.append(associated)
+
+            for action_id, shortcuts in keymap.items():
+                if action_id in self._actions:
+                    self.bind(action_id, shortcuts)
+        finally:
+            touched: dict[_BindingKey, None] = self._bulk_touched
+            self._bulk_touched = None
+            for widget in suspended:
+                widget.setUpdatesEnabled(True)
+
+        reported: set[_BindingKey] = set()
+        for key in touched:
+            conflict: ShortcutConflict | None = self._conflict_at(key)
+            if conflict is not None:
+                conflict_key: _BindingKey = (conflict.shortcut, conflict.context, key[2])
+                if conflict_key not in reported:
+                    reported.add(conflict_key)
+                    [callback(conflict) for callback in self._conflict_listeners]
+        return self
+
+    def load_keymap(self, path: str) -> ActionRegistry:
+        """
+        Applies the keymap stored as JSON in *path*, see :meth:`apply_keymap`.
+        """
+        with open(path, 'r', encoding='utf-8') as keymap_file:
+            keymap: dict[str, str | list[str] | None] = json.load(keymap_file)
+        if not isinstance(keymap, dict):
+            raise ValueError(f'{path} does not hold a keymap object')
+        return self.apply_keymap(keymap)
+
+    def keymap(self) -> dict[str, list[str]]:
+        """
+        Returns the shortcuts of every registered action, as accepted by :meth:`apply_keymap`.
+        """
+        return {
+            action_id: [normalize_shortcut(shortcut) for shortcut in action.get.shortcuts()]
+            for action_id, action in self._actions.items()
+        }
+
+    def save_keymap(self, path: str) -> ActionRegistry:
+        with open(path, 'w', encoding='utf-8') as keymap_file:
+            json.dump(self.keymap(), keymap_file, indent=4)
+        return self
+
+    def _keys_of(self, action: Action) -> tuple[_BindingKey, ...]:
+        context = ShortcutContexts(action.get.shortcutContext().value)
+        scope: Hashable = None
+        if context in (ShortcutContexts.WIDGET, ShortcutContexts.WIDGET_WITH_CHILDREN):
+            scope = action.get.parent()
+        keys: Iterable[_BindingKey] = (
+            (normalize_shortcut(shortcut), context, scope) for shortcut in action.get.shortcuts() if not shortcut.isEmpty()
+        )
+        return tuple(dict.fromkeys(keys))
+
+    def _action_changed(self, built_action: QAction):
+        action_id: str | None = self._action_ids.get(built_action)
+        if action_id is not None:
+            self._reindex(action_id)
+
+    def _reindex(self, action_id: str):
+        action: Action | None = self._actions.get(action_id)
+        if action is None:
+            return
+
+        keys: tuple[_BindingKey, ...] = self._keys_of(action)
+        if keys == self._keys.get(action_id, ()):
+            return
+
+        self._unindex(action_id)
+        self._keys[action_id] = keys
+        for key in keys:
+            self._bindings.setdefault(key, {})[action_id] = None
+            if self._bulk_touched is not None:
+                self._bulk_touched[key] = None
+                continue
+
+            conflict: ShortcutConflict | None = self._conflict_at(key)
+            if conflict is not None:
+                [callback(conflict) for callback in self._conflict_listeners]
+
+    def _unindex(self, action_id: str):
+        for key in self._keys.pop(action_id, ()):
+            bound: dict[str, None] = self._bindings[key]
+            del bound[action_id]
+            if not bound:
+                del self._bindings[key]
+
+    def _conflict_at(self, key: _BindingKey) -> ShortcutConflict | None:
+        shortcut, context, scope = key
+        action_ids: dict[str, None] = dict(self._bindings.get(key, {}))
+        if context is ShortcutContexts.APPLICATION:
+            action_ids.update(self._bindings.get((shortcut, ShortcutContexts.WINDOW, None), {}))
+        elif context is ShortcutContexts.WINDOW:
+            application_ids: dict[str, None] = self._bindings.get((shortcut, ShortcutContexts.APPLICATION, None), {})
+            if application_ids:
+                context = ShortcutContexts.APPLICATION
+                action_ids = {**application_ids, **action_ids}
+
+        if len(action_ids) < 2:
+            return None
+        return ShortcutConflict(shortcut, context, tuple(action_ids))
@@ -0,0 +1,315 @@
+from __future__ import annotations
+
+import heapq
+import re
+from collections import Counter
+from typing import NamedTuple
+
+from PySide6.QtGui import QAction
+
+from eui.facade.core.sender_relay import SenderRelay
+from eui.facade.gui.action import Action
+from eui.facade.gui.action_registry import ActionRegistry
+
+
+_TAG: re.Pattern = re.compile(r'<[^>]*>')
+_WORD: re.Pattern = re.compile(r'[^\W_]+')
+_LEADING_LENGTH: int = 3  #: length of the text prefixes indexed
+_WORD_PREFIX_LENGTH: int = 2  #: length of the word prefixes indexed, query words shorter than a trigram are looked up there
+_FUZZY_SIMILARITY: float = 0.5  #: share of the trigrams of a mistyped query word an indexed word must have to match it
+_START_SCORE: float = 100.0  #: score of a text starting with the query, the highest
+_WORD_START_SCORE: float = 90.0  #: score of a text with the query at a word start, the highest of the others
+
+
+class CommandMatch(NamedTuple):
+    action_id: str
+    action: Action
+    score: float
+
+
+def strip_mnemonic(text: str) -> str:
+    """
+    Returns *text* without its mnemonic markers: ``&`` is dropped and ``&&`` stands for a literal ``&``.
+    """
+    return text.replace('&&', '\0').replace('&', '').replace('\0', '&')
+
+
+def _trigrams(words: list[str]) -> set[str]:
+    """
+    Returns the trigrams of each of *words*, padded so that word starts make their own trigrams. Word ends are not, so that a word
+    being typed matches the words it starts.
+    """
+    trigrams: set[str] = set()
+    for word in words:
+        padded: str = f'  {word}'
+        trigrams.update(padded[index:index + 3] for index in range(len(padded) - 2))
+    return trigrams
+
+
+class _Document:
+    __slots__ = (
+        'action_id',
+        'action',
+        'primary',
+        'secondary',
+        'words',
+        'trigrams',
+        'word_prefixes'
+    )
+
+    def __init__(self, action_id: str, action: Action):
+        built_action: QAction = action.get
+        text: str = strip_mnemonic(built_action.text())
+        icon_text: str = strip_mnemonic(built_action.iconText())
+        self.action_id: str = action_id
+        self.action: Action = action
+        self.primary: str = ' '.join((text if icon_text == text else f'{text} {icon_text}').lower().split())
+        self.secondary: str = ' '.join(
+            part for part in (built_action.toolTip(), built_action.statusTip(), _TAG.sub(' ', built_action.whatsThis())) if part
+        ).lower()
+
+        primary_words: list[str] = _WORD.findall(self.primary)
+        self.words: set[str] = set(primary_words) | set(_WORD.findall(self.secondary))
+        self.trigrams: set[str] = _trigrams(self.words)
+        self.word_prefixes: set[str] = {
+            word[:length] for word in primary_words for length in range(1, min(len(word), _WORD_PREFIX_LENGTH) + 1)
+        }
+
+    @property
+    def leading(self) -> list[str]:
+        return [self.primary[:length] for length in range(1, min(len(self.primary), _LEADING_LENGTH) + 1)]
+
+    @property
+    def available(self) -> bool:
+        return self.action.get.isEnabled() and self.action.get.isVisible()
+
+
+class CommandIndex:
+    """
+    Incremental search index over the texts of actions (text, icon text, tooltip, status tip and what's this), for a command
+    palette.
+
+    Actions are indexed by the words of their texts, and by the first letters of the words of their text and of their text
+    itself. Query words are matched against the vocabulary of indexed words through its trigrams: a query word matches the words
+    it starts, or, if none, the words sharing most of its trigrams, which tolerates typos. The vocabulary being far smaller than
+    the set of actions, this stays cheap with any number of actions. Each query word narrows the candidates, so words can be given
+    in any order.
+
+    Candidates are ranked a match at the start of the text first, then at a word start, then anywhere in the text, then in the
+    other texts, then fuzzy matches, shorter texts first. They are scored from the shortest text, those starting like the query
+    first, and scoring stops as soon as no candidate left can make it to the *k* best. Actions are reindexed when they emit
+    ``changed``, which also keeps track of disabled and hidden actions.
+    """
+    __slots__ = (
+        '_documents',
+        '_word_actions',
+        '_vocabulary_trigrams',
+        '_word_prefixes',
+        '_leading',
+        '_lengths',
+        '_unavailable',
+        '_action_ids',
+        '_relay'
+    )
+
+    def __init__(self):
+        self._documents: dict[str, _Document] = {}
+        self._word_actions: dict[str, set[str]] = {}  #: actions having each word of the vocabulary
+        self._vocabulary_trigrams: dict[str, set[str]] = {}  #: words of the vocabulary having each trigram
+        self._word_prefixes: dict[str, set[str]] = {}
+        self._leading: dict[str, set[str]] = {}
+        self._lengths: dict[str, int] = {}
+        self._unavailable: set[str] = set()  #: disabled or hidden actions
+        self._action_ids: dict[QAction, str] = {}
+        self._relay: SenderRelay = SenderRelay(self._action_changed)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def __contains__(self, action_id: str) -> bool:
+        return action_id in self._documents
+
+    def add(self, action_id: str, action: Action) -> CommandIndex:
+        """
+        Indexes *action* under *action_id*, replacing the action indexed under that id if any.
+        """
+        if action_id in self._documents:
+            self.remove(action_id)
+
+        self._index(_Document(action_id, action))
+        self._action_ids[action.get] = action_id
+        action.get.changed.connect(self._relay.relay)
+        return self
+
+    def remove(self, action_id: str) -> CommandIndex:
+        document: _Document = self._documents[action_id]
+        self._unindex(document)
+        self._action_ids.pop(document.action.get, None)
+        try:
+            document.action.get.changed.disconnect(self._relay.relay)
+        except RuntimeError:
+            # the QAction is already deleted
+            pass
+        return self
+
+    def attach(self, registry: ActionRegistry) -> CommandIndex:
+        """
+        Indexes every action of *registry*, and follows the actions registered and unregistered from now on.
+        """
+        for action_id, action in registry.items():
+            self.add(action_id, action)
+        registry.on_registered(self.add)
+        registry.on_unregistered(self._unregistered)
+        return self
+
+    def search(self, query: str, k: int = 20, available_only: bool = True) -> list[CommandMatch]:
+        """
+        Returns the *k* best matches for *query*, best first. An empty query matches nothing.
+        """
+        query = ' '.join(strip_mnemonic(query).lower().split())
+        words: list[str] = _WORD.findall(query)
+        if not words or k <= 0:
+            return []
+
+        candidates: set[str] | None = None
+        for word in words:
+            if len(word) <= _WORD_PREFIX_LENGTH:
+                matching: set[str] = self._word_prefixes.get(word, set())
+            else:
+                matching_words: list[str] = self._matching_words(word)
+                matching = set().union(*(self._word_actions[matching_word] for matching_word in matching_words))
+            candidates = matching if candidates is None else candidates & matching
+            if not candidates:
+                return []
+
+        if available_only:
+            candidates = candidates - self._unavailable
+
+        # only a text starting like the query can match at its start, the others score at most a match at a word start
+        leading: set[str] = candidates & self._leading.get(query[:_LEADING_LENGTH], set())
+        best: list[tuple[float, int, CommandMatch]] = []  #: the k best matches so far, worst first, by score then by scoring order
+        sequence: int = 0
+        for pool, best_score in ((leading, _START_SCORE), (candidates - leading, _WORD_START_SCORE)):
+            lengths: list[tuple[int, str]] = [(self._lengths[action_id], action_id) for action_id in pool]
+            heapq.heapify(lengths)
+            while lengths:
+                length, action_id = heapq.heappop(lengths)
+                if len(best) == k and best[0][0] >= best_score - length / 1000:
+                    # no candidate left, all with longer texts, can score higher
+                    break
+                document: _Document = self._documents[action_id]
+                score: float = self._score(document, query, words)
+                if score > 0:
+                    sequence -= 1
+                    entry: tuple[float, int, CommandMatch] = (score, sequence, CommandMatch(action_id, document.action, score))
+                    if len(best) < k:
+                        heapq.heappush(best, entry)
+                    elif entry > best[0]:
+                        heapq.heapreplace(best, entry)
+        return [match for _, _, match in sorted(best, reverse=True)]
+
+    def _matching_words(self, word: str) -> list[str]:
+        """
+        Returns the words of the vocabulary starting with *word* or, if there are none, the ones sharing most of its trigrams.
+        """
+        postings: list[set[str]] = sorted((self._vocabulary_trigrams.get(trigram, set()) for trigram in _trigrams([word])), key=len)
+        matching: list[str] = [candidate for candidate in postings[0].intersection(*postings[1:]) if candidate.startswith(word)]
+        if matching:
+            return matching
+
+        counts: Counter = Counter()
+        for posting in postings:
+            counts.update(posting)
+        threshold: float = len(postings) * _FUZZY_SIMILARITY
+        return [candidate for candidate, count in counts.items() if count >= threshold]
+
+    @staticmethod
+    def _score(document: _Document, query: str, words: list[str]) -> float:
+        primary: str = document.primary
+        position: int = primary.find(query)
+        if position == 0:
+            score: float = _START_SCORE
+        elif position > 0 and not primary[position - 1].isalnum():
+            score = _WORD_START_SCORE
+        elif position > 0:
+            score = 70.0
+        else:
+            # words matched separately, in any order
+            score = 0.0
+            for word in words:
+                word_position: int = primary.find(word)
+                if word_position == 0 or (word_position > 0 and not primary[word_position - 1].isalnum()):
+                    score += 60.0
+                elif word_position > 0:
+                    score += 45.0
+                elif word in document.secondary:
+                    score += 30.0
+                else:
+                    word_trigrams: set[str] = _trigrams([word])
+                    score += 25.0 * len(word_trigrams & document.trigrams) / len(word_trigrams)
+            score /= len(words)
+            if score < 10.0:
+                return 0.0
+        # shorter texts first among equal matches
+        return score - len(primary) / 1000
+
+    def _index(self, document: _Document):
+        action_id: str = document.action_id
+        self._documents[action_id] = document
+        self._lengths[action_id] = len(document.primary)
+        for word in document.words:
+            word_actions: set[str] | None = self._word_actions.get(word)
+            if word_actions is None:
+                word_actions = self._word_actions[word] = set()
+                for trigram in _trigrams([word]):
+                    self._vocabulary_trigrams.setdefault(trigram, set()).add(word)
+            word_actions.add(action_id)
+        for prefix in document.word_prefixes:
+            self._word_prefixes.setdefault(prefix, set()).add(action_id)
+        for prefix in document.leading:
+            self._leading.setdefault(prefix, set()).add(action_id)
+        if not document.available:
+            self._unavailable.add(action_id)
+
+    def _unindex(self, document: _Document):
+        action_id: str = document.action_id
+        del self._documents[action_id]
+        del self._lengths[action_id]
+        self._unavailable.discard(action_id)
+        for word in document.words:
+            word_actions: set[str] = self._word_actions[word]
+            word_actions.discard(action_id)
+            if not word_actions:
+                # the word leaves the vocabulary
+                del self._word_actions[word]
+                for trigram in _trigrams([word]):
+                    vocabulary: set[str] = self._vocabulary_trigrams[trigram]
+                    vocabulary.discard(word)
+                    if not vocabulary:
+                        del self._vocabulary_trigrams[trigram]
+        for postings, keys in ((self._word_prefixes, document.word_prefixes), (self._leading, document.leading)):
+            for key in keys:
+                posting: set[str] = postings[key]
+                posting.discard(action_id)
+                if not posting:
+                    del postings[key]
+
+    def _action_changed(self, built_action: QAction):
+        action_id: str | None = self._action_ids.get(built_action)
+        document: _Document | None = self._documents.get(action_id) if action_id is not None else None
+        if document is None:
+            return
+
+        updated = _Document(action_id, document.action)
+        if updated.primary != document.primary or updated.secondary != document.secondary:
+            self._unindex(document)
+            self._index(updated)
+        elif updated.available:
+            # changed is also emitted for enabled, visible, checked or shortcut changes, which leave the texts as they are
+            self._unavailable.discard(action_id)
+        else:
+            self._unavailable.add(action_id)
+
+    def _unregistered(self, action_id: str, _: Action):
+        if action_id in self._documents:
+            self.remove(action_id)
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, NamedTuple
+
+from PySide6.QtCore import QObject, QSize, Signal
+from PySide6.QtGui import QIcon, QImage, QImageReader, QPixmap
+
+
+class IconKey(NamedTuple):
+    """
+    Identifies a decoded icon: the image file, its logical size, the device pixel ratio it is rendered for and its mode/state.
+    A size of 0 x 0 keeps the size of the image file.
+    """
+    path: str
+    width: int = 0
+    height: int = 0
+    device_pixel_ratio: float = 1.0
+    mode: QIcon.Mode = QIcon.Mode.Normal
+    state: QIcon.State = QIcon.State.Off
+
+
+def _decode(key: IconKey) -> QImage:
+    """
+    Reads the image of *key* at its device size, straight from the file: the decoder scales while decoding when the format allows it.
+    """
+    reader = QImageReader(key.path)
+    reader.setAutoTransform(True)
+    if key.width > 0 and key.height > 0:
+        reader.setScaledSize(QSize(round(key.width * key.device_pixel_ratio), round(key.height * key.device_pixel_ratio)))
+    image: QImage = reader.read()
+    if not image.isNull():
+        image.setDevicePixelRatio(key.device_pixel_ratio)
+    return image
+
+
+def _pixmap_bytes(pixmap: QPixmap) -> int:
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class _DecodeSignals(QObject):
+    decoded = Signal(object, object)
+
+
+class IconCache:
+    """
+    Shared cache of decoded icon pixmaps, keyed by :class:`IconKey`, so that an image file used by many actions is decoded once
+    per size and device pixel ratio.
+
+    Pixmaps are evicted least recently used first once they use more than *max_bytes*. :meth:`request` decodes images on worker
+    threads and converts them to pixmaps on the GUI thread (pixmaps can only be created there), calling back once done;
+    :meth:`pixmap` decodes synchronously on a miss. Concurrent requests for the same key share a single decoding.
+
+    Pixmaps and icons returned are shared: they must not be painted on.
+    """
+    __slots__ = (
+        '_pixmaps',
+        '_max_bytes',
+        '_bytes',
+        '_executor',
+        '_signals',
+        '_pending',
+        '_hits',
+        '_misses',
+        '_evictions',
+        '_decode_failures',
+        '__weakref__'
+    )
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, workers: int = 2):
+        if max_bytes <= 0:
+            raise ValueError(f'max_bytes must be strictly positive, got {max_bytes}')
+
+        self._pixmaps: OrderedDict[IconKey, QPixmap] = OrderedDict()
+        self._max_bytes: int = max_bytes
+        self._bytes: int = 0
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='eui-icon')
+        self._signals: _DecodeSignals = _DecodeSignals()
+        self._signals.decoded.connect(self._on_decoded)
+        self._pending: dict[IconKey, list[Callable[[QPixmap], None]]] = {}
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._decode_failures: int = 0
+
+    def pixmap(self, key: IconKey) -> QPixmap:
+        """
+        Returns the pixmap of *key*, decoding it now on a miss. A null pixmap is returned (and not cached) if the file cannot be read.
+        """
+        pixmap: QPixmap | None = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            self._hits += 1
+            return pixmap
+
+        self._misses += 1
+        return self._insert(key, _decode(key))
+
+    def icon(self, key: IconKey) -> QIcon:
+        return QIcon(self.pixmap(key))
+
+    def request(self, key: IconKey, callback: Callable[[QPixmap], None]) -> IconCache:
+        """
+        Calls *callback* with the pixmap of *key*: right away on a hit, otherwise from the GUI thread once a worker decoded it.
+        """
+        pixmap: QPixmap | None = self._pixmaps.get(key)
+        if pixmap is not None:
+            self._pixmaps.move_to_end(key)
+            self._hits += 1
+            callback(pixmap)
+            return self
+
+        pending: list[Callable[[QPixmap], None]] | None = self._pending.get(key)
+        if pending is not None:
+            pending.append(callback)
+            return self
+
+        self._misses += 1
+        self._pending[key] = [callback]
+        future: Future = self._executor.submit(_decode, key)
+        future.add_done_callback(lambda done: self._signals.decoded.emit(key, done))
+        return self
+
+    def prefetch(self, keys: list[IconKey]) -> IconCache:
+        """
+        Starts decoding the *keys* not cached yet in the background.
+        """
+        for key in keys:
+            if key not in self._pixmaps and key not in self._pending:
+                self.request(key, lambda _: None)
+        return self
+
+    def clear(self) -> IconCache:
+        self._pixmaps.clear()
+        self._bytes = 0
+        return self
+
+    def reset_stats(self) -> IconCache:
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._decode_failures = 0
+        return self
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        return self._evictions
+
+    @property
+    def decode_failures(self) -> int:
+        return self._decode_failures
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Returns the ratio of requests served from the cache, between 0 and 1 (0 when nothing was requested yet).
+        """
+        requests: int = self._hits + self._misses
+        return self._hits / requests if requests else 0.0
+
+    def __len__(self) -> int:
+        return len(self._pixmaps)
+
+    def __contains__(self, key: IconKey) -> bool:
+        return key in self._pixmaps
+
+    def __repr__(self) -> str:
+        return (
+            f'IconCache(size={len(self._pixmaps)}, bytes={self._bytes}/{self._max_bytes}, hits={self._hits}, misses={self._misses}, '
+            f'evictions={self._evictions}, decode_failures={self._decode_failures})'
+        )
+
+    def _insert(self, key: IconKey, image: QImage) -> QPixmap:
+        if image.isNull():
+            self._decode_failures += 1
+            return QPixmap()
+
+        pixmap: QPixmap = QPixmap.fromImage(image)
+        if key.mode is not QIcon.Mode.Normal or key.state is not QIcon.State.Off:
+            pixmap = QIcon(pixmap).pixmap(QSize(image.width(), image.height()), 1.0, key.mode, key.state)
+            pixmap.setDevicePixelRatio(key.device_pixel_ratio)
+
+        replaced: QPixmap | None = self._pixmaps.pop(key, None)
+        if replaced is not None:
+            self._bytes -= _pixmap_bytes(replaced)
+        self._pixmaps[key] = pixmap
+        self._bytes += _pixmap_bytes(pixmap)
+        while self._bytes > self._max_bytes and len(self._pixmaps) > 1:
+            _, evicted = self._pixmaps.popitem(last=False)
+            self._bytes -= _pixmap_bytes(evicted)
+            self._evictions += 1
+        return pixmap
+
+    def _on_decoded(self, key: IconKey, future: Future):
+        callbacks: list[Callable[[QPixmap], None]] = self._pending.pop(key, [])
+        if future.cancelled():
+            return
+
+        pixmap: QPixmap = self._insert(key, future.result())
+        [callback(pixmap) for callback in callbacks]
+
+
+_DEFAULT_CACHE: IconCache | None = None
+
+
+def icon_cache() -> IconCache:
+    """
+    Returns the application-wide icon cache, created on first use (after the application object).
+    """
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = IconCache()
+    return _DEFAULT_CACHE
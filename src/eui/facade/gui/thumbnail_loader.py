@@ -0,0 +1,326 @@
+from __future__ import annotations
+
+import hashlib
+import heapq
+import itertools
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Callable, Iterable, NamedTuple
+
+from PySide6.QtCore import QObject, QSize, QStandardPaths, Qt, Signal
+from PySide6.QtGui import QImage, QImageReader
+
+
+VISIBLE_PRIORITY: int = 0
+PREFETCH_PRIORITY: int = 1
+_PRUNE_EVERY: int = 64  #: thumbnails written to disk between two checks of the size of the disk cache
+
+
+class ThumbnailKey(NamedTuple):
+    """
+    Identifies a thumbnail: an image file in a given version (modification time and size) at a given edge length.
+    """
+    path: str
+    modified: float
+    size: int
+    edge: int
+
+    @property
+    def digest(self) -> str:
+        return hashlib.sha1(f'{self.path}\0{self.modified!r}\0{self.size}\0{self.edge}'.encode('utf-8', 'surrogatepass')).hexdigest()
+
+
+def _default_cache_directory() -> str:
+    location: str = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    return os.path.join(location or tempfile.gettempdir(), 'eui-thumbnails')
+
+
+def _decode(key: ThumbnailKey) -> QImage:
+    """
+    Reads the image of *key* scaled down to fit its edge: the decoder scales while decoding when the format allows it (JPEG
+    decodes straight at a fraction of its size), which is far cheaper than decoding at full size then scaling.
+    """
+    reader = QImageReader(key.path)
+    reader.setAutoTransform(True)
+    size: QSize = reader.size()
+    if size.isValid() and (size.width() > key.edge or size.height() > key.edge):
+        reader.setScaledSize(size.scaled(key.edge, key.edge, Qt.AspectRatioMode.KeepAspectRatio))
+    return reader.read()
+
+
+class _ThumbnailSignals(QObject):
+    ready = Signal(object, object)  #: ThumbnailKey, QImage (null if the file could not be read)
+
+
+class ThumbnailLoader:
+    """
+    Generates thumbnails of image files on worker threads, most urgent first, with a persistent cache on disk.
+
+    Requests are served from a priority queue: thumbnails of the visible items first, then the ones to prefetch, the oldest
+    request first within a priority. :meth:`set_visible` states which thumbnails are needed now, cancelling the pending requests
+    of items scrolled out of view. Thumbnails are kept in memory (the last used, up to *memory_limit* bytes of pixels) and on
+    disk under *cache_directory*, named after a hash of the path, modification time, size and edge, so that a modified file gets
+    a new thumbnail. The disk cache is kept under *disk_limit* bytes: when it grows over, the least recently used thumbnails
+    are deleted (a thumbnail read from disk is touched), when the loader starts and then every few dozen thumbnails written.
+
+    :meth:`request` and :meth:`thumbnail` are called from the GUI thread, where the ready listeners are also called.
+    """
+    __slots__ = (
+        '_edge',
+        '_cache_directory',
+        '_memory',
+        '_memory_limit',
+        '_memory_bytes',
+        '_queue',
+        '_pending',
+        '_in_progress',
+        '_sequence',
+        '_condition',
+        '_stopping',
+        '_workers',
+        '_signals',
+        '_ready_listeners',
+        '_decoded_count',
+        '_disk_hits',
+        '_cancelled_count',
+        '_disk_limit',
+        '_written_count',
+        '_pruning',
+        '__weakref__'
+    )
+
+    def __init__(
+        self,
+        edge: int = 96,
+        workers: int = None,
+        cache_directory: str = None,
+        memory_limit: int = 64 * 1024 * 1024,
+        disk_limit: int = 256 * 1024 * 1024
+    ):
+        self._edge: int = edge
+        self._cache_directory: str = cache_directory if cache_directory is not None else _default_cache_directory()
+        os.makedirs(self._cache_directory, exist_ok=True)
+        self._memory: OrderedDict[ThumbnailKey, QImage] = OrderedDict()
+        self._memory_limit: int = memory_limit
+        self._memory_bytes: int = 0
+        self._queue: list[tuple[int, int, ThumbnailKey]] = []  #: (priority, sequence, key), entries not in _pending are stale
+        self._pending: dict[ThumbnailKey, tuple[int, int]] = {}  #: (priority, sequence) of the live queue entry of each pending key
+        self._in_progress: set[ThumbnailKey] = set()  #: taken by a worker, not ready yet
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._stopping: bool = False
+        self._signals = _ThumbnailSignals()
+        self._signals.ready.connect(self._on_ready)
+        self._ready_listeners: list[Callable[[ThumbnailKey, QImage], None]] = []
+        self._decoded_count: int = 0
+        self._disk_hits: int = 0
+        self._cancelled_count: int = 0
+        self._disk_limit: int = disk_limit
+        self._written_count: int = 0
+        self._pruning: bool = False
+
+        worker_count: int = workers if workers is not None else max(1, min(4, (os.cpu_count() or 2) - 1))
+        self._workers: list[threading.Thread] = [
+            threading.Thread(target=self._work, name=f'eui-thumbnail-{index}', daemon=True) for index in range(worker_count)
+        ]
+        [worker.start() for worker in self._workers]
+        threading.Thread(target=self._prune_disk_cache, name='eui-thumbnail-prune', daemon=True).start()
+
+    @property
+    def edge(self) -> int:
+        return self._edge
+
+    @property
+    def cache_directory(self) -> str:
+        return self._cache_directory
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memory_bytes
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    @property
+    def decoded_count(self) -> int:
+        return self._decoded_count
+
+    @property
+    def disk_hits(self) -> int:
+        return self._disk_hits
+
+    @property
+    def cancelled_count(self) -> int:
+        return self._cancelled_count
+
+    def key(self, path: str, modified: float, size: int) -> ThumbnailKey:
+        return ThumbnailKey(path, modified, size, self._edge)
+
+    def on_ready(self, callback: Callable[[ThumbnailKey, QImage], None]) -> ThumbnailLoader:
+        """
+        Registers *callback* as a listener for a thumbnail being generated or read from the disk cache
+        :param callback: ``def on_ready(self, key: ThumbnailKey, thumbnail: QImage)``
+        """
+        self._ready_listeners.append(callback)
+        return self
+
+    def remove_ready_listener(self, callback: Callable[[ThumbnailKey, QImage], None]) -> ThumbnailLoader:
+        if callback in self._ready_listeners:
+            self._ready_listeners.remove(callback)
+        return self
+
+    def thumbnail(self, key: ThumbnailKey) -> QImage | None:
+        """
+        Returns the thumbnail of *key* if it is in memory (a null image if the file could not be read), ``None`` otherwise.
+        """
+        image: QImage | None = self._memory.get(key)
+        if image is not None:
+            self._memory.move_to_end(key)
+        return image
+
+    def request(self, key: ThumbnailKey, priority: int = VISIBLE_PRIORITY) -> ThumbnailLoader:
+        """
+        Queues the generation of the thumbnail of *key* unless it is in memory; a pending request of lower priority is promoted.
+        """
+        if key in self._memory:
+            return self
+        with self._condition:
+            pending: tuple[int, int] | None = self._pending.get(key)
+            if key not in self._in_progress and (pending is None or pending[0] > priority):
+                self._push(key, priority)
+                self._condition.notify()
+        return self
+
+    def set_visible(self, visible: Iterable[ThumbnailKey], prefetch: Iterable[ThumbnailKey] = ()) -> ThumbnailLoader:
+        """
+        Makes the thumbnails of *visible* the most urgent, then those of *prefetch*, and cancels every other pending request.
+        """
+        with self._condition:
+            previous: dict[ThumbnailKey, tuple[int, int]] = self._pending
+            self._pending = {}
+            for priority, keys in ((VISIBLE_PRIORITY, visible), (PREFETCH_PRIORITY, prefetch)):
+                for key in keys:
+                    if key not in self._memory and key not in self._pending and key not in self._in_progress:
+                        self._push(key, priority)
+            self._cancelled_count += sum(1 for key in previous if key not in self._pending)
+            if len(self._queue) > 4 * len(self._pending) + 64:
+                # drop the stale entries rather than letting them pile up
+                self._queue = [entry for entry in self._queue if self._pending.get(entry[2]) == entry[:2]]
+                heapq.heapify(self._queue)
+            self._condition.notify_all()
+        return self
+
+    def cancel_all(self) -> ThumbnailLoader:
+        return self.set_visible(())
+
+    def shutdown(self) -> None:
+        with self._condition:
+            self._stopping = True
+            self._condition.notify_all()
+        [worker.join() for worker in self._workers]
+
+    def _push(self, key: ThumbnailKey, priority: int):
+        sequence: int = next(self._sequence)
+        self._pending[key] = (priority, sequence)
+        heapq.heappush(self._queue, (priority, sequence, key))
+
+    def _work(self):
+        while True:
+            with self._condition:
+                while not self._stopping and not self._pending:
+                    self._condition.wait()
+                if self._stopping:
+                    return
+                priority, sequence, key = heapq.heappop(self._queue)
+                if self._pending.get(key) != (priority, sequence):
+                    # cancelled, or queued again at another priority
+                    continue
+                del self._pending[key]
+                self._in_progress.add(key)
+
+            try:
+                image: QImage = self._load(key)
+            except Exception:
+                # a file the decoder or the disk cache fails on gets a null thumbnail rather than stopping the worker
+                image = QImage()
+            self._signals.ready.emit(key, image)
+
+    def _load(self, key: ThumbnailKey) -> QImage:
+        cache_path: str = os.path.join(self._cache_directory, f'{key.digest}.png')
+        image = QImage(cache_path)
+        if not image.isNull():
+            with self._condition:
+                self._disk_hits += 1
+            try:
+                # the modification time orders the disk cache from the least recently used
+                os.utime(cache_path)
+            except OSError:
+                pass
+            return image
+
+        image = _decode(key)
+        with self._condition:
+            self._decoded_count += 1
+        if not image.isNull():
+            temporary_path: str = f'{cache_path}.{threading.get_ident()}.tmp'
+            if image.save(temporary_path, 'PNG', 90):
+                os.replace(temporary_path, cache_path)
+                with self._condition:
+                    self._written_count += 1
+                    prune: bool = self._written_count % _PRUNE_EVERY == 0
+                if prune:
+                    self._prune_disk_cache()
+        return image
+
+    def _prune_disk_cache(self):
+        """
+        Deletes the least recently used thumbnails of the disk cache until it is back to 3/4 of its limit, if it went over.
+        """
+        with self._condition:
+            if self._pruning:
+                return
+            self._pruning = True
+        try:
+            thumbnails: list[tuple[float, int, str]] = []
+            with os.scandir(self._cache_directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.png'):
+                        try:
+                            stat: os.stat_result = entry.stat()
+                        except OSError:
+                            continue
+                        thumbnails.append((stat.st_mtime, stat.st_size, entry.path))
+            total: int = sum(size for _, size, _ in thumbnails)
+            if total <= self._disk_limit:
+                return
+            thumbnails.sort()
+            for _, size, path in thumbnails:
+                if total <= self._disk_limit * 3 // 4:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+        except OSError:
+            pass
+        finally:
+            with self._condition:
+                self._pruning = False
+
+    def _on_ready(self, key: ThumbnailKey, image: QImage):
+        with self._condition:
+            self._in_progress.discard(key)
+        previous: QImage | None = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= previous.sizeInBytes()
+        self._memory[key] = image
+        self._memory_bytes += image.sizeInBytes()
+        # the newest thumbnail is kept even if larger than the limit on its own
+        while self._memory_bytes > self._memory_limit and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= evicted.sizeInBytes()
+        [callback(key, image) for callback in self._ready_listeners]
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import math
+import time
+from typing import Callable
+
+from PySide6.QtCore import QObject, QTimer, Qt
+
+
+class TriggerCoalescer(QObject):
+    """
+    Slot of ``triggered`` bounding how often a handler runs, e.g. when a shortcut is held down and auto-repeat triggers its action
+    at the keyboard repeat rate.
+
+    * *max_rate*: the handler runs at most *max_rate* times per second (no limit if 0);
+    * *skip_while_running*: triggers arriving while the handler runs, including the ones queued in the event loop meanwhile, are
+      skipped rather than run one after the other once it returns;
+    * *latest_wins*: a skipped trigger is not dropped but deferred, and the triggers deferred together run the handler once, as
+      soon as the rate and the previous run allow it. A held shortcut then ends with a run for its last trigger. Only triggers
+      skipped by one of the other two options are deferred, so it requires one of them.
+
+    The coalescer belongs to the QAction it is connected to.
+    """
+
+    def __init__(
+        self,
+        parent: QObject,
+        callback: Callable[[], None],
+        max_rate: float = 0.0,
+        latest_wins: bool = False,
+        skip_while_running: bool = False
+    ):
+        super().__init__(parent)
+        if max_rate < 0:
+            raise ValueError(f'max_rate must be positive, got {max_rate}')
+        if latest_wins and not max_rate and not skip_while_running:
+            raise ValueError('latest_wins requires max_rate or skip_while_running, without them no trigger is ever skipped')
+
+        self._callback: Callable[[], None] = callback
+        self._interval_ms: float = 1000.0 / max_rate if max_rate > 0 else 0.0
+        self._latest_wins: bool = latest_wins
+        self._skip_while_running: bool = skip_while_running
+        self._running: bool = False  #: from a run until the event loop processed the triggers queued meanwhile
+        self._pending: bool = False
+        self._last_run_ms: float = -math.inf
+        self._run_count: int = 0
+        self._coalesced_count: int = 0
+
+        self._deferred_timer = QTimer(self)
+        self._deferred_timer.setSingleShot(True)
+        self._deferred_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._deferred_timer.timeout.connect(self._run_deferred)
+        self._settle_timer = QTimer(self)
+        self._settle_timer.setSingleShot(True)
+        self._settle_timer.setInterval(0)
+        self._settle_timer.timeout.connect(self._settled)
+
+    @property
+    def run_count(self) -> int:
+        return self._run_count
+
+    @property
+    def coalesced_count(self) -> int:
+        """
+        Number of triggers skipped or merged into another run.
+        """
+        return self._coalesced_count
+
+    @property
+    def pending(self) -> bool:
+        return self._pending
+
+    def trigger(self, *_):
+        if (self._running and self._skip_while_running) or self._remaining_ms() > 0:
+            self._coalesced_count += 1
+            if self._latest_wins:
+                self._pending = True
+                if not self._running:
+                    self._deferred_timer.start(math.ceil(self._remaining_ms()))
+            return
+
+        self._run()
+
+    def _remaining_ms(self) -> float:
+        return self._last_run_ms + self._interval_ms - time.monotonic() * 1000
+
+    def _run(self):
+        self._pending = False
+        self._running = True
+        self._last_run_ms = time.monotonic() * 1000
+        self._run_count += 1
+        try:
+            self._callback()
+        finally:
+            if self._skip_while_running:
+                # the triggers queued while the callback ran are processed before this zero timer fires
+                self._settle_timer.start()
+            else:
+                self._running = False
+
+    def _settled(self):
+        self._running = False
+        if self._pending:
+            self._deferred_timer.start(max(0, math.ceil(self._remaining_ms())))
+
+    def _run_deferred(self):
+        if self._pending and not self._running:
+            self._run()
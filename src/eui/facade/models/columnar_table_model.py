@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Any, Callable, Mapping
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, QObject, Qt
+
+
+CellFormatter = Callable[[Any], str]
+"""
+``def format(value) -> str``: returns the text shown for a cell value, a NumPy scalar.
+"""
+
+RowFilter = Callable[[Mapping[str, np.ndarray]], np.ndarray]
+"""
+``def row_filter(columns: Mapping[str, np.ndarray]) -> np.ndarray``: returns the mask of the source rows to keep, computed on whole
+columns at once, e.g. ``lambda columns: columns['price'] > 100``.
+"""
+
+RAW_VALUE_ROLE: int = Qt.ItemDataRole.UserRole  #: role of the cell values themselves, as Python objects
+_NUMERIC_KINDS: str = 'biufc'
+_RIGHT_ALIGNED = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter
+
+
+def _default_formatter(dtype: np.dtype) -> CellFormatter:
+    if dtype.kind == 'f':
+        return lambda value: format(value, '.6g')
+    if dtype.kind == 'S':
+        return lambda value: value.decode('utf-8', 'replace')
+    return str
+
+
+def _ordered_bits(values: np.ndarray) -> np.ndarray | None:
+    """
+    Returns 32-bit unsigned integers ordered as *values*, or ``None`` if its type does not fit in 32 bits.
+    """
+    kind: str = values.dtype.kind
+    if values.dtype.itemsize > 4 or kind not in 'biuf':
+        return None
+    if kind == 'f':
+        bits: np.ndarray = values.astype(np.float32, copy=False).view(np.uint32)
+        # IEEE floats order as integers once the sign bit is flipped for positive values and every bit for negative ones
+        return np.where(bits & 0x80000000, ~bits, bits | 0x80000000)
+    if kind == 'i':
+        return values.astype(np.int32).view(np.uint32) ^ 0x80000000
+    return values.astype(np.uint32)
+
+
+def _stable_argsort(values: np.ndarray, descending: bool) -> np.ndarray:
+    """
+    Returns the positions of *values* sorted, equal values staying in their order in both directions.
+
+    Values of 32 bits at most are sorted as 64-bit integers made of the value bits then the position: the keys are unique, so a
+    plain sort of the keys is stable, and about 5 times faster than the stable argsort of NumPy.
+    """
+    bits: np.ndarray | None = _ordered_bits(values) if len(values) < 2 ** 32 else None
+    if bits is None:
+        if not descending:
+            return np.argsort(values, kind='stable')
+        # sorting the reversed values then reversing the result keeps the equal values in their order
+        return len(values) - 1 - np.argsort(values[::-1], kind='stable')[::-1]
+
+    if descending:
+        bits = ~bits
+    keys: np.ndarray = bits.astype(np.uint64) << np.uint64(32)
+    keys |= np.arange(len(values), dtype=np.uint64)
+    keys.sort()
+    return keys & np.uint64(0xffffffff)
+
+
+class ColumnarTableModel(QAbstractTableModel):
+    """
+    Table model over columns of a same length, stored as NumPy arrays or buffers (``array.array``, ``memoryview``), used as is.
+
+    Memory is that of the columns themselves: cells are never turned into items, :meth:`data` reads the buffers and formats the
+    cells asked, keeping the texts of the last *format_cache_size* cells (about the visible ones) to paint them again for free.
+
+    Sorting and filtering are vectorized: they compute a permutation of the source rows (4 bytes per shown row, none while the
+    rows are shown unsorted and unfiltered) and never move the column data. Rows keep their source number in the vertical header.
+    The columns may be modified in place, then :meth:`refresh` repaints them.
+    """
+
+    def __init__(self, parent: QObject = None, format_cache_size: int = 16_384):
+        super().__init__(parent)
+        self._names: list[str] = []
+        self._columns: list[np.ndarray] = []
+        self._formatters: list[CellFormatter] = []
+        self._right_aligned: list[bool] = []
+        self._source_row_count: int = 0
+        self._filtered_rows: np.ndarray | None = None  #: source rows kept by the filter, in source order; None keeps them all
+        self._permutation: np.ndarray | None = None  #: source row of each shown row; None shows the source rows in order
+        self._sort_column: int = -1
+        self._sort_order: Qt.SortOrder = Qt.SortOrder.AscendingOrder
+        self._formatted: OrderedDict[tuple[int, int], str] = OrderedDict()
+        self._format_cache_size: int = format_cache_size
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self._names)
+
+    @property
+    def source_row_count(self) -> int:
+        return self._source_row_count
+
+    @property
+    def sort_column(self) -> int:
+        return self._sort_column
+
+    @property
+    def sort_order(self) -> Qt.SortOrder:
+        return self._sort_order
+
+    @property
+    def memory_bytes(self) -> int:
+        """
+        Memory used by the model on top of its columns: the permutation and the filter.
+        """
+        return sum(rows.nbytes for rows in (self._permutation, self._filtered_rows) if rows is not None)
+
+    def set_columns(self, columns: Mapping[str, Any], formatters: Mapping[str, CellFormatter] = None) -> ColumnarTableModel:
+        """
+        Shows *columns*, by name in order, each formatted by its formatter of *formatters* if any. The filter and sort are cleared.
+        """
+        arrays: list[np.ndarray] = [np.asarray(values) for values in columns.values()]
+        if any(array.ndim != 1 for array in arrays):
+            raise ValueError('Columns must be one-dimensional')
+        if len({len(array) for array in arrays}) > 1:
+            raise ValueError(f'Columns must have the same length, got {", ".join(str(len(array)) for array in arrays)}')
+
+        formatters = formatters or {}
+        self.beginResetModel()
+        self._names = list(columns)
+        self._columns = arrays
+        self._formatters = [formatters.get(name) or _default_formatter(array.dtype) for name, array in zip(self._names, arrays)]
+        self._right_aligned = [array.dtype.kind in _NUMERIC_KINDS for array in arrays]
+        self._source_row_count = len(arrays[0]) if arrays else 0
+        self._filtered_rows = None
+        self._permutation = None
+        self._sort_column = -1
+        self._formatted.clear()
+        self.endResetModel()
+        return self
+
+    def set_formatter(self, column: int | str, formatter: CellFormatter) -> ColumnarTableModel:
+        column = self._column_number(column)
+        self._formatters[column] = formatter
+        self._formatted.clear()
+        self._column_changed(column)
+        return self
+
+    def column(self, column: int | str) -> np.ndarray:
+        """
+        Returns a read-only view of a column, in source order.
+        """
+        view: np.ndarray = self._columns[self._column_number(column)].view()
+        view.flags.writeable = False
+        return view
+
+    def source_row(self, row: int) -> int:
+        return int(self._permutation[row]) if self._permutation is not None else row
+
+    def source_rows(self) -> np.ndarray:
+        """
+        Returns the source row of each shown row.
+        """
+        if self._permutation is not None:
+            return self._permutation
+        return np.arange(self._source_row_count, dtype=self._row_dtype())
+
+    def set_filter(self, row_filter: RowFilter | np.ndarray | None) -> ColumnarTableModel:
+        """
+        Shows only the source rows kept by *row_filter*, a function computing a mask of the source rows or the mask itself, in
+        the current sort order; ``None`` shows every row. The view is reset.
+        """
+        filtered_rows: np.ndarray | None = None
+        if row_filter is not None:
+            mask: np.ndarray = row_filter(dict(zip(self._names, self._columns))) if callable(row_filter) else row_filter
+            mask = np.asarray(mask, dtype=bool)
+            if mask.shape != (self._source_row_count,):
+                raise ValueError(f'Filter mask must have {self._source_row_count} values, got {mask.shape}')
+            filtered_rows = np.flatnonzero(mask).astype(self._row_dtype(), copy=False)
+
+        self.beginResetModel()
+        self._filtered_rows = filtered_rows
+        self._permutation = self._sorted_rows(self._filtered_rows)
+        self.endResetModel()
+        return self
+
+    def refresh(self) -> ColumnarTableModel:
+        """
+        Repaints every cell, e.g. after the columns were modified in place. The filter and sort are not recomputed.
+        """
+        self._formatted.clear()
+        if self.rowCount() and self.columnCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1))
+        return self
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._permutation) if self._permutation is not None else self._source_row_count
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._names[section]
+        return str(self.source_row(section) + 1)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        column: int = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            key: tuple[int, int] = (self.source_row(index.row()), column)
+            text: str | None = self._formatted.get(key)
+            if text is None:
+                text = self._formatted[key] = self._formatters[column](self._columns[column][key[0]])
+                if len(self._formatted) > self._format_cache_size:
+                    self._formatted.popitem(last=False)
+            else:
+                self._formatted.move_to_end(key)
+            return text
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return _RIGHT_ALIGNED if self._right_aligned[column] else None
+        if role == RAW_VALUE_ROLE:
+            return self._columns[column][self.source_row(index.row())].item()
+        return None
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """
+        Sorts the shown rows by *column*, stably in both orders; -1 restores the source order.
+        """
+        self.layoutAboutToBeChanged.emit()
+        persistent: list[QModelIndex] = self.persistentIndexList()
+        persistent_sources: list[int] = [self.source_row(index.row()) for index in persistent]
+        self._sort_column = column
+        self._sort_order = order
+        self._permutation = self._sorted_rows(self._filtered_rows)
+        if persistent:
+            self._remap_persistent(persistent, persistent_sources)
+        self.layoutChanged.emit()
+
+    def _sorted_rows(self, rows: np.ndarray | None) -> np.ndarray | None:
+        """
+        Returns *rows* (every source row if ``None``) in the current sort order, or ``None`` for every source row in order.
+        """
+        if not 0 <= self._sort_column < len(self._columns):
+            return rows
+
+        values: np.ndarray = self._columns[self._sort_column]
+        if rows is not None:
+            values = values[rows]
+        order: np.ndarray = _stable_argsort(values, self._sort_order == Qt.SortOrder.DescendingOrder).astype(self._row_dtype(), copy=False)
+        return rows[order] if rows is not None else order
+
+    def _remap_persistent(self, persistent: list[QModelIndex], sources: list[int]):
+        shown_rows: np.ndarray = np.full(self._source_row_count, -1, np.int64)
+        shown_rows[self.source_rows()] = np.arange(self.rowCount())
+        self.changePersistentIndexList(
+            persistent,
+            [self.index(int(shown_rows[source]), index.column()) for index, source in zip(persistent, sources)]
+        )
+
+    def _row_dtype(self) -> type:
+        return np.int32 if self._source_row_count < 2 ** 31 else np.int64
+
+    def _column_number(self, column: int | str) -> int:
+        return self._names.index(column) if isinstance(column, str) else column
+
+    def _column_changed(self, column: int):
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, column), self.index(self.rowCount() - 1, column))
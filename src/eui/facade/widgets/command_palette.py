@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from PySide6.QtCore import QEvent, QObject, QPoint, Qt
+from PySide6.QtGui import QKeyEvent
+from PySide6.QtWidgets import QFrame, QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout, QWidget
+
+from eui.facade.gui.command_index import CommandIndex, CommandMatch, strip_mnemonic
+
+
+_NAVIGATION_KEYS: frozenset[int] = frozenset((Qt.Key.Key_Up, Qt.Key.Key_Down, Qt.Key.Key_PageUp, Qt.Key.Key_PageDown))
+
+
+class _KeyForwarder(QObject):
+    """
+    Lets the search field drive the result list: navigation keys move the selection, Enter triggers, Escape closes.
+    """
+
+    def __init__(self, palette: CommandPalette):
+        super().__init__()
+        self._palette: CommandPalette = palette
+
+    def eventFilter(self, watched: QObject, event: QKeyEvent) -> bool:
+        if event.type() != QEvent.Type.KeyPress:
+            return False
+
+        key: int = event.key()
+        if key in _NAVIGATION_KEYS:
+            self._palette.result_list.keyPressEvent(event)
+            return True
+        if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+            self._palette.trigger_current()
+            return True
+        if key == Qt.Key.Key_Escape:
+            self._palette.hide()
+            return True
+        return False
+
+
+class CommandPalette:
+    """
+    Popup listing the best matches of a :class:`CommandIndex` as the query is typed, triggering the chosen action.
+
+    Only the *k* best matches are listed, so each keystroke costs a search and a handful of list items, whatever the number of
+    indexed actions.
+    """
+    __slots__ = (
+        '_index',
+        '_k',
+        '_frame',
+        '_search_field',
+        '_result_list',
+        '_key_forwarder',
+        '_matches',
+        '_triggered_listeners',
+        '__weakref__'
+    )
+
+    def __init__(self, index: CommandIndex, parent: QWidget = None, k: int = 20):
+        self._index: CommandIndex = index
+        self._k: int = k
+        self._frame = QFrame(parent, Qt.WindowType.Popup)
+        self._frame.setFrameShape(QFrame.Shape.StyledPanel)
+        self._search_field = QLineEdit(self._frame)
+        self._search_field.setPlaceholderText('Type a command')
+        self._result_list = QListWidget(self._frame)
+        self._result_list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._key_forwarder = _KeyForwarder(self)
+        self._search_field.installEventFilter(self._key_forwarder)
+        self._matches: list[CommandMatch] = []
+        self._triggered_listeners: list[Callable[[str], None]] = []
+
+        layout = QVBoxLayout(self._frame)
+        layout.setContentsMargins(4, 4, 4, 4)
+        layout.addWidget(self._search_field)
+        layout.addWidget(self._result_list)
+        self._frame.resize(480, 360)
+
+        self._search_field.textChanged.connect(self._query_changed)
+        self._result_list.itemActivated.connect(lambda _: self.trigger_current())
+
+    @property
+    def get(self) -> QFrame:
+        return self._frame
+
+    @property
+    def search_field(self) -> QLineEdit:
+        return self._search_field
+
+    @property
+    def result_list(self) -> QListWidget:
+        return self._result_list
+
+    @property
+    def matches(self) -> list[CommandMatch]:
+        return list(self._matches)
+
+    def on_triggered(self, callback: Callable[[str], None]) -> CommandPalette:
+        """
+        Registers *callback* as a listener for an action being triggered from the palette
+        :param callback: ``def on_triggered(self, action_id: str)``
+        """
+        self._triggered_listeners.append(callback)
+        return self
+
+    def popup(self, position: QPoint = None) -> CommandPalette:
+        """
+        Shows the palette with an empty query, centered on the top of its parent window unless at *position*.
+        """
+        self._search_field.clear()
+        if position is None:
+            parent: QWidget | None = self._frame.parentWidget()
+            if parent is not None:
+                window: QWidget = parent.window()
+                position = window.mapToGlobal(QPoint((window.width() - self._frame.width()) // 2, 0))
+        if position is not None:
+            self._frame.move(position)
+        self._frame.show()
+        self._search_field.setFocus()
+        return self
+
+    def hide(self) -> CommandPalette:
+        self._frame.hide()
+        return self
+
+    def trigger_current(self) -> CommandPalette:
+        """
+        Hides the palette and triggers the selected match, if any.
+        """
+        row: int = self._result_list.currentRow()
+        if not 0 <= row < len(self._matches):
+            return self
+
+        match: CommandMatch = self._matches[row]
+        self.hide()
+        match.action.get.trigger()
+        [callback(match.action_id) for callback in self._triggered_listeners]
+        return self
+
+    def _query_changed(self, query: str):
+        self._matches = self._index.search(query, self._k)
+        self._result_list.clear()
+        for match in self._matches:
+            built_action = match.action.get
+            item = QListWidgetItem(built_action.icon(), strip_mnemonic(built_action.text()))
+            shortcut: str = built_action.shortcut().toString()
+            if shortcut:
+                item.setToolTip(shortcut)
+            self._result_list.addItem(item)
+        if self._matches:
+            self._result_list.setCurrentRow(0)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 from enum import Enum
-from typing import Final
+from typing import Callable, Final
 
 from PySide6.QtWidgets import QDockWidget, QWidget
 from PySide6.QtGui import Qt
 
+from eui.facade.core.census import register_facade
+from eui.facade.core.timer_wheel import TimerHandle, timer_wheel
+
 
 class _DockWidgetFeatures:
     NO_DOCK_WIDGET_FEATURES: Final[int] = 0X00
@@ -26,11 +29,18 @@ class Dock:
     __slots__ = (
         '_dock',
         '_features',
-        '_areas'
+        '_areas',
+        '_widget_factory',
+        '_release_after_ms',
+        '_release_timer',
+        '_built_content',
+        '_content_built_listeners',
+        '__weakref__'
     )
 
     def __init__(self, parent: QWidget = None):
         self._dock: QDockWidget = QDockWidget(parent)
+        register_facade(self, self._dock)
         self._features: list[int] = [
             _DockWidgetFeatures.DOCK_WIDGET_CLOSABLE,
             _DockWidgetFeatures.DOCK_WIDGET_MOVABLE,
@@ -42,6 +52,11 @@ class Dock:
             _DockWidgetAreas.TOP_DOCK_WIDGET_AREA,
             _DockWidgetAreas.BOTTOM_DOCK_WIDGET_AREA
         ]
+        self._widget_factory: Callable[[], QWidget] | None = None
+        self._release_after_ms: float | None = None
+        self._release_timer: TimerHandle | None = None
+        self._built_content: QWidget | None = None
+        self._content_built_listeners: list[Callable[[QWidget], None]] = []
 
     def set_feature_not_closable(self) -> Dock:
         self._features.remove(_DockWidgetFeatures.DOCK_WIDGET_CLOSABLE)
@@ -79,10 +94,95 @@ class Dock:
         self._dock.setFloating(False)
         return self
 
+    def set_object_name(self, name: str) -> Dock:
+        """
+        Names the dock: the main window layout state restores docks by object name.
+        """
+        self._dock.setObjectName(name)
+        return self
+
     def set_titlebar_widget(self, widget: QWidget) -> Dock:
         self._dock.setTitleBarWidget(widget)
         return self
 
     def set_dock_widget(self, widget: QWidget) -> Dock:
-        self._dock.setWidget(widget)
+        """
+        Sets the content of the dock, replacing a dock widget factory: the content it built, or its placeholder, is deleted.
+        """
+        if self._widget_factory is None:
+            self._dock.setWidget(widget)
+            return self
+
+        self._dock.visibilityChanged.disconnect(self._visibility_changed)
+        self._cancel_release()
+        self._widget_factory = None
+        self._release_after_ms = None
+        self._set_content(widget, None)
+        return self
+
+    def set_dock_widget_factory(self, factory: Callable[[], QWidget], release_after_ms: float = None) -> Dock:
+        """
+        Builds the content of the dock with *factory* when the dock first becomes visible, instead of up front. If
+        *release_after_ms* is given, the content is deleted once the dock stayed hidden (closed or tabbed away) that long, and built
+        again when the dock is shown next.
+        """
+        if self._widget_factory is None:
+            self._dock.visibilityChanged.connect(self._visibility_changed)
+        self._widget_factory = factory
+        self._release_after_ms = release_after_ms
+        self._cancel_release()
+        self._set_content(QWidget(), None)
+        if self._dock.isVisible():
+            self._visibility_changed(True)
+        return self
+
+    def on_content_built(self, callback: Callable[[QWidget], None]) -> Dock:
+        """
+        Registers *callback* as a listener for the dock widget factory building the content
+        :param callback: ``def on_content_built(self, content: QWidget)``
+        """
+        self._content_built_listeners.append(callback)
         return self
+
+    @property
+    def content_built(self) -> bool:
+        """
+        Whether the content of the dock widget factory is currently built.
+        """
+        return self._built_content is not None
+
+    def _visibility_changed(self, visible: bool):
+        if not visible:
+            if self._release_after_ms is not None and self._built_content is not None and self._release_timer is None:
+                # releasing is no hurry: let the wheel align it with other timers
+                self._release_timer = timer_wheel().schedule(self._release_after_ms, self._release, slack_ms=self._release_after_ms / 4)
+            return
+
+        self._cancel_release()
+        if self._built_content is None:
+            content: QWidget = self._widget_factory()
+            self._set_content(content, content)
+            [callback(content) for callback in self._content_built_listeners]
+
+    def _set_content(self, widget: QWidget, built_content: QWidget | None):
+        previous: QWidget | None = self._dock.widget()
+        self._dock.setWidget(widget)
+        self._built_content = built_content
+        if previous is not None and previous is not widget:
+            previous.deleteLater()
+
+    def _release(self):
+        # becoming visible cancels the release: the dock is hidden, or tabbed away (isVisible() is then still true)
+        self._release_timer = None
+        if self._widget_factory is None or self._built_content is None:
+            return
+        try:
+            self._set_content(QWidget(), None)
+        except RuntimeError:
+            # the dock was deleted meanwhile
+            pass
+
+    def _cancel_release(self):
+        if self._release_timer is not None:
+            self._release_timer.cancel()
+            self._release_timer = None
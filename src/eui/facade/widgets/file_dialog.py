@@ -0,0 +1,817 @@
+from __future__ import annotations
+
+import bisect
+import fnmatch
+import os
+import re
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from enum import IntEnum
+from operator import itemgetter
+from typing import Any, Callable, NamedTuple
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QDateTime,
+    QFileSystemWatcher,
+    QLocale,
+    QModelIndex,
+    QObject,
+    QSize,
+    QTimer,
+    Qt,
+    Signal
+)
+from PySide6.QtGui import QImage, QImageReader
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QDialog,
+    QDialogButtonBox,
+    QFileIconProvider,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QTableView,
+    QVBoxLayout,
+    QWidget
+)
+
+from eui.facade.gui.thumbnail_loader import ThumbnailKey, ThumbnailLoader
+
+
+class FileEntry(NamedTuple):
+    name: str
+    is_dir: bool
+    size: int  #: in bytes, 0 for directories
+    modified: float  #: modification time, in seconds since the epoch
+    hidden: bool
+
+
+class FileColumns(IntEnum):
+    NAME = 0
+    SIZE = 1
+    MODIFIED = 2
+
+
+_COLUMN_TITLES: tuple[str, ...] = ('Name', 'Size', 'Modified')
+_IMAGE_SUFFIXES: frozenset[str] = frozenset(f'.{image_format.data().decode()}' for image_format in QImageReader.supportedImageFormats())
+_THUMBNAIL_UPDATE_DELAY_MS: int = 30
+
+
+def _scan_entry(entry: os.DirEntry) -> FileEntry:
+    try:
+        is_dir: bool = entry.is_dir()
+        stat: os.stat_result = entry.stat()
+    except OSError:
+        # broken symbolic link, or entry removed meanwhile
+        is_dir = False
+        try:
+            stat = entry.stat(follow_symlinks=False)
+        except OSError:
+            return FileEntry(entry.name, False, 0, 0.0, entry.name.startswith('.'))
+    return FileEntry(entry.name, is_dir, 0 if is_dir else stat.st_size, stat.st_mtime, entry.name.startswith('.'))
+
+
+class _ScanSignals(QObject):
+    batch = Signal(int, str, object)  #: scan id, directory, list[FileEntry]
+    finished = Signal(int, str, str)  #: scan id, directory, error message ('' on success)
+
+
+class DirectoryScanner:
+    """
+    Lists directories with ``os.scandir`` on a worker thread, delivering their entries in batches on the GUI thread.
+
+    A batch is sent every *batch_size* entries or every *batch_interval_ms*, whichever comes first, so the first entries show up
+    right away however large the directory. Starting a scan cancels the scan in progress.
+    """
+    __slots__ = (
+        '_executor',
+        '_signals',
+        '_scan_id',
+        '_cancel',
+        '_batch_size',
+        '_batch_interval',
+        '__weakref__'
+    )
+
+    def __init__(self, batch_size: int = 4096, batch_interval_ms: float = 50.0):
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='eui-scandir')
+        self._signals: _ScanSignals = _ScanSignals()
+        self._scan_id: int = 0
+        self._cancel: threading.Event = threading.Event()
+        self._batch_size: int = batch_size
+        self._batch_interval: float = batch_interval_ms / 1000
+
+    @property
+    def signals(self) -> _ScanSignals:
+        return self._signals
+
+    @property
+    def scan_id(self) -> int:
+        """
+        Id of the last scan started: batches of other scans are stale.
+        """
+        return self._scan_id
+
+    def scan(self, directory: str) -> int:
+        self.cancel()
+        self._scan_id += 1
+        self._cancel = threading.Event()
+        self._executor.submit(self._scan, self._scan_id, directory, self._cancel)
+        return self._scan_id
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def shutdown(self) -> None:
+        self.cancel()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _scan(self, scan_id: int, directory: str, cancel: threading.Event):
+        batch: list[FileEntry] = []
+        deadline: float = time.monotonic() + self._batch_interval
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if cancel.is_set():
+                        return
+                    batch.append(_scan_entry(entry))
+                    if len(batch) >= self._batch_size or time.monotonic() >= deadline:
+                        self._signals.batch.emit(scan_id, directory, batch)
+                        batch = []
+                        deadline = time.monotonic() + self._batch_interval
+        except OSError as error:
+            self._signals.batch.emit(scan_id, directory, batch)
+            self._signals.finished.emit(scan_id, directory, str(error))
+            return
+
+        self._signals.batch.emit(scan_id, directory, batch)
+        self._signals.finished.emit(scan_id, directory, '')
+
+
+class DirectoryCache:
+    """
+    Complete listings of the last *max_directories* directories scanned, dropped as soon as a ``QFileSystemWatcher`` reports their
+    directory changed.
+
+    A directory is watched from the start of its scan (see :meth:`watch`), so a change during the scan is not missed. The
+    *max_directories* directories last watched stay watched, with their listing if cached.
+    """
+    __slots__ = (
+        '_listings',
+        '_watched',
+        '_max_directories',
+        '_watcher',
+        '_invalidated_listeners',
+        '__weakref__'
+    )
+
+    def __init__(self, max_directories: int = 16):
+        self._listings: dict[str, list[FileEntry]] = {}
+        self._watched: OrderedDict[str, None] = OrderedDict()  #: least recently used first
+        self._max_directories: int = max_directories
+        self._watcher = QFileSystemWatcher()
+        self._watcher.directoryChanged.connect(self.invalidate)
+        self._invalidated_listeners: list[Callable[[str], None]] = []
+
+    def __contains__(self, directory: str) -> bool:
+        return directory in self._listings
+
+    def __len__(self) -> int:
+        return len(self._listings)
+
+    def get(self, directory: str) -> list[FileEntry] | None:
+        listing: list[FileEntry] | None = self._listings.get(directory)
+        if listing is not None:
+            self._watched.move_to_end(directory)
+        return listing
+
+    def watch(self, directory: str) -> DirectoryCache:
+        """
+        Watches *directory* for changes, to be called before scanning it: a change during the scan invalidates it.
+        """
+        if directory in self._watched:
+            self._watched.move_to_end(directory)
+            return self
+
+        self._watcher.addPath(directory)
+        self._watched[directory] = None
+        while len(self._watched) > self._max_directories:
+            evicted, _ = self._watched.popitem(last=False)
+            self._listings.pop(evicted, None)
+            self._watcher.removePath(evicted)
+        return self
+
+    def put(self, directory: str, listing: list[FileEntry]) -> DirectoryCache:
+        self.watch(directory)
+        self._listings[directory] = listing
+        return self
+
+    def invalidate(self, directory: str) -> DirectoryCache:
+        self._listings.pop(directory, None)
+        if self._watched.pop(directory, None) is not None:
+            self._watcher.removePath(directory)
+        [callback(directory) for callback in self._invalidated_listeners]
+        return self
+
+    def on_invalidated(self, callback: Callable[[str], None]) -> DirectoryCache:
+        """
+        Registers *callback* as a listener for a directory changing on disk
+        :param callback: ``def on_invalidated(self, directory: str)``
+        """
+        self._invalidated_listeners.append(callback)
+        return self
+
+    def remove_invalidated_listener(self, callback: Callable[[str], None]) -> DirectoryCache:
+        if callback in self._invalidated_listeners:
+            self._invalidated_listeners.remove(callback)
+        return self
+
+
+_DEFAULT_CACHE: DirectoryCache | None = None
+
+
+def directory_cache() -> DirectoryCache:
+    """
+    Returns the application-wide directory cache, shared by the models created without one, created on first use (after the
+    application object).
+    """
+    global _DEFAULT_CACHE
+    if _DEFAULT_CACHE is None:
+        _DEFAULT_CACHE = DirectoryCache()
+    return _DEFAULT_CACHE
+
+
+_CACHED_BATCH_SIZE: int = 8192
+
+
+def _weak_listener(method: Callable[..., None]) -> Callable[..., None]:
+    """
+    Returns a listener calling the bound *method* as long as its object is alive, without keeping it alive.
+    """
+    reference = weakref.WeakMethod(method)
+
+    def listener(*args):
+        bound: Callable[..., None] | None = reference()
+        if bound is not None:
+            bound(*args)
+    return listener
+
+
+_SortKey = str  #: directory rank, then the column value and the folded name, as text
+_BY_KEY: Callable[[tuple[_SortKey, FileEntry]], _SortKey] = itemgetter(0)
+
+
+class FileListModel(QAbstractTableModel):
+    """
+    Table of the entries of a directory, filled in batches while the directory is scanned.
+
+    Rows are kept sorted and filtered as batches arrive: a batch is filtered, appended (``rowsInserted``), then merged in place
+    (``layoutChanged``). Rows are stored with their sort key, a string, so merging a batch into the sorted rows is a merge of two
+    sorted runs done by the list sort in C, comparing strings directly, without calling back into Python per row. Changing the
+    sort order or the filters only resorts or refilters the entries already scanned.
+
+    A directory changed while it is listed is listed again once the listing is over.
+    """
+    directory_loaded = Signal(str, int)  #: directory, number of entries
+    scan_failed = Signal(str, str)  #: directory, error message; the entries scanned before the error are still shown
+
+    def __init__(self, scanner: DirectoryScanner = None, cache: DirectoryCache = None, parent: QObject = None):
+        super().__init__(parent)
+        if scanner is None:
+            # owned: its worker thread stops with the model (not capturing self, which would keep the model alive)
+            scanner = DirectoryScanner()
+            self.destroyed.connect(lambda *_: scanner.shutdown())
+        self._scanner: DirectoryScanner = scanner
+        self._cache: DirectoryCache = cache if cache is not None else directory_cache()
+        self._directory: str = ''
+        self._entries: list[FileEntry] = []  #: every entry scanned so far, filtered out or not
+        self._rows: list[tuple[_SortKey, FileEntry]] = []  #: shown entries, ascending
+        self._loading: bool = False
+        self._reload_pending: bool = False  #: the directory changed while it was listed
+        self._sort_column: FileColumns = FileColumns.NAME
+        self._sort_order: Qt.SortOrder = Qt.SortOrder.AscendingOrder
+        self._name_pattern: re.Pattern | None = None
+        self._show_hidden: bool = False
+        self._locale: QLocale = QLocale()
+        icon_provider = QFileIconProvider()
+        self._folder_icon = icon_provider.icon(QFileIconProvider.IconType.Folder)
+        self._file_icon = icon_provider.icon(QFileIconProvider.IconType.File)
+
+        self._cached_batches: list[list[FileEntry]] = []  #: batches of a cached listing not added yet, last first
+        self._cached_timer = QTimer(self)
+        self._cached_timer.setSingleShot(True)
+        self._cached_timer.timeout.connect(self._add_cached_batch)
+
+        self._scanner.signals.batch.connect(self._batch_scanned)
+        self._scanner.signals.finished.connect(self._scan_finished)
+
+        # weak listeners: a reference cycle through the cache or the loader would leave the model to the cyclic garbage collector,
+        # which may run on a worker thread and delete the model's QObjects there
+        cache: DirectoryCache = self._cache
+        invalidated_listener: Callable[[str], None] = _weak_listener(self._directory_invalidated)
+        cache.on_invalidated(invalidated_listener)
+        self.destroyed.connect(lambda *_: cache.remove_invalidated_listener(invalidated_listener))
+        self._ready_listener: Callable[[ThumbnailKey, QImage], None] = _weak_listener(self._thumbnail_ready)
+
+        self._thumbnail_loader: ThumbnailLoader | None = None
+        self._thumbnail_entries: dict[ThumbnailKey, FileEntry] = {}  #: entries of the current directory waiting for a thumbnail
+
+    @property
+    def directory(self) -> str:
+        return self._directory
+
+    @property
+    def loading(self) -> bool:
+        return self._loading
+
+    @property
+    def scanned_count(self) -> int:
+        return len(self._entries)
+
+    def set_directory(self, directory: str) -> FileListModel:
+        """
+        Shows the entries of *directory*: right away if its listing is cached, otherwise as the scan delivers them.
+        """
+        directory = os.path.abspath(directory)
+        self.beginResetModel()
+        self._directory = directory
+        self._entries = []
+        self._rows = []
+        self._thumbnail_entries = {}
+        self.endResetModel()
+
+        self._loading = True
+        self._reload_pending = False
+        cached: list[FileEntry] | None = self._cache.get(directory)
+        if cached is not None:
+            # no scan, but still batches: a large listing is sorted in several short steps
+            self._scanner.cancel()
+            self._cached_batches = [cached[start:start + _CACHED_BATCH_SIZE] for start in range(0, len(cached), _CACHED_BATCH_SIZE)]
+            self._cached_batches.reverse()
+            self._add_cached_batch()
+        else:
+            self._cached_batches = []
+            self._cached_timer.stop()
+            self._cache.watch(directory)
+            self._scanner.scan(directory)
+        return self
+
+    def refresh(self) -> FileListModel:
+        """
+        Lists the directory again, dropping its cached listing for every model sharing the cache.
+        """
+        # the model is notified like the others: it lists the directory again from its listener, or once loaded if loading
+        self._cache.invalidate(self._directory)
+        if self._reload_pending:
+            self.set_directory(self._directory)
+        return self
+
+    def set_name_filters(self, patterns: list[str]) -> FileListModel:
+        """
+        Only shows the files matching one of the glob *patterns* (e.g. ``*.png``), case insensitively; directories are always shown.
+        """
+        self._name_pattern = (
+            re.compile('|'.join(fnmatch.translate(pattern) for pattern in patterns), re.IGNORECASE) if patterns else None
+        )
+        return self._refilter()
+
+    def set_show_hidden(self, show_hidden: bool) -> FileListModel:
+        self._show_hidden = show_hidden
+        return self._refilter()
+
+    @property
+    def thumbnail_loader(self) -> ThumbnailLoader | None:
+        return self._thumbnail_loader
+
+    def set_thumbnail_loader(self, loader: ThumbnailLoader | None) -> FileListModel:
+        """
+        Decorates image files with their thumbnail from *loader*, generated when their row is first painted.
+        """
+        if self._thumbnail_loader is not None:
+            self._thumbnail_loader.remove_ready_listener(self._ready_listener)
+        self._thumbnail_loader = loader
+        self._thumbnail_entries = {}
+        if loader is not None:
+            loader.on_ready(self._ready_listener)
+        if self._rows:
+            self.dataChanged.emit(self.index(0, FileColumns.NAME), self.index(len(self._rows) - 1, FileColumns.NAME))
+        return self
+
+    def thumbnail_key(self, row: int) -> ThumbnailKey | None:
+        """
+        Returns the key of the thumbnail of *row*, ``None`` if it is not an image file or no thumbnail loader is set.
+        """
+        entry: FileEntry = self.entry(row)
+        if self._thumbnail_loader is None or entry.is_dir or os.path.splitext(entry.name)[1].lower() not in _IMAGE_SUFFIXES:
+            return None
+        return self._thumbnail_loader.key(os.path.join(self._directory, entry.name), entry.modified, entry.size)
+
+    def entry(self, row: int) -> FileEntry:
+        return self._rows[self._storage_row(row)][1]
+
+    def path(self, row: int) -> str:
+        return os.path.join(self._directory, self.entry(row).name)
+
+    def row_of(self, name: str) -> int:
+        """
+        Returns the row showing the entry named *name*, -1 if none.
+        """
+        for row, (_, entry) in enumerate(self._rows):
+            if entry.name == name:
+                return self._storage_row(row)
+        return -1
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(_COLUMN_TITLES)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return _COLUMN_TITLES[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        entry: FileEntry = self._rows[self._storage_row(index.row())][1]
+        column: int = index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == FileColumns.NAME:
+                return entry.name
+            if column == FileColumns.SIZE:
+                return '' if entry.is_dir else self._locale.formattedDataSize(entry.size)
+            return QDateTime.fromSecsSinceEpoch(int(entry.modified)).toString('yyyy-MM-dd hh:mm')
+        if role == Qt.ItemDataRole.DecorationRole and column == FileColumns.NAME:
+            if entry.is_dir:
+                return self._folder_icon
+            thumbnail_key: ThumbnailKey | None = self.thumbnail_key(index.row()) if self._thumbnail_loader is not None else None
+            if thumbnail_key is not None:
+                thumbnail: QImage | None = self._thumbnail_loader.thumbnail(thumbnail_key)
+                if thumbnail is None:
+                    self._thumbnail_entries[thumbnail_key] = entry
+                    self._thumbnail_loader.request(thumbnail_key)
+                elif not thumbnail.isNull():
+                    return thumbnail
+            return self._file_icon
+        if role == Qt.ItemDataRole.TextAlignmentRole and column == FileColumns.SIZE:
+            return int(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+        return None
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        self.layoutAboutToBeChanged.emit()
+        persistent, rows = self._persistent_rows()
+        self._sort_column = FileColumns(column)
+        self._sort_order = order
+        self._rows = sorted(((self._sort_key(entry), entry) for _, entry in self._rows), key=_BY_KEY)
+        self._remap_persistent(persistent, [(self._sort_key(entry), entry) for _, entry in rows])
+        self.layoutChanged.emit()
+
+    def _storage_row(self, row: int) -> int:
+        return row if self._sort_order == Qt.SortOrder.AscendingOrder else len(self._rows) - 1 - row
+
+    def _sort_key(self, entry: FileEntry) -> _SortKey:
+        # descending orders read the rows backwards: directories still come first
+        directory_rank: str = '0' if entry.is_dir != (self._sort_order == Qt.SortOrder.DescendingOrder) else '1'
+        folded_name: str = entry.name.casefold()
+        if self._sort_column == FileColumns.SIZE:
+            return f'{directory_rank}{entry.size:020}\0{folded_name}'
+        if self._sort_column == FileColumns.MODIFIED:
+            return f'{directory_rank}{entry.modified:024.6f}\0{folded_name}'
+        return directory_rank + folded_name
+
+    def _accepts(self, entry: FileEntry) -> bool:
+        if entry.hidden and not self._show_hidden:
+            return False
+        return entry.is_dir or self._name_pattern is None or self._name_pattern.match(entry.name) is not None
+
+    def _add_entries(self, entries: list[FileEntry]):
+        self._entries.extend(entries)
+        keyed: list[tuple[_SortKey, FileEntry]] = [(self._sort_key(entry), entry) for entry in entries if self._accepts(entry)]
+        if not keyed:
+            return
+
+        # append, then merge: row insertions at the end, followed by a pure reordering
+        first: int = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(keyed) - 1)
+        if self._sort_order == Qt.SortOrder.AscendingOrder:
+            self._rows.extend(keyed)
+        else:
+            # the new rows are read backwards, so they go at the front of the storage to be shown last
+            self._rows[:0] = keyed[::-1]
+        self.endInsertRows()
+
+        self.layoutAboutToBeChanged.emit()
+        persistent, rows = self._persistent_rows()
+        self._rows.sort(key=_BY_KEY)
+        self._remap_persistent(persistent, rows)
+        self.layoutChanged.emit()
+
+    def _persistent_rows(self) -> tuple[list[QModelIndex], list[tuple[_SortKey, FileEntry]]]:
+        persistent: list[QModelIndex] = self.persistentIndexList()
+        return persistent, [self._rows[self._storage_row(index.row())] for index in persistent]
+
+    def _remap_persistent(self, persistent: list[QModelIndex], rows: list[tuple[_SortKey, FileEntry]]):
+        """
+        Moves the *persistent* indexes to the new rows of the entries they showed, found by bisecting on their sort key.
+        """
+        for index, (key, entry) in zip(persistent, rows):
+            storage_row: int = bisect.bisect_left(self._rows, key, key=_BY_KEY)
+            while self._rows[storage_row][1] is not entry:
+                storage_row += 1
+            self.changePersistentIndex(index, self.index(self._storage_row(storage_row), index.column()))
+
+    def _refilter(self) -> FileListModel:
+        self.beginResetModel()
+        self._rows = sorted(((self._sort_key(entry), entry) for entry in self._entries if self._accepts(entry)), key=_BY_KEY)
+        self.endResetModel()
+        return self
+
+    def _add_cached_batch(self):
+        if self._cached_batches:
+            self._add_entries(self._cached_batches.pop())
+        if self._cached_batches:
+            self._cached_timer.start(0)
+        else:
+            self._loaded()
+            self.directory_loaded.emit(self._directory, len(self._entries))
+
+    def _batch_scanned(self, scan_id: int, directory: str, entries: list[FileEntry]):
+        if scan_id == self._scanner.scan_id and directory == self._directory and entries:
+            self._add_entries(entries)
+
+    def _scan_finished(self, scan_id: int, directory: str, error: str):
+        if scan_id != self._scanner.scan_id or directory != self._directory:
+            return
+        if error:
+            self._loaded()
+            self.scan_failed.emit(directory, error)
+            return
+        if not self._reload_pending:
+            self._cache.put(directory, list(self._entries))
+        self._loaded()
+        self.directory_loaded.emit(directory, len(self._entries))
+
+    def _loaded(self):
+        self._loading = False
+        if self._reload_pending:
+            # the listing may predate the change: not cached, and reloaded once the current listing is signalled
+            self._reload_pending = False
+            directory: str = self._directory
+            QTimer.singleShot(0, self, lambda: self._reload(directory))
+
+    def _reload(self, directory: str):
+        if directory == self._directory and not self._loading:
+            self.set_directory(directory)
+
+    def _thumbnail_ready(self, key: ThumbnailKey, _: QImage):
+        entry: FileEntry | None = self._thumbnail_entries.pop(key, None)
+        if entry is None:
+            return
+        sort_key: _SortKey = self._sort_key(entry)
+        storage_row: int = bisect.bisect_left(self._rows, sort_key, key=_BY_KEY)
+        while storage_row < len(self._rows) and self._rows[storage_row][0] == sort_key:
+            if self._rows[storage_row][1] is entry:
+                index: QModelIndex = self.index(self._storage_row(storage_row), FileColumns.NAME)
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+                return
+            storage_row += 1
+
+    def _directory_invalidated(self, directory: str):
+        if directory != self._directory:
+            return
+        if self._loading:
+            self._reload_pending = True
+        else:
+            self.set_directory(directory)
+
+
+class FileDialog:
+    """
+    File dialog listing directories asynchronously, see :class:`FileListModel`: opening a directory of any size shows its first
+    entries right away and never blocks the GUI thread on the file system.
+
+    Dialogs share the listings of the application-wide :func:`directory_cache` unless given their own *cache*.
+    """
+    __slots__ = (
+        '_dialog',
+        '_model',
+        '_path_field',
+        '_view',
+        '_error_label',
+        '_file_selected_listeners',
+        '_directory_loaded_listeners',
+        '_scan_failed_listeners',
+        '_selected_path',
+        '_thumbnail_timer',
+        '_owned_loaders',
+        '__weakref__'
+    )
+
+    def __init__(self, parent: QWidget = None, directory: str = None, cache: DirectoryCache = None):
+        self._dialog = QDialog(parent)
+        self._dialog.resize(760, 520)
+        self._model = FileListModel(cache=cache, parent=self._dialog)
+        self._file_selected_listeners: list[Callable[[str], None]] = []
+        self._directory_loaded_listeners: list[Callable[[str, int], None]] = []
+        self._scan_failed_listeners: list[Callable[[str, str], None]] = []
+        self._selected_path: str = ''
+
+        up_button = QPushButton('Up', self._dialog)
+        self._path_field = QLineEdit(self._dialog)
+        self._view = QTableView(self._dialog)
+        self._view.setModel(self._model)
+        self._view.setSortingEnabled(True)
+        self._view.sortByColumn(FileColumns.NAME, Qt.SortOrder.AscendingOrder)
+        self._view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self._view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self._view.setShowGrid(False)
+        self._view.verticalHeader().hide()
+        # uniform rows: the view never measures rows it does not show
+        self._view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self._view.horizontalHeader().setSectionResizeMode(FileColumns.NAME, QHeaderView.ResizeMode.Stretch)
+        self._error_label = QLabel(self._dialog)
+        self._error_label.setWordWrap(True)
+        self._error_label.hide()
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Open | QDialogButtonBox.StandardButton.Cancel, self._dialog)
+
+        path_layout = QHBoxLayout()
+        path_layout.addWidget(up_button)
+        path_layout.addWidget(self._path_field)
+        layout = QVBoxLayout(self._dialog)
+        layout.addLayout(path_layout)
+        layout.addWidget(self._view)
+        layout.addWidget(self._error_label)
+        layout.addWidget(buttons)
+
+        up_button.clicked.connect(lambda: self.set_directory(os.path.dirname(self._model.directory)))
+        self._path_field.returnPressed.connect(self._path_entered)
+        self._view.activated.connect(self._activated)
+        buttons.accepted.connect(self._accept_current)
+        buttons.rejected.connect(self._dialog.reject)
+        self._model.directory_loaded.connect(self._directory_loaded)
+        self._model.scan_failed.connect(self._scan_failed)
+
+        self._thumbnail_timer = QTimer(self._dialog)
+        self._thumbnail_timer.setSingleShot(True)
+        self._thumbnail_timer.setInterval(_THUMBNAIL_UPDATE_DELAY_MS)
+        self._thumbnail_timer.timeout.connect(self._update_visible_thumbnails)
+        schedule: Callable[..., None] = lambda *_: self._thumbnail_timer.start() if self._model.thumbnail_loader is not None else None
+        self._view.verticalScrollBar().valueChanged.connect(schedule)
+        self._model.layoutChanged.connect(schedule)
+        self._model.modelReset.connect(schedule)
+        self._model.rowsInserted.connect(schedule)
+        self._dialog.finished.connect(self._cancel_thumbnails)
+
+        # loaders created by set_thumbnails: their worker threads stop with the dialog
+        self._owned_loaders: list[ThumbnailLoader] = []
+        owned_loaders: list[ThumbnailLoader] = self._owned_loaders
+        self._dialog.destroyed.connect(lambda *_: [owned_loader.shutdown() for owned_loader in owned_loaders])
+
+        self.set_directory(directory if directory is not None else os.getcwd())
+
+    @property
+    def get(self) -> QDialog:
+        return self._dialog
+
+    @property
+    def model(self) -> FileListModel:
+        return self._model
+
+    @property
+    def view(self) -> QTableView:
+        return self._view
+
+    @property
+    def selected_path(self) -> str:
+        return self._selected_path
+
+    def set_directory(self, directory: str) -> FileDialog:
+        self._error_label.hide()
+        self._model.set_directory(directory)
+        self._path_field.setText(self._model.directory)
+        return self
+
+    def set_name_filters(self, patterns: list[str]) -> FileDialog:
+        self._model.set_name_filters(patterns)
+        return self
+
+    def set_show_hidden(self, show_hidden: bool) -> FileDialog:
+        self._model.set_show_hidden(show_hidden)
+        return self
+
+    def set_thumbnails(self, loader: ThumbnailLoader = None, edge: int = 96) -> FileDialog:
+        """
+        Shows thumbnails of the image files, from *loader* or a new loader of *edge* pixels. Thumbnails of the visible rows are
+        generated first, then those of the next page; the pending ones are cancelled when their rows scroll out of view.
+
+        A loader created here belongs to the dialog and is shut down with it, or when replaced by another call.
+        """
+        previous_loader: ThumbnailLoader | None = self._model.thumbnail_loader
+        if loader is None:
+            loader = ThumbnailLoader(edge)
+            self._owned_loaders.append(loader)
+        self._view.setIconSize(QSize(loader.edge, loader.edge))
+        self._view.verticalHeader().setDefaultSectionSize(loader.edge + 4)
+        self._model.set_thumbnail_loader(loader)
+        if previous_loader is not None and previous_loader is not loader:
+            previous_loader.cancel_all()
+            if previous_loader in self._owned_loaders:
+                self._owned_loaders.remove(previous_loader)
+                previous_loader.shutdown()
+        self._thumbnail_timer.start()
+        return self
+
+    def set_title(self, title: str) -> FileDialog:
+        self._dialog.setWindowTitle(title)
+        return self
+
+    def on_file_selected(self, callback: Callable[[str], None]) -> FileDialog:
+        """
+        Registers *callback* as a listener for a file being chosen
+        :param callback: ``def on_file_selected(self, path: str)``
+        """
+        self._file_selected_listeners.append(callback)
+        return self
+
+    def on_directory_loaded(self, callback: Callable[[str, int], None]) -> FileDialog:
+        """
+        Registers *callback* as a listener for a directory being completely listed
+        :param callback: ``def on_directory_loaded(self, directory: str, entry_count: int)``
+        """
+        self._directory_loaded_listeners.append(callback)
+        return self
+
+    def on_scan_failed(self, callback: Callable[[str, str], None]) -> FileDialog:
+        """
+        Registers *callback* as a listener for a directory failing to be listed, the error being shown in the dialog too
+        :param callback: ``def on_scan_failed(self, directory: str, error: str)``
+        """
+        self._scan_failed_listeners.append(callback)
+        return self
+
+    def exec(self) -> str:
+        """
+        Shows the dialog modally, returning the chosen file path, or an empty string if cancelled.
+        """
+        self._selected_path = ''
+        self._dialog.exec()
+        return self._selected_path
+
+    def _path_entered(self):
+        path: str = os.path.expanduser(self._path_field.text())
+        if os.path.isdir(path):
+            self.set_directory(path)
+        else:
+            self._choose(path)
+
+    def _activated(self, index: QModelIndex):
+        entry: FileEntry = self._model.entry(index.row())
+        if entry.is_dir:
+            self.set_directory(self._model.path(index.row()))
+        else:
+            self._choose(self._model.path(index.row()))
+
+    def _accept_current(self):
+        current: QModelIndex = self._view.currentIndex()
+        if current.isValid():
+            self._activated(current)
+
+    def _choose(self, path: str):
+        self._selected_path = path
+        self._dialog.accept()
+        [callback(path) for callback in self._file_selected_listeners]
+
+    def _cancel_thumbnails(self, *_):
+        loader: ThumbnailLoader | None = self._model.thumbnail_loader
+        if loader is not None:
+            loader.cancel_all()
+
+    def _update_visible_thumbnails(self):
+        loader: ThumbnailLoader | None = self._model.thumbnail_loader
+        row_count: int = self._model.rowCount()
+        if loader is None or not row_count:
+            return
+
+        first: int = max(self._view.rowAt(0), 0)
+        last: int = self._view.rowAt(self._view.viewport().height() - 1)
+        last = row_count - 1 if last < 0 else last
+        page: int = last - first + 1
+        keys = lambda rows: [key for key in (self._model.thumbnail_key(row) for row in rows) if key is not None]
+        loader.set_visible(keys(range(first, last + 1)), keys(range(last + 1, min(last + 1 + page, row_count))))
+
+    def _directory_loaded(self, directory: str, entry_count: int):
+        [callback(directory, entry_count) for callback in self._directory_loaded_listeners]
+
+    def _scan_failed(self, directory: str, error: str):
+        self._error_label.setText(f'Could not list {directory}: {error}')
+        self._error_label.show()
+        [callback(directory, error) for callback in self._scan_failed_listeners]
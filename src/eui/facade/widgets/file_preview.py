@@ -0,0 +1,453 @@
+from __future__ import annotations
+
+import mmap
+import os
+import threading
+import time
+from typing import Callable
+
+import numpy as np
+from PySide6.QtCore import QObject, QRect, Qt, Signal
+from PySide6.QtGui import QFontDatabase, QFontMetrics, QPainter, QPaintEvent, QResizeEvent
+from PySide6.QtWidgets import QAbstractScrollArea, QWidget
+
+
+_NEWLINE: int = ord('\n')
+_LONG_LINE: int = 4096  #: lines longer than this, in bytes, are followed by a checkpoint
+_GUTTER_PADDING: int = 6
+_MAX_SCROLL_VALUE: int = 2 ** 31 - 1  #: scroll bar values are C++ ints
+
+
+class LineIndex:
+    """
+    Index of the line starts of a memory-mapped file, built incrementally by :meth:`build`.
+
+    Only the offset of every *stride*-th line is stored (16 bytes per *stride* lines), the others are found by scanning forward
+    from the closest stored offset, at most *stride* - 1 lines: a 5 GB file of 100-byte lines costs 12 MB of index with the
+    default stride. The line following a line longer than 4 KiB is stored too, so no scan ever crosses a long line: reading a
+    line costs at most *stride* - 1 lines of 4 KiB, even in a file without newlines. Lines are numbered from 0. The index can be
+    read from the GUI thread while :meth:`build` runs on a worker thread: the lines indexed so far are available right away.
+    """
+    __slots__ = (
+        '_buffer',
+        '_size',
+        '_stride',
+        '_lock',
+        '_checkpoint_lines',
+        '_checkpoints',
+        '_checkpoint_count',
+        '_last_start',
+        '_newline_count',
+        '_indexed_bytes',
+        '_complete'
+    )
+
+    def __init__(self, buffer: mmap.mmap | None, stride: int = 64):
+        if stride < 1:
+            raise ValueError(f'stride must be at least 1, got {stride}')
+
+        self._buffer: mmap.mmap | None = buffer
+        self._size: int = len(buffer) if buffer is not None else 0
+        self._stride: int = stride
+        self._lock = threading.Lock()
+        self._checkpoint_lines: np.ndarray = np.zeros(1024, np.int64)  #: lines 0, stride, 2 * stride... and lines after long ones
+        self._checkpoints: np.ndarray = np.zeros(1024, np.int64)  #: offset of each line of _checkpoint_lines
+        self._checkpoint_count: int = 1
+        self._last_start: int = 0  #: offset of the last line started in the indexed bytes
+        self._newline_count: int = 0
+        self._indexed_bytes: int = 0
+        self._complete: bool = self._size == 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def stride(self) -> int:
+        return self._stride
+
+    @property
+    def indexed_bytes(self) -> int:
+        return self._indexed_bytes
+
+    @property
+    def complete(self) -> bool:
+        return self._complete
+
+    @property
+    def line_count(self) -> int:
+        """
+        Number of lines known so far: the lines ended by a newline, plus an unterminated last line once the index is complete.
+        """
+        with self._lock:
+            if self._complete and self._size > 0 and self._buffer[self._size - 1] != _NEWLINE:
+                return self._newline_count + 1
+            return self._newline_count
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._checkpoint_lines.nbytes + self._checkpoints.nbytes
+
+    def build(
+        self,
+        cancel: threading.Event,
+        on_progress: Callable[[int, int], None] = None,
+        chunk_size: int = 8 << 20,
+        progress_interval_ms: float = 100.0
+    ) -> bool:
+        """
+        Indexes the file chunk by chunk, calling *on_progress* with the line count and the indexed bytes at most every
+        *progress_interval_ms*. Returns ``False`` if *cancel* was set before the end.
+
+        The map is advised to be read sequentially during the build, then randomly, as lines are read when scrolled to.
+        """
+        self._advise('MADV_SEQUENTIAL')
+        stride: int = self._stride
+        deadline: float = time.monotonic() + progress_interval_ms / 1000
+        position: int = self._indexed_bytes
+        while position < self._size:
+            if cancel.is_set():
+                return False
+
+            length: int = min(chunk_size, self._size - position)
+            chunk: np.ndarray = np.frombuffer(self._buffer, np.uint8, length, position)
+            newlines: np.ndarray = np.flatnonzero(chunk == _NEWLINE)
+            del chunk  # a view of the map: it could not be closed while the view exists
+
+            # newline j of the chunk starts line newline_count + j + 1: keep the lines multiple of the stride or after a long line
+            starts: np.ndarray = newlines + (position + 1)
+            lines: np.ndarray = np.arange(self._newline_count + 1, self._newline_count + 1 + len(newlines), dtype=np.int64)
+            lengths: np.ndarray = np.diff(starts, prepend=self._last_start)
+            kept: np.ndarray = np.flatnonzero((lines % stride == 0) | (lengths > _LONG_LINE))
+            with self._lock:
+                self._append_checkpoints(lines[kept], starts[kept])
+                if len(starts):
+                    self._last_start = int(starts[-1])
+                self._newline_count += len(newlines)
+                self._indexed_bytes = position = position + length
+
+            if on_progress is not None and time.monotonic() >= deadline:
+                on_progress(self.line_count, position)
+                deadline = time.monotonic() + progress_interval_ms / 1000
+
+        with self._lock:
+            self._complete = True
+        self._advise('MADV_RANDOM')
+        return True
+
+    def line_offset(self, line: int) -> int:
+        """
+        Returns the offset of the start of *line*, which must be lower than :attr:`line_count`.
+        """
+        with self._lock:
+            checkpoint: int = int(np.searchsorted(self._checkpoint_lines[:self._checkpoint_count], line, 'right')) - 1
+            checkpoint_line: int = int(self._checkpoint_lines[checkpoint])
+            offset: int = int(self._checkpoints[checkpoint])
+        # the lines in between are short, a long one would be followed by a checkpoint
+        for _ in range(line - checkpoint_line):
+            offset = self._buffer.find(b'\n', offset, offset + _LONG_LINE + 1) + 1
+        return offset
+
+    def read_lines(self, first: int, count: int, max_bytes: int = 4096) -> list[bytes]:
+        """
+        Returns up to *count* lines from *first*, without their newline and cut after *max_bytes*.
+        """
+        count = min(count, self.line_count - first)
+        if count <= 0:
+            return []
+
+        buffer: mmap.mmap = self._buffer
+        search_bytes: int = max(max_bytes, _LONG_LINE)
+        start: int = self.line_offset(first)
+        lines: list[bytes] = []
+        for line in range(first, first + count):
+            end: int = buffer.find(b'\n', start, start + search_bytes + 1)
+            lines.append(buffer[start:start + max_bytes if end < 0 else min(end, start + max_bytes)])
+            if line + 1 == first + count:
+                break
+            # the line after a long one is a checkpoint: found without scanning the long one
+            start = end + 1 if end >= 0 else self.line_offset(line + 1)
+        return lines
+
+    def _append_checkpoints(self, lines: np.ndarray, starts: np.ndarray):
+        needed: int = self._checkpoint_count + len(starts)
+        if needed > len(self._checkpoints):
+            capacity: int = max(needed, 2 * len(self._checkpoints))
+            self._checkpoint_lines = np.resize(self._checkpoint_lines[:self._checkpoint_count], capacity)
+            self._checkpoints = np.resize(self._checkpoints[:self._checkpoint_count], capacity)
+        self._checkpoint_lines[self._checkpoint_count:needed] = lines
+        self._checkpoints[self._checkpoint_count:needed] = starts
+        self._checkpoint_count = needed
+
+    def _advise(self, advice: str):
+        # madvise and its flags only exist on some platforms
+        if self._buffer is not None and hasattr(self._buffer, 'madvise') and hasattr(mmap, advice):
+            self._buffer.madvise(getattr(mmap, advice))
+
+
+class _IndexSignals(QObject):
+    # not int: a Signal(int) argument is a 32-bit C++ int, and byte and line counts of large files go over 2^31
+    progress = Signal(int, object, object)  #: generation, line count, indexed bytes
+    finished = Signal(int, object)  #: generation, line count
+
+
+class _PreviewArea(QAbstractScrollArea):
+    """
+    Paints the visible lines of a :class:`LineIndex` straight from the mapped file, with a gutter of line numbers. The vertical
+    scroll bar counts lines and the horizontal one pixels.
+    """
+
+    def __init__(self, parent: QWidget = None):
+        super().__init__(parent)
+        self._index: LineIndex | None = None
+        self._line_count: int = 0
+        self._encoding: str = 'utf-8'
+        self._tab_size: int = 4
+        self._max_line_bytes: int = 4096
+        self._widest_line: int = 0  #: widest painted line, in pixels
+        self.setFont(QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont))
+        self.viewport().setAutoFillBackground(False)
+
+    @property
+    def index(self) -> LineIndex | None:
+        return self._index
+
+    @property
+    def visible_line_count(self) -> int:
+        return max(1, self.viewport().height() // QFontMetrics(self.font()).lineSpacing())
+
+    def set_index(self, index: LineIndex | None, encoding: str):
+        self._index = index
+        self._encoding = encoding
+        self._widest_line = 0
+        self.horizontalScrollBar().setRange(0, 0)
+        self.verticalScrollBar().setValue(0)
+        self.set_line_count(index.line_count if index is not None else 0)
+
+    def set_line_count(self, line_count: int):
+        self._line_count = line_count
+        self._update_vertical_range()
+        self.viewport().update()
+
+    def set_tab_size(self, tab_size: int):
+        self._tab_size = tab_size
+        self.viewport().update()
+
+    def set_max_line_bytes(self, max_line_bytes: int):
+        self._max_line_bytes = max_line_bytes
+        self.viewport().update()
+
+    def scrollContentsBy(self, dx: int, dy: int):
+        # the content is painted from the scroll bar values
+        self.viewport().update()
+
+    def resizeEvent(self, event: QResizeEvent):
+        super().resizeEvent(event)
+        self._update_vertical_range()
+        self._update_horizontal_range()
+
+    def paintEvent(self, event: QPaintEvent):
+        painter = QPainter(self.viewport())
+        painter.fillRect(event.rect(), self.palette().base())
+        if self._index is None:
+            return
+
+        metrics = QFontMetrics(self.font())
+        line_height: int = metrics.lineSpacing()
+        ascent: int = metrics.ascent()
+        first: int = self.verticalScrollBar().value()
+        lines: list[bytes] = self._index.read_lines(first, self.visible_line_count + 1, self._max_line_bytes)
+
+        gutter_width: int = self._gutter_width(metrics)
+        viewport_rect: QRect = self.viewport().rect()
+        text_x: int = gutter_width + _GUTTER_PADDING - self.horizontalScrollBar().value()
+        painter.setClipRect(viewport_rect.adjusted(gutter_width, 0, 0, 0))
+        painter.setPen(self.palette().text().color())
+        widest_line: int = self._widest_line
+        for row, line in enumerate(lines):
+            text: str = line.decode(self._encoding, 'replace').rstrip('\r').expandtabs(self._tab_size)
+            painter.drawText(text_x, row * line_height + ascent, text)
+            widest_line = max(widest_line, metrics.horizontalAdvance(text))
+
+        painter.setClipping(False)
+        painter.fillRect(QRect(0, 0, gutter_width, viewport_rect.height()), self.palette().alternateBase())
+        painter.setPen(self.palette().placeholderText().color())
+        for row in range(len(lines)):
+            number_rect = QRect(0, row * line_height, gutter_width - _GUTTER_PADDING, line_height)
+            painter.drawText(number_rect, Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, str(first + row + 1))
+        painter.end()
+
+        if widest_line > self._widest_line:
+            self._widest_line = widest_line
+            self._update_horizontal_range()
+
+    def _gutter_width(self, metrics: QFontMetrics) -> int:
+        return metrics.horizontalAdvance('9' * len(str(max(1, self._line_count)))) + 2 * _GUTTER_PADDING
+
+    def _update_vertical_range(self):
+        visible_line_count: int = self.visible_line_count
+        scroll_bar = self.verticalScrollBar()
+        scroll_bar.setPageStep(visible_line_count)
+        # lines past 2^31 (a file of 2 billion lines) cannot be scrolled to
+        scroll_bar.setRange(0, min(max(0, self._line_count - visible_line_count), _MAX_SCROLL_VALUE))
+
+    def _update_horizontal_range(self):
+        content_width: int = self._gutter_width(QFontMetrics(self.font())) + _GUTTER_PADDING + self._widest_line
+        scroll_bar = self.horizontalScrollBar()
+        scroll_bar.setPageStep(self.viewport().width())
+        scroll_bar.setRange(0, max(0, content_width - self.viewport().width()))
+
+
+class FilePreview:
+    """
+    Read-only view of a text file of any size, e.g. a multi-GB log.
+
+    The file is memory-mapped rather than read: opening it is instant and only the pages of the lines shown are ever loaded. Its
+    :class:`LineIndex` is built on a worker thread, the scroll range growing as lines are indexed, and each paint decodes only
+    the visible lines, so scrolling costs the same anywhere in the file. The file is expected not to change while previewed.
+    """
+    __slots__ = (
+        '_area',
+        '_stride',
+        '_path',
+        '_encoding',
+        '_file_buffer',
+        '_index',
+        '_cancel',
+        '_index_thread',
+        '_generation',
+        '_signals',
+        '_indexed_listeners',
+        '__weakref__'
+    )
+
+    def __init__(self, parent: QWidget = None, stride: int = 64):
+        self._area = _PreviewArea(parent)
+        self._stride: int = stride
+        self._path: str = ''
+        self._encoding: str = 'utf-8'
+        self._file_buffer: mmap.mmap | None = None
+        self._index: LineIndex | None = None
+        self._cancel: threading.Event = threading.Event()
+        self._index_thread: threading.Thread | None = None
+        self._generation: int = 0
+        self._signals = _IndexSignals()
+        self._signals.progress.connect(self._index_progress)
+        self._signals.finished.connect(self._index_finished)
+        self._indexed_listeners: list[Callable[[int], None]] = []
+
+    @property
+    def get(self) -> QAbstractScrollArea:
+        return self._area
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def index(self) -> LineIndex | None:
+        return self._index
+
+    @property
+    def line_count(self) -> int:
+        return self._index.line_count if self._index is not None else 0
+
+    @property
+    def indexed(self) -> bool:
+        return self._index is not None and self._index.complete
+
+    @property
+    def first_visible_line(self) -> int:
+        return self._area.verticalScrollBar().value()
+
+    def on_indexed(self, callback: Callable[[int], None]) -> FilePreview:
+        """
+        Registers *callback* as a listener for the index of the opened file being complete
+        :param callback: ``def on_indexed(self, line_count: int)``
+        """
+        self._indexed_listeners.append(callback)
+        return self
+
+    def open(self, path: str, encoding: str = 'utf-8') -> FilePreview:
+        """
+        Shows the file at *path*, decoded with *encoding* (undecodable bytes are replaced), and starts indexing its lines.
+        """
+        self.close()
+        with open(path, 'rb') as previewed_file:
+            size: int = os.fstat(previewed_file.fileno()).st_size
+            # a map of an empty file cannot be created
+            self._file_buffer = mmap.mmap(previewed_file.fileno(), 0, access=mmap.ACCESS_READ) if size > 0 else None
+        self._path = path
+        self._encoding = encoding
+        self._index = LineIndex(self._file_buffer, self._stride)
+        self._generation += 1
+        self._area.set_index(self._index, encoding)
+
+        if self._index.complete:
+            self._index_finished(self._generation, 0)
+        else:
+            self._cancel = threading.Event()
+            self._index_thread = threading.Thread(
+                target=self._build_index,
+                args=(self._index, self._generation, self._cancel),
+                name='eui-line-index',
+                daemon=True
+            )
+            self._index_thread.start()
+        return self
+
+    def close(self) -> None:
+        """
+        Stops indexing and unmaps the file, leaving the preview empty.
+        """
+        self._cancel.set()
+        if self._index_thread is not None:
+            # the thread stops after the chunk being indexed
+            self._index_thread.join()
+            self._index_thread = None
+        self._generation += 1
+        self._area.set_index(None, 'utf-8')
+        self._index = None
+        if self._file_buffer is not None:
+            self._file_buffer.close()
+            self._file_buffer = None
+        self._path = ''
+
+    def line(self, line: int) -> str:
+        """
+        Returns the text of *line*, numbered from 0, which must be indexed already.
+        """
+        return b''.join(self._index.read_lines(line, 1, self._index.size)).decode(self._encoding, 'replace').rstrip('\r')
+
+    def scroll_to_line(self, line: int) -> FilePreview:
+        """
+        Shows *line* at the top of the preview, or as close as the lines indexed so far allow.
+        """
+        self._area.verticalScrollBar().setValue(min(line, _MAX_SCROLL_VALUE))
+        return self
+
+    def set_tab_size(self, tab_size: int) -> FilePreview:
+        self._area.set_tab_size(tab_size)
+        return self
+
+    def set_max_line_bytes(self, max_line_bytes: int) -> FilePreview:
+        """
+        Sets the number of bytes of a line shown, the rest being cut: a file without newlines is a single huge line.
+        """
+        self._area.set_max_line_bytes(max_line_bytes)
+        return self
+
+    def _build_index(self, index: LineIndex, generation: int, cancel: threading.Event):
+        progress = lambda line_count, indexed_bytes: self._signals.progress.emit(generation, line_count, indexed_bytes)
+        if index.build(cancel, progress):
+            self._signals.finished.emit(generation, index.line_count)
+
+    def _index_progress(self, generation: int, line_count: int, _: int):
+        if generation == self._generation:
+            self._area.set_line_count(line_count)
+
+    def _index_finished(self, generation: int, line_count: int):
+        if generation != self._generation:
+            return
+        self._area.set_line_count(line_count)
+        [callback(line_count) for callback in self._indexed_listeners]
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from typing import Callable, Generic, Hashable, TypeVar
+
+from PySide6.QtCore import QEvent, QPointF
+from PySide6.QtGui import QMouseEvent, QTransform
+
+from eui.facade.graphics.spatial_index import QuadTree
+from eui.facade.widgets.widget import Widget
+
+
+T = TypeVar('T', bound=Hashable)
+
+
+class HitTester(Generic[T]):
+    """
+    Delivers item-level mouse events for a custom-painted :class:`Widget`, looking items up in a :class:`QuadTree` instead of scanning
+    every drawn item on each mouse event.
+
+    Items are indexed in widget coordinates, or in scene coordinates if a widget-to-scene transform is set. Mouse tracking is enabled
+    on the widget, so hover events are delivered without any button pressed.
+    """
+    __slots__ = (
+        '_widget',
+        '_index',
+        '_transform',
+        '_hovered_item',
+        '_item_enter_listeners',
+        '_item_leave_listeners',
+        '_item_hover_listeners',
+        '_item_press_listeners',
+        '_item_release_listeners'
+    )
+
+    def __init__(self, widget: Widget, index: QuadTree[T]):
+        self._widget: Widget = widget
+        self._index: QuadTree[T] = index
+        self._transform: QTransform | None = None
+        self._hovered_item: T | None = None
+
+        self._item_enter_listeners: list[Callable[[T, QMouseEvent], None]] = []
+        self._item_leave_listeners: list[Callable[[T, QEvent], None]] = []
+        self._item_hover_listeners: list[Callable[[T, QMouseEvent], None]] = []
+        self._item_press_listeners: list[Callable[[T, QMouseEvent], None]] = []
+        self._item_release_listeners: list[Callable[[T, QMouseEvent], None]] = []
+
+        widget.get.setMouseTracking(True)
+        widget.on_mouse_move(self._mouse_move_event)
+        widget.on_mouse_press(self._mouse_press_event)
+        widget.on_mouse_release(self._mouse_release_event)
+        widget.on_mouse_leave(self._mouse_leave_event)
+
+    @property
+    def index(self) -> QuadTree[T]:
+        return self._index
+
+    @property
+    def hovered_item(self) -> T | None:
+        return self._hovered_item
+
+    def set_transform(self, widget_to_scene: QTransform | None) -> HitTester[T]:
+        """
+        Sets the transform mapping widget coordinates to the coordinates items are indexed in, e.g. the inverse of the painter
+        transform used to draw them. ``None`` means items are indexed in widget coordinates.
+        """
+        self._transform = widget_to_scene
+        return self
+
+    def item_at(self, position: QPointF) -> T | None:
+        """
+        Returns the top-most item under *position*, in widget coordinates.
+        """
+        if self._transform is not None:
+            position = self._transform.map(position)
+        return self._index.item_at(position.x(), position.y())
+
+    def on_item_enter(self, callback: Callable[[T, QMouseEvent], None]) -> HitTester[T]:
+        """
+        Registers *callback* as a listener for the mouse entering an item
+        :param callback: ``def on_item_enter(self, item: T, event: QMouseEvent)``
+        """
+        self._item_enter_listeners.append(callback)
+        return self
+
+    def on_item_leave(self, callback: Callable[[T, QEvent], None]) -> HitTester[T]:
+        """
+        Registers *callback* as a listener for the mouse leaving an item, either to another item, to no item or out of the widget
+        :param callback: ``def on_item_leave(self, item: T, event: QEvent)``
+        """
+        self._item_leave_listeners.append(callback)
+        return self
+
+    def on_item_hover(self, callback: Callable[[T, QMouseEvent], None]) -> HitTester[T]:
+        """
+        Registers *callback* as a listener for the mouse moving over an item
+        :param callback: ``def on_item_hover(self, item: T, event: QMouseEvent)``
+        """
+        self._item_hover_listeners.append(callback)
+        return self
+
+    def on_item_press(self, callback: Callable[[T, QMouseEvent], None]) -> HitTester[T]:
+        """
+        Registers *callback* as a listener for a mouse button pressed over an item
+        :param callback: ``def on_item_press(self, item: T, event: QMouseEvent)``
+        """
+        self._item_press_listeners.append(callback)
+        return self
+
+    def on_item_release(self, callback: Callable[[T, QMouseEvent], None]) -> HitTester[T]:
+        """
+        Registers *callback* as a listener for a mouse button released over an item
+        :param callback: ``def on_item_release(self, item: T, event: QMouseEvent)``
+        """
+        self._item_release_listeners.append(callback)
+        return self
+
+    def _set_hovered_item(self, item: T | None, event: QEvent):
+        if item == self._hovered_item:
+            return
+
+        previous: T | None = self._hovered_item
+        self._hovered_item = item
+        if previous is not None:
+            [callback(previous, event) for callback in self._item_leave_listeners]
+        if item is not None:
+            [callback(item, event) for callback in self._item_enter_listeners]
+
+    def _mouse_move_event(self, event: QMouseEvent):
+        item: T | None = self.item_at(event.position())
+        self._set_hovered_item(item, event)
+        if item is not None:
+            [callback(item, event) for callback in self._item_hover_listeners]
+
+    def _mouse_press_event(self, event: QMouseEvent):
+        item: T | None = self.item_at(event.position())
+        if item is not None:
+            [callback(item, event) for callback in self._item_press_listeners]
+
+    def _mouse_release_event(self, event: QMouseEvent):
+        item: T | None = self.item_at(event.position())
+        if item is not None:
+            [callback(item, event) for callback in self._item_release_listeners]
+
+    def _mouse_leave_event(self, event: QEvent):
+        self._set_hovered_item(None, event)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+import json
+from functools import partial
+from typing import Any, Callable
+
+from PySide6.QtWidgets import QMenu, QMenuBar, QToolBar, QWidget
+
+from eui.facade.gui.action import Action
+from eui.facade.gui.action_spec import ActionSpec, build_action
+from eui.facade.gui.action_registry import ActionRegistry
+
+
+MenuSpec = dict[str, Any]
+"""
+Declarative description of menus and toolbars::
+
+    {
+        "menus": [
+            {"title": "&File", "items": [
+                {"id": "file.open", "text": "&Open...", "shortcut": "Ctrl+O", "icon": "icons/open.png"},
+                "-",
+                {"title": "Recent files", "items": [...]}
+            ]}
+        ],
+        "toolbars": [
+            {"title": "Main", "items": ["file.open", "-", {"id": "view.zoom", "text": "Zoom"}]}
+        ]
+    }
+
+An item is an action (a dictionary with an ``id``), a submenu (a dictionary with ``items``), ``"-"`` for a separator or, in
+toolbars, the id of an action described elsewhere. Action keys are ``id``, ``text``, ``icon`` (a file path), ``icon_text``,
+``shortcut``, ``tooltip``, ``status_tip``, ``whats_this``, ``checkable``, ``checked``, ``enabled``, ``visible`` and ``data``.
+"""
+
+_SEPARATOR: str = '-'
+
+
+class MenuBuilder:
+    """
+    Builds a menu bar and toolbars from a :data:`MenuSpec`, creating the content of each menu only when it is first shown.
+
+    Building the menu bar only creates its top-level menus: the actions, icons and submenus of a menu are created on its first
+    ``aboutToShow`` and kept afterwards. Actions are created once, whatever the number of menus and toolbars showing them.
+
+    Actions with a shortcut are created up front and added to the *shortcut_host* widget (by default, the window of the menu
+    bar), since a shortcut only works once its action exists and belongs to a widget of the window.
+    """
+    __slots__ = (
+        '_spec',
+        '_action_specs',
+        '_actions',
+        '_triggered_listeners',
+        '_registry',
+        '_action_parent',
+        '_pending_menus'
+    )
+
+    def __init__(self, spec: MenuSpec, registry: ActionRegistry = None):
+        self._spec: MenuSpec = spec
+        self._action_specs: dict[str, dict[str, Any]] = {}
+        self._actions: dict[str, Action] = {}
+        self._triggered_listeners: dict[str, list[Callable[[], None]]] = {}
+        self._registry: ActionRegistry | None = registry
+        self._action_parent: QWidget | None = None
+        self._pending_menus: dict[QMenu, Callable[[], None]] = {}  #: menus not shown yet, with their populating slot
+
+        for menu_spec in spec.get('menus', ()):
+            self._index_items(menu_spec.get('items', ()))
+        for tool_bar_spec in spec.get('toolbars', ()):
+            self._index_items(tool_bar_spec.get('items', ()))
+
+    @classmethod
+    def from_file(cls, path: str, registry: ActionRegistry = None) -> MenuBuilder:
+        with open(path, 'r', encoding='utf-8') as spec_file:
+            return cls(json.load(spec_file), registry)
+
+    @property
+    def action_ids(self) -> list[str]:
+        return list(self._action_specs)
+
+    @property
+    def instantiated_count(self) -> int:
+        return len(self._actions)
+
+    def is_instantiated(self, action_id: str) -> bool:
+        return action_id in self._actions
+
+    def action(self, action_id: str) -> Action:
+        """
+        Returns the action described as *action_id*, creating it if no menu showing it was opened yet.
+        """
+        action: Action | None = self._actions.get(action_id)
+        if action is None:
+            action = self._make_action(self._action_specs[action_id])
+        return action
+
+    def on_triggered(self, action_id: str, callback: Callable[[], None]) -> MenuBuilder:
+        """
+        Registers *callback* as a listener for the action *action_id* being triggered, whether or not it is created yet.
+        """
+        if action_id not in self._action_specs:
+            raise KeyError(action_id)
+
+        self._triggered_listeners.setdefault(action_id, []).append(callback)
+        action: Action | None = self._actions.get(action_id)
+        if action is not None:
+            action.on_triggered(callback)
+        return self
+
+    def build_menu_bar(self, menu_bar: QMenuBar = None, shortcut_host: QWidget = None) -> QMenuBar:
+        """
+        Adds the top-level menus of the spec to *menu_bar* (a new one if ``None``), leaving them empty until first shown.
+        """
+        if menu_bar is None:
+            menu_bar = QMenuBar()
+        if self._action_parent is None:
+            self._action_parent = menu_bar
+
+        for menu_spec in self._spec.get('menus', ()):
+            menu_bar.addMenu(self.build_menu(menu_spec, menu_bar))
+
+        if shortcut_host is None:
+            shortcut_host = menu_bar.window() if menu_bar.parentWidget() is not None else None
+        for action_id, action_spec in self._action_specs.items():
+            if action_spec.get('shortcut'):
+                action: Action = self.action(action_id)
+                if shortcut_host is not None:
+                    shortcut_host.addAction(action.get)
+        return menu_bar
+
+    def build_menu(self, menu_spec: MenuSpec, parent: QWidget = None) -> QMenu:
+        """
+        Returns an empty menu titled after *menu_spec*, populated with its items when it is first shown.
+        """
+        menu = QMenu(menu_spec.get('title', ''), parent)
+        populate: Callable[[], None] = partial(self._populate, menu, menu_spec.get('items', ()))
+        self._pending_menus[menu] = populate
+        menu.aboutToShow.connect(populate)
+        return menu
+
+    def build_tool_bars(self, parent: QWidget = None) -> list[QToolBar]:
+        """
+        Returns the toolbars of the spec. Unlike menus, toolbars are visible right away, so their actions are created now.
+        """
+        tool_bars: list[QToolBar] = []
+        for tool_bar_spec in self._spec.get('toolbars', ()):
+            tool_bar = QToolBar(tool_bar_spec.get('title', ''), parent)
+            if self._action_parent is None:
+                self._action_parent = tool_bar
+            for item in tool_bar_spec.get('items', ()):
+                if item == _SEPARATOR:
+                    tool_bar.addSeparator()
+                else:
+                    tool_bar.addAction(self.action(item if isinstance(item, str) else item['id']).get)
+            tool_bars.append(tool_bar)
+        return tool_bars
+
+    def populate_all(self, menu: QMenu) -> MenuBuilder:
+        """
+        Populates *menu* and all its submenus right away, as if each was opened.
+        """
+        menus: list[QMenu] = [menu]
+        while menus:
+            current: QMenu = menus.pop()
+            if current in self._pending_menus:
+                self._pending_menus[current]()
+            menus.extend(action.menu() for action in current.actions() if action.menu() is not None)
+        return self
+
+    def _index_items(self, items):
+        stack: list = [items]
+        while stack:
+            for item in stack.pop():
+                if item == _SEPARATOR or isinstance(item, str):
+                    continue
+                if 'items' in item:
+                    stack.append(item['items'])
+                    continue
+
+                action_id: str = item['id']
+                if action_id in self._action_specs and self._action_specs[action_id] is not item:
+                    if len(item) > 1:
+                        raise ValueError(f'Action {action_id!r} is described twice')
+                    continue
+                self._action_specs[action_id] = item
+
+    def _populate(self, menu: QMenu, items):
+        menu.aboutToShow.disconnect(self._pending_menus.pop(menu))
+        if self._action_parent is None:
+            self._action_parent = menu
+
+        for item in items:
+            if item == _SEPARATOR:
+                menu.addSeparator()
+            elif isinstance(item, str):
+                menu.addAction(self.action(item).get)
+            elif 'items' in item:
+                menu.addMenu(self.build_menu(item, menu))
+            else:
+                menu.addAction(self.action(item['id']).get)
+
+    def _make_action(self, action_spec: dict[str, Any]) -> Action:
+        action_id: str = action_spec['id']
+        action: Action = build_action(ActionSpec.from_mapping({'text': action_id, **action_spec}), self._action_parent)
+
+        for callback in self._triggered_listeners.get(action_id, ()):
+            action.on_triggered(callback)
+        self._actions[action_id] = action
+        if self._registry is not None:
+            self._registry.register(action_id, action)
+        return action
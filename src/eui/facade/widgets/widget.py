@@ -17,6 +17,10 @@ from PySide6.QtGui import (
 )
 from PySide6.QtWidgets import QWidget
 
+from eui.facade.core.census import register_facade
+from eui.facade.core.frame_scheduler import frame_scheduler
+from eui.facade.core.signal_batch import SignalBatch
+from eui.facade.core.timer_wheel import TimerHandle, timer_wheel
 from eui.facade.gui.action import Action
 
 
@@ -41,7 +45,8 @@ class Widget:
         '_drag_enter_event_listeners',
         '_drag_leave_event_listeners',
         '_drag_move_event_listeners',
-        '_drag_drop_event_listeners'
+        '_drag_drop_event_listeners',
+        '__weakref__'
     )
 
     def __init__(
@@ -55,6 +60,7 @@ class Widget:
             built_widget_instance if built_widget_instance is not None else QWidget()
         )
         self._built_widget.setParent(qparent or parent)
+        register_facade(self, self._built_widget)
 
         self._close_event_listeners: list[Callable[[QCloseEvent], None]] = []
         self._move_event_listeners: list[Callable[[QMoveEvent], None]] = []
@@ -96,6 +102,40 @@ class Widget:
         self._built_widget.resizeEvent = self._resize_event
         self._built_widget.timerEvent = self._timer_event
 
+    @property
+    def get(self) -> QWidget:
+        return self._built_widget
+
+    def update(self) -> Widget:
+        """
+        Schedules a paint event for processing when Qt returns to the main event loop. Several calls are merged into a single paint event.
+        """
+        self._built_widget.update()
+        return self
+
+    def request_update(self) -> Widget:
+        """
+        Repaints the widget during the next frame of the application-wide frame scheduler. Any number of requests made before that
+        frame result in a single repaint.
+        """
+        frame_scheduler().request_update(self)
+        return self
+
+    def request_layout(self, callback: Callable[[], None]) -> Widget:
+        """
+        Runs *callback* during the layout phase of the next frame of the application-wide frame scheduler, before any repaint of
+        that frame. Requesting the same *callback* several times before that frame runs it once.
+        """
+        frame_scheduler().request_layout(self, callback)
+        return self
+
+    def batch_update(self) -> SignalBatch:
+        """
+        Returns a context manager suspending the signals and repaints of the widget for a bulk edit. On exit, the widget is
+        repainted once and the notify signal of each property changed meanwhile is emitted once, with its final value.
+        """
+        return SignalBatch(self._built_widget)
+
     def on_destroy(self, callback: Callable[[Any], None]) -> Widget:
         """
         This signal is emitted immediately before the object obj is destroyed, after any instances
@@ -251,6 +291,17 @@ class Widget:
         self._timer_event_listeners.append(callback)
         return self
 
+    def start_timer(self, interval_ms: float, callback: Callable[[], None], *, single_shot: bool = False, slack_ms: float = 0.0) -> TimerHandle:
+        """
+        Calls *callback* every *interval_ms* (once if *single_shot*) from the application-wide timer wheel instead of a dedicated
+        Qt timer. Timers allowed some *slack_ms* are aligned with the other timers due around the same time, sharing wakeups.
+
+        The timer is cancelled when the widget is destroyed, or by ``TimerHandle.cancel``.
+        """
+        handle: TimerHandle = timer_wheel().schedule(interval_ms, callback, repeat=not single_shot, slack_ms=slack_ms)
+        self._built_widget.destroyed.connect(handle.cancel)
+        return handle
+
     def on_drag_enter(self, callback: Callable[[QDragEnterEvent], None]) -> Widget:
         """
         Registers *callback* as a listener for the QT *drag enter*
@@ -296,61 +347,61 @@ class Widget:
         return self
 
     def _paint_event(self, event: QPaintEvent):
-        QWidget.paintEvent(self, event)
+        QWidget.paintEvent(self._built_widget, event)
         [callback(event) for callback in self._paint_event_listeners]
 
     def _close_event(self, event: QCloseEvent):
-        QWidget.closeEvent(self, event)
+        QWidget.closeEvent(self._built_widget, event)
         [callback(event) for callback in self._close_event_listeners]
 
     def _focus_event(self, event: QFocusEvent):
-        QWidget.focusInEvent(self, event)
+        QWidget.focusInEvent(self._built_widget, event)
         [callback(event) for callback in self._focus_event_listeners]
 
     def _unfocus_event(self, event: QFocusEvent):
-        QWidget.focusOutEvent(self, event)
+        QWidget.focusOutEvent(self._built_widget, event)
         [callback(event) for callback in self._unfocus_event_listeners]
 
     def _mouse_enter_event(self, event: QEnterEvent):
-        QWidget.enterEvent(self, event)
+        QWidget.enterEvent(self._built_widget, event)
         [callback(event) for callback in self._mouse_enter_event_listeners]
 
     def _key_press_event(self, event: QKeyEvent):
-        QWidget.keyPressEvent(self, event)
+        QWidget.keyPressEvent(self._built_widget, event)
         [callback(event) for callback in self._key_press_event_listeners]
 
     def _key_release_event(self, event: QKeyEvent):
-        QWidget.keyReleaseEvent(self, event)
+        QWidget.keyReleaseEvent(self._built_widget, event)
         [callback(event) for callback in self._key_release_event_listeners]
 
     def _mouse_leave_event(self, event: QEvent):
-        QWidget.leaveEvent(self, event)
+        QWidget.leaveEvent(self._built_widget, event)
         [callback(event) for callback in self._mouse_leave_event_listeners]
 
     def _mouse_double_click_event(self, event: QMouseEvent):
-        QWidget.mouseDoubleClickEvent(self, event)
+        QWidget.mouseDoubleClickEvent(self._built_widget, event)
         [callback(event) for callback in self._mouse_double_click_event_listeners]
 
     def _mouse_move_event(self, event: QMouseEvent):
-        QWidget.mouseMoveEvent(self, event)
+        QWidget.mouseMoveEvent(self._built_widget, event)
         [callback(event) for callback in self._mouse_move_event_listeners]
 
     def _mouse_press_event(self, event: QMouseEvent):
-        QWidget.mousePressEvent(self, event)
+        QWidget.mousePressEvent(self._built_widget, event)
         [callback(event) for callback in self._mouse_press_event_listeners]
 
     def _mouse_release_event(self, event: QMouseEvent):
-        QWidget.mouseReleaseEvent(self, event)
+        QWidget.mouseReleaseEvent(self._built_widget, event)
         [callback(event) for callback in self._mouse_release_event_listeners]
 
     def _move_event(self, event: QMoveEvent):
-        QWidget.moveEvent(self, event)
+        QWidget.moveEvent(self._built_widget, event)
         [callback(event) for callback in self._move_event_listeners]
 
     def _resize_event(self, event: QResizeEvent):
-        QWidget.resizeEvent(self, event)
+        QWidget.resizeEvent(self._built_widget, event)
         [callback(event) for callback in self._resize_event_listeners]
 
     def _timer_event(self, event: QTimerEvent):
-        QWidget.timerEvent(self, event)
+        QWidget.timerEvent(self._built_widget, event)
         [callback(event) for callback in self._timer_event_listeners]
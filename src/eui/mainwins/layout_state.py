@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import os
+import struct
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+import ereport
+from PySide6.QtCore import QByteArray, QEvent, QObject, QTimer
+from PySide6.QtWidgets import QDockWidget, QMainWindow, QToolBar
+
+
+_MAGIC: bytes = b'EUILAYOUT'
+_FORMAT_VERSION: int = 1
+_HEADER: struct.Struct = struct.Struct(f'<{len(_MAGIC)}sHIII')  #: magic, format version, layout version, geometry size, state size
+_TRACKED_EVENTS: frozenset[QEvent.Type] = frozenset((QEvent.Type.Move, QEvent.Type.Resize, QEvent.Type.WindowStateChange))
+LOGGER = ereport.get_or_make_reporter('EUI', 'E_UI_LOGGING_LEVEL')
+
+
+def _write_atomically(path: str, data: bytes):
+    temporary_path: str = f'{path}.tmp'
+    try:
+        with open(temporary_path, 'wb') as layout_file:
+            layout_file.write(data)
+            layout_file.flush()
+            os.fsync(layout_file.fileno())
+        os.replace(temporary_path, path)
+    except OSError:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+
+
+def _log_failed_write(write: Future):
+    error: BaseException | None = write.exception()
+    if error is not None:
+        LOGGER.error(f'Could not save the window layout: {error}')
+
+
+class LayoutState(QObject):
+    """
+    Persists the geometry of a main window and the state of its docks and toolbars in a local file.
+
+    :meth:`restore` is meant to run before the window is first shown, so that it is laid out once, in its saved layout. Once
+    :meth:`track` is called, every change of the window geometry or of the docks schedules a save: the changes of the next
+    *debounce_ms* are saved together, the state is captured on the GUI thread (``saveState`` and ``saveGeometry`` are cheap), and
+    written on a worker thread to a temporary file renamed over the previous one, so that a crash never leaves a truncated file.
+
+    Saved states carry the *version* of the layout: a state saved with another version (e.g. before docks were added or renamed)
+    is ignored. Docks and toolbars are restored by object name, which they must have. A failed write is logged, the layout in
+    memory being saved again on the next change.
+    """
+
+    def __init__(self, window: QMainWindow, path: str, version: int = 0, debounce_ms: int = 500):
+        super().__init__(window)
+        self._window: QMainWindow = window
+        self._path: str = path
+        self._version: int = version
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='eui-layout')
+        self._last_write: Future | None = None
+        self._last_restore_ms: float | None = None
+        self._save_count: int = 0
+        self._tracked: set[QDockWidget] = set()
+
+        self._debounce_timer = QTimer(self)
+        self._debounce_timer.setSingleShot(True)
+        self._debounce_timer.setInterval(debounce_ms)
+        self._debounce_timer.timeout.connect(self.save)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    @property
+    def last_restore_ms(self) -> float | None:
+        """
+        Time taken by the last :meth:`restore`, reading the file included; ``None`` if nothing was restored.
+        """
+        return self._last_restore_ms
+
+    @property
+    def save_count(self) -> int:
+        return self._save_count
+
+    def restore(self) -> bool:
+        """
+        Restores the saved layout, returning whether there was one of the current version.
+        """
+        start: float = time.perf_counter()
+        try:
+            with open(self._path, 'rb') as layout_file:
+                data: bytes = layout_file.read()
+        except FileNotFoundError:
+            return False
+
+        if len(data) < _HEADER.size:
+            return False
+        magic, format_version, version, geometry_size, state_size = _HEADER.unpack_from(data)
+        if magic != _MAGIC or format_version != _FORMAT_VERSION or version != self._version:
+            return False
+        if len(data) != _HEADER.size + geometry_size + state_size:
+            return False
+
+        geometry = QByteArray(data[_HEADER.size:_HEADER.size + geometry_size])
+        state = QByteArray(data[_HEADER.size + geometry_size:])
+        restored: bool = self._window.restoreGeometry(geometry) and self._window.restoreState(state, self._version)
+        self._last_restore_ms = (time.perf_counter() - start) * 1000
+        return restored
+
+    def track(self) -> LayoutState:
+        """
+        Saves the layout after each change of the window geometry or of its docks, including docks added later.
+        """
+        self._window.installEventFilter(self)
+        self._window.tabifiedDockWidgetActivated.connect(self.schedule_save)
+        for dock in self._window.findChildren(QDockWidget):
+            self._track_dock(dock)
+        for tool_bar in self._window.findChildren(QToolBar):
+            tool_bar.topLevelChanged.connect(self.schedule_save)
+            tool_bar.visibilityChanged.connect(self.schedule_save)
+        return self
+
+    def schedule_save(self, *_) -> LayoutState:
+        self._debounce_timer.start()
+        return self
+
+    def save(self) -> Future:
+        """
+        Captures the layout now and writes it in the background, returning the pending write.
+        """
+        self._debounce_timer.stop()
+        geometry: bytes = self._window.saveGeometry().data()
+        state: bytes = self._window.saveState(self._version).data()
+        data: bytes = _HEADER.pack(_MAGIC, _FORMAT_VERSION, self._version, len(geometry), len(state)) + geometry + state
+        self._last_write = self._executor.submit(_write_atomically, self._path, data)
+        self._last_write.add_done_callback(_log_failed_write)
+        self._save_count += 1
+        return self._last_write
+
+    def flush(self) -> LayoutState:
+        """
+        Saves a pending change right away and waits for the writes in progress, e.g. before quitting. Write errors are logged, not
+        raised.
+        """
+        if self._debounce_timer.isActive():
+            self.save()
+        if self._last_write is not None:
+            wait((self._last_write,))
+        return self
+
+    def shutdown(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        event_type: QEvent.Type = event.type()
+        if event_type in _TRACKED_EVENTS:
+            self.schedule_save()
+        elif event_type == QEvent.Type.ChildPolished and isinstance(event.child(), QDockWidget):
+            # not ChildAdded: a child is added from its base QObject constructor, before it is a QDockWidget
+            self._track_dock(event.child())
+        return False
+
+    def _track_dock(self, dock: QDockWidget):
+        if dock in self._tracked:
+            return
+        self._tracked.add(dock)
+        dock.dockLocationChanged.connect(self.schedule_save)
+        dock.topLevelChanged.connect(self.schedule_save)
+        dock.visibilityChanged.connect(self.schedule_save)
+        dock.destroyed.connect(self._dock_destroyed)
+
+    def _dock_destroyed(self, dock: QObject):
+        self._tracked.discard(dock)
@@ -0,0 +1,98 @@
+import datetime
+
+import pytest
+
+from eui.facade.core.business_calendar import BusinessCalendar
+from eui.facade.core.qdate import Date
+from eui.facade.enums.date_enums import QTDayOfWeek
+
+_FIRST = datetime.date(2023, 12, 1)
+_LAST = datetime.date(2024, 3, 31)
+_HOLIDAYS: list[datetime.date] = [datetime.date(2023, 12, 25), datetime.date(2024, 1, 1), datetime.date(2024, 3, 29)]
+
+
+def _date(day: datetime.date) -> Date:
+    return Date(day.year, day.month, day.day)
+
+
+def _python_date(date: Date) -> datetime.date:
+    return datetime.date(date.year, int(date.month), date.day)
+
+
+def _span() -> list[datetime.date]:
+    return [_FIRST + datetime.timedelta(days) for days in range((_LAST - _FIRST).days + 1)]
+
+
+def _is_business_day(day: datetime.date) -> bool:
+    return day.weekday() < 5 and day not in _HOLIDAYS
+
+
+@pytest.fixture(scope='module')
+def calendar() -> BusinessCalendar:
+    return BusinessCalendar(_date(_FIRST), _date(_LAST), [_date(holiday) for holiday in _HOLIDAYS])
+
+
+def test_weekends_and_holidays(calendar):
+    for day in _span():
+        assert calendar.is_business_day(_date(day)) == _is_business_day(day), day
+        assert calendar.is_holiday(_date(day)) == (day in _HOLIDAYS), day
+
+
+def test_custom_weekend():
+    calendar = BusinessCalendar(_date(_FIRST), _date(_LAST), weekend=(QTDayOfWeek.FRIDAY, QTDayOfWeek.SATURDAY))
+
+    for day in _span():
+        assert calendar.is_business_day(_date(day)) == (day.weekday() not in (4, 5)), day
+
+
+@pytest.mark.parametrize('start, end', [
+    (datetime.date(2023, 12, 1), datetime.date(2024, 3, 31)),
+    (datetime.date(2023, 12, 23), datetime.date(2024, 1, 2)),
+    (datetime.date(2024, 1, 2), datetime.date(2023, 12, 23)),
+    (datetime.date(2024, 2, 10), datetime.date(2024, 2, 10))
+])
+def test_business_days_between_is_signed(calendar, start, end):
+    low, high = min(start, end), max(start, end)
+    count: int = sum(1 for day in _span() if low <= day < high and _is_business_day(day))
+
+    assert calendar.business_days_between(_date(start), _date(end)) == (count if start <= end else -count)
+
+
+@pytest.mark.parametrize('start', [datetime.date(2023, 12, 22), datetime.date(2023, 12, 23), datetime.date(2024, 1, 1)])
+@pytest.mark.parametrize('days', [-5, -1, 0, 1, 2, 10])
+def test_add_business_days(calendar, start, days):
+    # reference: step day by day, counting the business days met
+    day: datetime.date = start
+    remaining: int = abs(days)
+    while remaining:
+        day += datetime.timedelta(1 if days > 0 else -1)
+        if _is_business_day(day):
+            remaining -= 1
+
+    assert _python_date(calendar.add_business_days(_date(start), days)) == day
+
+
+def test_add_business_days_outside_of_the_span(calendar):
+    with pytest.raises(ValueError):
+        calendar.add_business_days(_date(datetime.date(2024, 3, 27)), 5)
+    with pytest.raises(ValueError):
+        calendar.add_business_days(_date(datetime.date(2023, 12, 4)), -5)
+    with pytest.raises(ValueError):
+        calendar.is_business_day(_date(datetime.date(2024, 4, 1)))
+
+
+def test_iter_business_days(calendar):
+    start, end = datetime.date(2023, 12, 20), datetime.date(2024, 1, 5)
+
+    assert [_python_date(date) for date in calendar.iter_business_days(_date(start), _date(end))] == [
+        day for day in _span() if start <= day <= end and _is_business_day(day)
+    ]
+
+
+def test_from_file(tmp_path):
+    path = tmp_path / 'holidays.txt'
+    path.write_text('# closing days\n2023-12-25\n\n2024-01-01  # new year\n2024-03-29\n', encoding='utf-8')
+
+    calendar = BusinessCalendar.from_file(str(path), _date(_FIRST), _date(_LAST))
+
+    assert [day for day in _span() if calendar.is_holiday(_date(day))] == _HOLIDAYS
@@ -0,0 +1,49 @@
+import pytest
+import shiboken6
+from PySide6.QtCore import QObject, QTimer
+
+from eui.facade.core.child_index import ChildIndex
+
+
+def _named(name: str, parent: QObject, object_type: type = QObject) -> QObject:
+    child: QObject = object_type(parent)
+    child.setObjectName(name)
+    return child
+
+
+@pytest.mark.parametrize('watch_descendants', [False, True])
+def test_grandchild_added_after_indexing(application, watch_descendants: bool):
+    root = QObject()
+    child = _named('child', root)
+    index = ChildIndex(root, watch_descendants)
+    assert index.find_children('grandchild') == []
+
+    grandchild = _named('grandchild', child)
+    timer = _named('grandchild', child, QTimer)
+    assert set(index.find_children('grandchild')) == {grandchild, timer}
+    assert index.find_children('grandchild', QTimer) == [timer]
+    assert index.find_child('grandchild', QTimer) is timer
+    assert len(index) == 3
+
+
+@pytest.mark.parametrize('watch_descendants', [False, True])
+def test_renamed_moved_and_deleted(application, watch_descendants: bool):
+    root = QObject()
+    child = _named('child', root)
+    grandchild = _named('grandchild', child)
+    index = ChildIndex(root, watch_descendants)
+
+    grandchild.setObjectName('renamed')
+    assert index.find_children('grandchild') == []
+    assert index.find_child('renamed') is grandchild
+
+    grandchild.setParent(None)
+    assert index.find_child('renamed') is None
+    assert index.find_children() == [child]
+
+    grandchild.setParent(child)
+    assert index.find_children('renamed') == [grandchild]
+
+    shiboken6.delete(child)
+    assert index.find_children() == []
+    assert index.find_child('renamed') is None
@@ -0,0 +1,38 @@
+import numpy as np
+import pytest
+
+from eui.facade.models.columnar_table_model import _stable_argsort
+
+
+def _reference_argsort(values: np.ndarray, descending: bool) -> list[int]:
+    # sorted() is stable in both directions
+    return sorted(range(len(values)), key=lambda position: values[position], reverse=descending)
+
+
+@pytest.mark.parametrize('dtype', [np.bool_, np.int8, np.uint8, np.int16, np.uint16, np.int32, np.uint32, np.float16, np.float32])
+@pytest.mark.parametrize('descending', [False, True])
+def test_stable_argsort_of_32_bit_values(dtype, descending):
+    generator = np.random.default_rng(0)
+    values: np.ndarray = generator.integers(-50 if np.dtype(dtype).kind in 'if' else 0, 50, 2000).astype(dtype)
+
+    assert _stable_argsort(values, descending).tolist() == _reference_argsort(values, descending)
+
+
+@pytest.mark.parametrize('dtype', [np.int64, np.float64, 'S4'])
+@pytest.mark.parametrize('descending', [False, True])
+def test_stable_argsort_of_wider_values(dtype, descending):
+    generator = np.random.default_rng(1)
+    values: np.ndarray = generator.integers(-20, 20, 500).astype(dtype)
+
+    assert _stable_argsort(values, descending).tolist() == _reference_argsort(values, descending)
+
+
+def test_stable_argsort_orders_floats_across_signs():
+    values: np.ndarray = np.array([1.5, -2.25, np.inf, -np.inf, 0.0, -1e-30, 1e-30, 3.0e38, -3.0e38], np.float32)
+
+    assert values[_stable_argsort(values, False)].tolist() == sorted(values.tolist())
+    assert values[_stable_argsort(values, True)].tolist() == sorted(values.tolist(), reverse=True)
+
+
+def test_stable_argsort_of_empty_values():
+    assert _stable_argsort(np.array([], np.int32), False).tolist() == []
@@ -0,0 +1,37 @@
+import random
+
+import pytest
+
+from eui.facade.gui.action import Action
+from eui.facade.gui.command_index import CommandIndex, strip_mnemonic
+
+
+@pytest.fixture(scope='module')
+def command_index(application) -> CommandIndex:
+    generator = random.Random(5)
+    verbs: list[str] = ['Open', 'Close', 'Save', 'Export', 'Toggle', 'Show']
+    nouns: list[str] = ['File', 'Folder', 'Window', 'Panel', 'Bookmark', 'Project']
+    index = CommandIndex()
+    for action_index in range(2000):
+        action = Action()
+        # short texts matching only by their tooltip, long ones at a word start: a shortlist of the shortest texts misses the latter
+        padding: str = ' and more' * generator.randrange(4)
+        action.set_text(f'{generator.choice(verbs)}{padding} {generator.choice(nouns)} {action_index}')
+        action.set_tooltip(f'{generator.choice(verbs)} the {generator.choice(nouns).lower()}')
+        index.add(f'command.{action_index}', action)
+    return index
+
+
+@pytest.mark.parametrize('query', ['o', 'open', 'bookmark', 'the panel', 'open file', 'file open', 'opn fiel', 'more panel', 'save 42', 'xyz'])
+@pytest.mark.parametrize('k', [1, 5, 20])
+def test_search_returns_the_k_best_scores(command_index, query, k):
+    # with k as large as the index, no candidate is pruned: every one is scored
+    ranked: list[float] = [match.score for match in command_index.search(query, len(command_index))]
+
+    matches = command_index.search(query, k)
+
+    assert [match.score for match in matches] == ranked[:k]
+
+
+def test_strip_mnemonic():
+    assert strip_mnemonic('&Save && &Quit') == 'Save & Quit'
@@ -0,0 +1,40 @@
+import pytest
+
+from eui.facade.core.date_range import iter_days, iter_months, iter_weeks
+from eui.facade.core.qdate import Date
+from eui.facade.enums.date_enums import QTDayOfWeek, QTMonth
+
+
+def test_iter_days():
+    dates: list[Date] = list(iter_days(Date(2024, 2, 26), Date(2024, 3, 4), 2))
+
+    assert [(int(date.month), date.day) for date in dates] == [(2, 26), (2, 28), (3, 1), (3, 3)]
+    with pytest.raises(ValueError):
+        next(iter_days(Date(2024, 1, 1), Date(2024, 1, 2), 0))
+
+
+def test_iter_weeks():
+    # 2024-01-03 is a Wednesday
+    fridays: list[Date] = list(iter_weeks(Date(2024, 1, 3), Date(2024, 2, 2), QTDayOfWeek.FRIDAY, 2))
+    sundays: list[Date] = list(iter_weeks(Date(2024, 1, 3), Date(2024, 1, 21), QTDayOfWeek.SUNDAY))
+
+    assert [(int(date.month), date.day) for date in fridays] == [(1, 5), (1, 19), (2, 2)]
+    assert [date.day for date in sundays] == [7, 14, 21]
+    assert all(date.day_of_week == QTDayOfWeek.SUNDAY for date in sundays)
+
+
+def test_iter_months_clamps_to_the_last_day():
+    dates: list[Date] = list(iter_months(Date(2024, 1, 31), Date(2024, 5, 30), 31))
+
+    assert [(int(date.month), date.day) for date in dates] == [(1, 31), (2, 29), (3, 31), (4, 30)]
+
+
+def test_iter_months_of_given_months():
+    quarter_ends: tuple[QTMonth, ...] = (QTMonth.MARCH, QTMonth.JUNE, QTMonth.SEPTEMBER, QTMonth.DECEMBER)
+    dates: list[Date] = list(iter_months(Date(2023, 11, 15), Date(2024, 12, 30), 31, quarter_ends))
+
+    assert [(date.year, int(date.month), date.day) for date in dates] == [
+        (2023, 12, 31), (2024, 3, 31), (2024, 6, 30), (2024, 9, 30)
+    ]
+    with pytest.raises(ValueError):
+        next(iter_months(Date(2024, 1, 1), Date(2024, 2, 1), 32))
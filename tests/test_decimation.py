@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from eui.facade.graphics.decimation import DecimationPyramid, decimate_min_max
+
+
+def _series_with_nan(point_count: int) -> tuple[np.ndarray, np.ndarray]:
+    generator = np.random.default_rng(3)
+    x: np.ndarray = np.arange(point_count, dtype=np.float64)
+    y: np.ndarray = np.cumsum(generator.standard_normal(point_count))
+    y[generator.random(point_count) < 0.05] = np.nan
+    y[5000:6000] = np.nan
+    return x, y
+
+
+@pytest.mark.parametrize('decimate', [decimate_min_max, lambda x, y, *args: DecimationPyramid(x, y).decimate(*args)])
+@pytest.mark.parametrize('x_range', [(0, 20_000), (1234, 17_000)])
+def test_nan_are_ignored(decimate, x_range):
+    x, y = _series_with_nan(20_000)
+    x_start, x_end = x_range
+
+    decimated_x, decimated_y = decimate(x, y, x_start, x_end, 100)
+
+    visible: np.ndarray = y[max(x_start - 1, 0):x_end + 1]
+    assert np.nanmin(decimated_y) == np.nanmin(visible)
+    assert np.nanmax(decimated_y) == np.nanmax(visible)
+    assert np.all(np.diff(decimated_x) >= 0)
+    # only the columns within the all-NaN stretch keep NaN, as both their extrema
+    assert 0 < np.isnan(decimated_y).sum() <= 2 * 6
+
+
+def test_all_nan_series():
+    x: np.ndarray = np.arange(1000, dtype=np.float64)
+    y: np.ndarray = np.full(1000, np.nan)
+
+    decimated_x, decimated_y = decimate_min_max(x, y, 0, 1000, 10)
+
+    assert len(decimated_x) == 20
+    assert np.isnan(decimated_y).all()
@@ -0,0 +1,104 @@
+import os
+
+import pytest
+from PySide6.QtCore import QEventLoop, QPersistentModelIndex, Qt, QTimer
+
+from eui.facade.widgets.file_dialog import DirectoryCache, FileColumns, FileEntry, FileListModel
+
+
+def _loaded_model(directory: str, cache: DirectoryCache = None) -> FileListModel:
+    model = FileListModel(cache=cache)
+    _wait_loaded(model, lambda: model.set_directory(directory))
+    return model
+
+
+def _wait_loaded(model: FileListModel, load):
+    loop = QEventLoop()
+    model.directory_loaded.connect(loop.quit)
+    QTimer.singleShot(5000, loop.quit)
+    load()
+    loop.exec()
+    assert not model.loading
+
+
+@pytest.fixture
+def directory(tmp_path) -> str:
+    for file_index in range(40):
+        (tmp_path / f'file_{file_index * 17 % 40:02}.txt').write_bytes(b'x' * (file_index * 31 % 40))
+    (tmp_path / 'folder').mkdir()
+    return str(tmp_path)
+
+
+def _names(model: FileListModel) -> list[str]:
+    return [model.entry(row).name for row in range(model.rowCount())]
+
+
+def test_directories_first_then_sorted_names(application, directory):
+    model = _loaded_model(directory)
+
+    assert _names(model) == ['folder'] + sorted(name for name in os.listdir(directory) if name != 'folder')
+
+
+@pytest.mark.parametrize('column', list(FileColumns))
+@pytest.mark.parametrize('order', [Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder])
+def test_sort_keeps_persistent_indexes_on_their_entries(application, directory, column, order):
+    model = _loaded_model(directory)
+    persistent: dict[str, QPersistentModelIndex] = {
+        model.entry(row).name: QPersistentModelIndex(model.index(row, FileColumns.SIZE)) for row in range(0, model.rowCount(), 3)
+    }
+
+    model.sort(column, order)
+
+    for name, index in persistent.items():
+        assert index.isValid()
+        assert index.column() == FileColumns.SIZE
+        assert model.entry(index.row()).name == name
+
+
+@pytest.mark.parametrize('order', [Qt.SortOrder.AscendingOrder, Qt.SortOrder.DescendingOrder])
+def test_merged_batches_keep_persistent_indexes_on_their_entries(application, directory, order):
+    model = _loaded_model(directory)
+    model.sort(FileColumns.NAME, order)
+    persistent: dict[str, QPersistentModelIndex] = {
+        model.entry(row).name: QPersistentModelIndex(model.index(row, FileColumns.NAME)) for row in range(model.rowCount())
+    }
+
+    model._add_entries([FileEntry(f'file_{file_index:02}b.txt', False, 1, 0.0, False) for file_index in range(0, 40, 4)])
+
+    assert model.rowCount() == 51
+    names: list[str] = _names(model)
+    # directories first in both orders
+    assert names == ['folder'] + sorted(names[1:], reverse=order == Qt.SortOrder.DescendingOrder)
+    for name, index in persistent.items():
+        assert model.entry(index.row()).name == name
+
+
+def test_models_share_the_default_cache(application, directory):
+    _loaded_model(directory)
+    model = FileListModel()
+
+    # the first batch of a cached listing is added right away
+    model.set_directory(directory)
+    assert model.rowCount() == 41
+
+
+def test_directory_watched_from_the_scan_start(application, directory):
+    cache = DirectoryCache()
+    model = FileListModel(cache=cache)
+
+    model.set_directory(directory)
+    assert model.loading
+    assert cache._watcher.directories() == [directory]
+
+
+def test_refresh_lists_the_directory_once(application, directory):
+    cache = DirectoryCache()
+    model = _loaded_model(directory, cache)
+    resets: list[None] = []
+    model.modelReset.connect(lambda: resets.append(None))
+
+    # no change on disk, which the watcher would report and list again too
+    _wait_loaded(model, model.refresh)
+
+    assert len(resets) == 1
+    assert model.rowCount() == 41
@@ -0,0 +1,80 @@
+import mmap
+import threading
+
+import pytest
+
+from eui.facade.widgets.file_preview import LineIndex
+
+
+def _built_index(path, content: bytes, stride: int, chunk_size: int) -> tuple[LineIndex, mmap.mmap]:
+    path.write_bytes(content)
+    with open(path, 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    index = LineIndex(buffer, stride)
+    assert index.build(threading.Event(), chunk_size=chunk_size)
+    return index, buffer
+
+
+@pytest.mark.parametrize('stride', [1, 3, 64])
+@pytest.mark.parametrize('chunk_size', [1, 7, 4096])
+@pytest.mark.parametrize('terminated', [False, True])
+def test_line_offsets_match_the_line_starts(tmp_path, stride, chunk_size, terminated):
+    lines: list[bytes] = [b'x' * (line * 7 % 13) for line in range(200)]
+    content: bytes = b'\n'.join(lines) + (b'\n' if terminated else b'')
+    index, buffer = _built_index(tmp_path / 'lines.txt', content, stride, chunk_size)
+
+    starts: list[int] = [0]
+    for line in lines[:-1]:
+        starts.append(starts[-1] + len(line) + 1)
+    assert index.complete
+    assert index.line_count == len(lines)
+    assert [index.line_offset(line) for line in range(len(lines))] == starts
+    assert index.read_lines(0, len(lines)) == lines
+    assert index.read_lines(150, 100) == lines[150:]
+    buffer.close()
+
+
+@pytest.mark.parametrize('stride', [1, 3, 64])
+@pytest.mark.parametrize('chunk_size', [1000, 1 << 20])
+def test_long_lines_are_followed_by_checkpoints(tmp_path, stride, chunk_size):
+    lines: list[bytes] = [(b'y' * 20_000 if line % 10 == 4 else b'x' * (line % 50)) for line in range(100)]
+    lines[-1] = b'z' * 9000
+    index, buffer = _built_index(tmp_path / 'long_lines.txt', b'\n'.join(lines), stride, chunk_size)
+
+    assert index.line_count == len(lines)
+    assert index.read_lines(0, len(lines), max_bytes=10) == [line[:10] for line in lines]
+    assert index.read_lines(3, 3, max_bytes=30_000) == lines[3:6]
+    assert index.read_lines(99, 1, max_bytes=10_000) == lines[99:]
+    # the line after each long line is stored: the lines between two checkpoints are short
+    checkpoint_lines: list[int] = index._checkpoint_lines[:index._checkpoint_count].tolist()
+    assert set(range(5, 100, 10)) <= set(checkpoint_lines)
+    buffer.close()
+
+
+def test_empty_lines_and_cut_lines(tmp_path):
+    index, buffer = _built_index(tmp_path / 'empty_lines.txt', b'\n\nabcdef\n\n', 2, 3)
+
+    assert index.line_count == 4
+    assert index.read_lines(0, 10, max_bytes=3) == [b'', b'', b'abc', b'']
+    buffer.close()
+
+
+def test_empty_file():
+    index = LineIndex(None)
+
+    assert index.complete
+    assert index.line_count == 0
+    assert index.read_lines(0, 10) == []
+
+
+def test_cancelled_build(tmp_path):
+    (tmp_path / 'cancelled.txt').write_bytes(b'line\n' * 100)
+    with open(tmp_path / 'cancelled.txt', 'rb') as file:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    index = LineIndex(buffer)
+    cancel = threading.Event()
+    cancel.set()
+
+    assert not index.build(cancel)
+    assert not index.complete
+    buffer.close()
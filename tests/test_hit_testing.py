@@ -0,0 +1,68 @@
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QMouseEvent, QTransform
+
+from eui.facade.graphics.spatial_index import QuadTree
+from eui.facade.widgets.hit_testing import HitTester
+from eui.facade.widgets.widget import Widget
+
+
+def _mouse_event(event_type: QEvent.Type, x: float, y: float) -> QMouseEvent:
+    button: Qt.MouseButton = Qt.MouseButton.NoButton if event_type == QEvent.Type.MouseMove else Qt.MouseButton.LeftButton
+    return QMouseEvent(event_type, QPointF(x, y), QPointF(x, y), button, button, Qt.KeyboardModifier.NoModifier)
+
+
+def _hit_tester(events: list[tuple[str, str]]) -> tuple[Widget, HitTester[str]]:
+    widget = Widget()
+    index: QuadTree[str] = QuadTree((0.0, 0.0, 100.0, 100.0))
+    index.insert('back', (0.0, 0.0, 60.0, 60.0))
+    index.insert('front', (40.0, 40.0, 80.0, 80.0))
+    hit_tester: HitTester[str] = HitTester(widget, index)
+    for kind in ('enter', 'leave', 'hover', 'press', 'release'):
+        getattr(hit_tester, f'on_item_{kind}')(lambda item, event, kind=kind: events.append((kind, item)))
+    return widget, hit_tester
+
+
+def test_top_most_item_is_hit(application):
+    _, hit_tester = _hit_tester([])
+
+    assert hit_tester.item_at(QPointF(10.0, 10.0)) == 'back'
+    assert hit_tester.item_at(QPointF(50.0, 50.0)) == 'front'
+    assert hit_tester.item_at(QPointF(90.0, 90.0)) is None
+
+    # inserted again, the back item comes on top
+    hit_tester.index.insert('back', (0.0, 0.0, 60.0, 60.0))
+    assert hit_tester.item_at(QPointF(50.0, 50.0)) == 'back'
+
+
+def test_transform(application):
+    _, hit_tester = _hit_tester([])
+    hit_tester.set_transform(QTransform.fromScale(0.5, 0.5))
+
+    assert hit_tester.item_at(QPointF(20.0, 20.0)) == 'back'
+    assert hit_tester.item_at(QPointF(100.0, 100.0)) == 'front'
+    assert hit_tester.item_at(QPointF(170.0, 170.0)) is None
+
+
+def test_event_order(application):
+    events: list[tuple[str, str]] = []
+    widget, hit_tester = _hit_tester(events)
+
+    assert widget.get.hasMouseTracking()
+    for x, y in [(90.0, 90.0), (10.0, 10.0), (20.0, 20.0), (50.0, 50.0)]:
+        widget.get.mouseMoveEvent(_mouse_event(QEvent.Type.MouseMove, x, y))
+    widget.get.mousePressEvent(_mouse_event(QEvent.Type.MouseButtonPress, 50.0, 50.0))
+    widget.get.mouseReleaseEvent(_mouse_event(QEvent.Type.MouseButtonRelease, 90.0, 90.0))
+    widget.get.mouseMoveEvent(_mouse_event(QEvent.Type.MouseMove, 90.0, 90.0))
+    widget.get.mouseMoveEvent(_mouse_event(QEvent.Type.MouseMove, 10.0, 10.0))
+    widget.get.leaveEvent(QEvent(QEvent.Type.Leave))
+
+    assert events == [
+        ('enter', 'back'), ('hover', 'back'),
+        ('hover', 'back'),
+        ('leave', 'back'), ('enter', 'front'), ('hover', 'front'),
+        ('press', 'front'),
+        ('leave', 'front'),
+        ('enter', 'back'), ('hover', 'back'),
+        ('leave', 'back')
+    ]
+    assert hit_tester.hovered_item is None
@@ -0,0 +1,86 @@
+import random
+
+import pytest
+from PySide6.QtCore import QRectF
+
+from eui.facade.graphics.spatial_index import QuadTree, Rect
+
+_BOUNDS: Rect = (0.0, 0.0, 1000.0, 1000.0)
+
+
+def _random_rect(generator: random.Random) -> Rect:
+    # mostly small items, some large ones crossing the split lines, some partly outside of the bounds
+    size: float = generator.choice([5.0, 20.0, 300.0])
+    left: float = generator.uniform(-50.0, 1000.0)
+    top: float = generator.uniform(-50.0, 1000.0)
+    return left, top, left + generator.uniform(0.0, size), top + generator.uniform(0.0, size)
+
+
+def _contains(rect: Rect, x: float, y: float) -> bool:
+    return rect[0] <= x <= rect[2] and rect[1] <= y <= rect[3]
+
+
+def _intersects(rect: Rect, other: Rect) -> bool:
+    return rect[0] <= other[2] and other[0] <= rect[2] and rect[1] <= other[3] and other[1] <= rect[3]
+
+
+def _check(tree: QuadTree[int], rects: dict[int, Rect], generator: random.Random):
+    """
+    Compares the queries of *tree* with a scan of *rects*, kept bottom-most first.
+    """
+    assert len(tree) == len(rects)
+    for _ in range(200):
+        x, y = generator.uniform(-60.0, 1060.0), generator.uniform(-60.0, 1060.0)
+        expected: list[int] = [item for item, rect in rects.items() if _contains(rect, x, y)]
+        assert tree.query_point(x, y) == expected
+        assert tree.item_at(x, y) == (expected[-1] if expected else None)
+
+        area: Rect = _random_rect(generator)
+        assert tree.query_rect(area) == [item for item, rect in rects.items() if _intersects(rect, area)]
+
+
+@pytest.mark.parametrize('bulk', [False, True])
+def test_insert_move_remove(bulk: bool):
+    generator = random.Random(7)
+    tree: QuadTree[int] = QuadTree(_BOUNDS, max_items=4)
+    rects: dict[int, Rect] = {item: _random_rect(generator) for item in range(500)}
+    if bulk:
+        tree.bulk_load(rects.items())
+    else:
+        for item, rect in rects.items():
+            tree.insert(item, rect)
+    _check(tree, rects, generator)
+
+    # a moved item is considered inserted last, so on top of the others
+    for item in generator.sample(sorted(rects), 100):
+        del rects[item]
+        rects[item] = _random_rect(generator)
+        tree.insert(item, rects[item])
+        assert tree.rect_of(item) == rects[item]
+    _check(tree, rects, generator)
+
+    for item in generator.sample(sorted(rects), 250):
+        del rects[item]
+        tree.remove(item)
+        assert item not in tree
+    _check(tree, rects, generator)
+
+
+def test_max_depth_bounds_the_splits():
+    tree: QuadTree[int] = QuadTree(QRectF(0.0, 0.0, 100.0, 100.0), max_items=2, max_depth=3)
+    for item in range(50):
+        tree.insert(item, QRectF(10.0, 10.0, 1.0, 1.0))
+
+    assert tree.query_point(10.5, 10.5) == list(range(50))
+    assert tree.item_at(50.0, 50.0) is None
+
+
+def test_clear():
+    tree: QuadTree[str] = QuadTree(_BOUNDS)
+    tree.insert('item', (1.0, 1.0, 2.0, 2.0))
+    tree.clear()
+
+    assert len(tree) == 0
+    assert tree.query_point(1.5, 1.5) == []
+    tree.insert('item', (1.0, 1.0, 2.0, 2.0))
+    assert tree.query_point(1.5, 1.5) == ['item']
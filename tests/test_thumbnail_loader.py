@@ -0,0 +1,128 @@
+import time
+
+from PySide6.QtGui import QImage
+
+from eui.facade.gui.thumbnail_loader import PREFETCH_PRIORITY, VISIBLE_PRIORITY, ThumbnailKey, ThumbnailLoader
+
+
+class _RecordingLoader(ThumbnailLoader):
+    """
+    Loader with a single worker recording the order in which thumbnails are generated, without reading any file.
+    """
+    __slots__ = ('loaded',)
+
+    def __init__(self, cache_directory: str):
+        self.loaded: list[str] = []
+        super().__init__(workers=1, cache_directory=cache_directory)
+
+    def _load(self, key: ThumbnailKey) -> QImage:
+        self.loaded.append(key.path)
+        if key.path.startswith('broken'):
+            raise OSError(f'cannot read {key.path}')
+        return QImage()
+
+
+def _keys(loader: ThumbnailLoader, *names: str) -> list[ThumbnailKey]:
+    return [loader.key(name, 0.0, 0) for name in names]
+
+
+def _loaded(loader: _RecordingLoader, count: int) -> list[str]:
+    deadline: float = time.monotonic() + 5
+    while len(loader.loaded) < count and time.monotonic() < deadline:
+        time.sleep(0.001)
+    # nothing else is generated
+    time.sleep(0.05)
+    return loader.loaded
+
+
+def test_visible_first_then_oldest_first(application, tmp_path):
+    loader = _RecordingLoader(str(tmp_path))
+    # holding the lock keeps the worker waiting until every request is queued
+    with loader._condition:
+        for key in _keys(loader, 'prefetch_1', 'prefetch_2'):
+            loader.request(key, PREFETCH_PRIORITY)
+        for key in _keys(loader, 'visible_1', 'visible_2'):
+            loader.request(key, VISIBLE_PRIORITY)
+
+    assert _loaded(loader, 4) == ['visible_1', 'visible_2', 'prefetch_1', 'prefetch_2']
+    loader.shutdown()
+
+
+def test_promoted_request_is_generated_once(application, tmp_path):
+    loader = _RecordingLoader(str(tmp_path))
+    first, promoted, last = _keys(loader, 'first', 'promoted', 'last')
+    with loader._condition:
+        loader.request(first, PREFETCH_PRIORITY)
+        loader.request(promoted, PREFETCH_PRIORITY)
+        loader.request(last, PREFETCH_PRIORITY)
+        loader.request(promoted, VISIBLE_PRIORITY)
+        # a request of lower priority does not demote it
+        loader.request(promoted, PREFETCH_PRIORITY)
+
+    assert _loaded(loader, 3) == ['promoted', 'first', 'last']
+    loader.shutdown()
+
+
+def test_set_visible_cancels_the_other_requests(application, tmp_path):
+    loader = _RecordingLoader(str(tmp_path))
+    with loader._condition:
+        for key in _keys(loader, 'scrolled_out_1', 'kept', 'scrolled_out_2'):
+            loader.request(key)
+        loader.set_visible(_keys(loader, 'new_visible', 'kept'), _keys(loader, 'new_prefetch'))
+
+        assert loader.pending_count == 3
+        assert loader.cancelled_count == 2
+
+    assert _loaded(loader, 3) == ['new_visible', 'kept', 'new_prefetch']
+    loader.shutdown()
+
+
+def test_generated_thumbnails_are_not_requested_again(application, tmp_path):
+    loader = _RecordingLoader(str(tmp_path))
+    key: ThumbnailKey = _keys(loader, 'image')[0]
+    loader.request(key)
+    _loaded(loader, 1)
+    application.processEvents()
+
+    assert loader.thumbnail(key) is not None
+    loader.request(key)
+    loader.set_visible([key])
+    time.sleep(0.05)
+    assert loader.loaded == ['image']
+    loader.shutdown()
+
+
+def test_failed_load_gives_a_null_thumbnail(application, tmp_path):
+    loader = _RecordingLoader(str(tmp_path))
+    ready: list[tuple[str, bool]] = []
+    loader.on_ready(lambda key, image: ready.append((key.path, image.isNull())))
+    with loader._condition:
+        for key in _keys(loader, 'broken', 'image'):
+            loader.request(key)
+
+    assert _loaded(loader, 2) == ['broken', 'image']
+    application.processEvents()
+    assert ready == [('broken', True), ('image', True)]
+    assert not loader._in_progress
+    loader.shutdown()
+
+
+def test_memory_limit_counts_bytes(application, tmp_path):
+    loader = ThumbnailLoader(workers=1, cache_directory=str(tmp_path), memory_limit=10_000)
+    keys: list[ThumbnailKey] = _keys(loader, 'first', 'second', 'third', 'huge')
+    image = QImage(40, 20, QImage.Format.Format_ARGB32)  # 3200 bytes
+
+    for key in keys[:3]:
+        loader._on_ready(key, image)
+    assert loader.memory_bytes == 9600
+    loader.thumbnail(keys[0])
+    loader._on_ready(keys[1], image)
+    assert loader.memory_bytes == 9600
+
+    loader._on_ready(keys[2], QImage(40, 40, QImage.Format.Format_ARGB32))
+    # least recently used first
+    assert [loader.thumbnail(key) is not None for key in keys[:3]] == [False, True, True]
+    loader._on_ready(keys[3], QImage(100, 100, QImage.Format.Format_ARGB32))
+    assert [loader.thumbnail(key) is not None for key in keys] == [False, False, False, True]
+    assert loader.memory_bytes == 40_000
+    loader.shutdown()
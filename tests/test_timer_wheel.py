@@ -0,0 +1,119 @@
+import pytest
+
+from eui.facade.core import timer_wheel as timer_wheel_module
+from eui.facade.core.timer_wheel import TimerWheel
+
+
+class _Clock:
+    def __init__(self):
+        self.now: float = 0.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    clock = _Clock()
+    monkeypatch.setattr(timer_wheel_module, 'time', clock)
+    return clock
+
+
+@pytest.fixture
+def wheel(application, clock) -> TimerWheel:
+    # one second ticks, so the fake clock counts ticks exactly
+    wheel = TimerWheel(tick_ms=1000.0)
+    yield wheel
+    wheel._timer.stop()
+
+
+def _run(wheel: TimerWheel, clock: _Clock, until: int) -> int:
+    """
+    Wakes the wheel up when its QTimer would until tick *until*, returning the number of wakeups.
+    """
+    wakeups: int = 0
+    while True:
+        next_tick: int | None = wheel._next_event_tick()
+        if next_tick is None or next_tick > until:
+            return wakeups
+        clock.now = float(next_tick)
+        wheel._on_timeout()
+        wakeups += 1
+
+
+def test_delays_are_rounded_up_to_the_next_tick(wheel, clock):
+    fired: list[int] = []
+    wheel.schedule(7000.0, lambda: fired.append(wheel._now()))
+    wheel.schedule(6500.0, lambda: fired.append(wheel._now()))
+
+    _run(wheel, clock, 6)
+    assert fired == []
+    _run(wheel, clock, 7)
+    assert fired == [7, 7]
+    assert len(wheel) == 0
+
+
+def test_timers_cascade_down_to_their_deadline(wheel, clock):
+    # one timer per level, plus one beyond the span of the wheel
+    delays: list[int] = [5, 63, 64, 100, 4095, 4096, 5000, 300_000, (1 << 24) - 1, (1 << 24) + 70]
+    fired: dict[int, int] = {}
+    for delay in delays:
+        wheel.schedule(delay * 1000.0, lambda delay=delay: fired.setdefault(delay, wheel._now()))
+
+    wakeups: int = _run(wheel, clock, (1 << 25))
+
+    assert fired == {delay: delay for delay in delays}
+    assert len(wheel) == 0
+    # the upper levels are only visited on their boundaries, never once per tick
+    assert wakeups < (1 << 25) >> 10
+
+
+def test_cancel(wheel, clock):
+    fired: list[str] = []
+    cancelled = wheel.schedule(10_000.0, lambda: fired.append('cancelled'))
+    wheel.schedule(10_000.0, lambda: fired.append('kept'))
+    cancelled.cancel()
+    cancelled.cancel()
+
+    assert not cancelled.active
+    assert len(wheel) == 1
+    _run(wheel, clock, 20)
+    assert fired == ['kept']
+
+
+def test_repeating_timer_cancelled_from_its_callback(wheel, clock):
+    fired: list[int] = []
+
+    def callback():
+        fired.append(wheel._now())
+        if len(fired) == 3:
+            handle.cancel()
+
+    handle = wheel.schedule(5000.0, callback, repeat=True)
+
+    _run(wheel, clock, 100)
+    assert fired == [5, 10, 15]
+    assert not handle.active
+    assert len(wheel) == 0
+
+
+def test_repeats_follow_the_nominal_period_despite_the_slack(wheel, clock):
+    fired: list[int] = []
+    # 4 ticks of slack align the deadlines on multiples of 4: 7, 14, 21, 28... fire at 8, 16, 24, 28...
+    wheel.schedule(7000.0, lambda: fired.append(wheel._now()), repeat=True, slack_ms=4000.0)
+
+    _run(wheel, clock, 60)
+    assert fired == [8, 16, 24, 28, 36, 44, 52, 56]
+
+
+def test_late_repeats_skip_the_missed_intervals(wheel, clock):
+    fired: list[int] = []
+    wheel.schedule(10_000.0, lambda: fired.append(wheel._now()), repeat=True)
+
+    _run(wheel, clock, 10)
+    # the event loop was blocked for more than three intervals
+    clock.now = 45.0
+    wheel._on_timeout()
+    _run(wheel, clock, 70)
+
+    assert fired == [10, 45, 50, 60, 70]
@@ -0,0 +1,26 @@
+import pytest
+from PySide6.QtCore import QObject
+
+from eui.facade.gui.trigger_coalescer import TriggerCoalescer
+
+
+def test_latest_wins_requires_a_reason_to_skip(application):
+    owner = QObject()
+
+    with pytest.raises(ValueError):
+        TriggerCoalescer(owner, lambda: None, latest_wins=True)
+    TriggerCoalescer(owner, lambda: None, max_rate=10.0, latest_wins=True)
+    TriggerCoalescer(owner, lambda: None, latest_wins=True, skip_while_running=True)
+
+
+def test_rate_limited_triggers_run_once_deferred(application):
+    owner = QObject()
+    runs: list[None] = []
+    coalescer = TriggerCoalescer(owner, lambda: runs.append(None), max_rate=1.0, latest_wins=True)
+
+    for _ in range(5):
+        coalescer.trigger()
+
+    assert len(runs) == 1
+    assert coalescer.coalesced_count == 4
+    assert coalescer.pending